@@ -1,7 +1,9 @@
 import time
 import base64
 import requests
-from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from io import BytesIO, StringIO
 from PIL import ImageGrab  # For screenshots (part of Pillow)
 import schedule  # For scheduling
 import win32gui  # For finding window rectangles
@@ -9,6 +11,9 @@ import configparser
 import datetime
 import os
 import threading
+import queue
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import pystray
 from pystray import MenuItem as item
 from PIL import Image
@@ -21,10 +26,14 @@ import win32process
 from ctypes import windll, wintypes
 import tkinter as tk
 from tkinter import messagebox, ttk
+import tkinter.font as tkfont
 import sys
 import ctypes
 import urllib.parse  # For Telegram URL encoding
 import csv
+import re
+import atexit
+import hashlib
 from market_data import MarketDataAnalyzer
 import economic_calendar
 import market_holidays
@@ -44,6 +53,131 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# orjson for faster LLM and broker response parsing (falls back to the stdlib json module).
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+    
+    def _json_dumps(obj):
+        """Serialize obj to compact JSON bytes (same output shape as orjson.dumps)."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# httpx with h2 for HTTP/2 broker requests (falls back to a pooled requests.Session)
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+class _LazyJson:
+    """Defer json.dumps(obj, indent=2) until a log record is actually emitted.
+    
+    Pass as a %s argument to logging so the serialization is skipped entirely
+    when the record is filtered out by the logger's effective level.
+    """
+    __slots__ = ('obj',)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self):
+        return json.dumps(self.obj, indent=2)
+
+
+class _Http2Session:
+    """requests-compatible post() over an HTTP/2 httpx.Client.
+    
+    All broker requests (positions, working orders, SL/TP modifies) are multiplexed
+    over one TLS connection. Responses are converted to requests.Response and
+    transport errors to requests exceptions, so callers keep their existing
+    raise_for_status() / except requests.exceptions.* handling.
+    """
+    
+    def __init__(self):
+        transport = httpx.HTTPTransport(
+            http2=True,
+            retries=2,
+            limits=httpx.Limits(max_connections=40, max_keepalive_connections=20, keepalive_expiry=30.0)
+        )
+        self._client = httpx.Client(transport=transport, timeout=10.0)
+    
+    def post(self, url, headers=None, json=None, data=None, timeout=10):
+        try:
+            response = self._client.post(url, headers=headers, json=json, content=data, timeout=timeout)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.headers = requests.structures.CaseInsensitiveDict(response.headers)
+        converted.url = str(response.url)
+        converted.reason = response.reason_phrase
+        converted.encoding = response.encoding
+        converted._content = response.content
+        return converted
+
+def _create_http_session():
+    """Create a pooled session so broker calls reuse keep-alive TLS connections (HTTP/2 when httpx is installed)."""
+    if HTTPX_AVAILABLE:
+        return _Http2Session()
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Shared HTTP session for broker (TopstepX) requests
+_HTTP_SESSION = _create_http_session()
+
+# Worker pool for firing independent broker requests (e.g. SL and TP modifies) concurrently
+_MODIFY_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Workers for network fetches that overlap with other work (bar data during screenshot
+# capture, working orders alongside the positions query, post-close balance)
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Separator line for log banners
+_RULE80 = "=" * 80
+
+# Local time format for notification timestamps (time.strftime, no datetime object needed)
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def format_api_timestamp(dt):
+    """Format a naive datetime as the API's "YYYY-MM-DDTHH:MM:SSZ" timestamp.
+    
+    Same output as dt.strftime("%Y-%m-%dT%H:%M:%SZ"), via the cheaper isoformat().
+    """
+    return dt.replace(microsecond=0).isoformat() + "Z"
+
+# Today's date and its midnight API timestamp (see today_midnight_timestamp)
+_MIDNIGHT_CACHE = {'entry': (None, None)}
+
+def today_midnight_timestamp(now=None):
+    """API timestamp for 00:00 of now's date (default: today), cached until the date changes."""
+    if now is None:
+        now = datetime.datetime.now()
+    today = now.date()
+    cached_date, cached_timestamp = _MIDNIGHT_CACHE['entry']
+    if cached_date != today:
+        cached_timestamp = format_api_timestamp(datetime.datetime.combine(today, datetime.time()))
+        _MIDNIGHT_CACHE['entry'] = (today, cached_timestamp)
+    return cached_timestamp
+
 
 def check_session_state():
     """Check if the current session may have screenshot capture issues.
@@ -221,8 +355,8 @@ def is_market_closed_weekly(market_closed_config):
                 end_time_str = time_parts[1].strip()
                 
                 # Parse times
-                start_time = datetime.datetime.strptime(start_time_str, '%H:%M').time()
-                end_time = datetime.datetime.strptime(end_time_str, '%H:%M').time()
+                start_time = _parse_hhmm(start_time_str)
+                end_time = _parse_hhmm(end_time_str)
                 
                 # Check if current time is within closed period
                 if start_time <= current_time <= end_time:
@@ -236,9 +370,16 @@ def is_market_closed_weekly(market_closed_config):
         logging.error(f"Error checking weekly market closed periods: {e}")
         return False, None
 
+# Last (key_levels object, formatted text) pair; LAST_KEY_LEVELS is replaced wholesale after
+# each LLM response, so an identity match means the formatted text is still current
+_KEY_LEVELS_PROMPT_CACHE = {'entry': (None, None)}
+
 def format_key_levels_for_prompt(key_levels):
     """Format key levels list into readable text for LLM prompt.
     
+    The result for the most recent key_levels object is reused while the same object
+    is passed again (e.g. the LLM keeps returning 'hold' without new levels).
+    
     Args:
         key_levels: List of dicts with keys 'price', 'type', 'reason', or JSON string
     
@@ -248,6 +389,16 @@ def format_key_levels_for_prompt(key_levels):
     if not key_levels:
         return "No key levels currently tracked"
     
+    cached_source, cached_text = _KEY_LEVELS_PROMPT_CACHE['entry']
+    if cached_source is key_levels:
+        return cached_text
+    
+    text = _format_key_levels_for_prompt(key_levels)
+    _KEY_LEVELS_PROMPT_CACHE['entry'] = (key_levels, text)
+    return text
+
+def _format_key_levels_for_prompt(key_levels):
+    """Uncached implementation of format_key_levels_for_prompt()."""
     try:
         # Parse if string
         if isinstance(key_levels, str):
@@ -377,18 +528,33 @@ def calculate_session_rpl(current_balance, session_start_balance):
     
     return float(current_balance) - float(session_start_balance)
 
+# Parsed active_trade.json keyed by file mtime/size (see get_active_trade_info)
+_TRADE_INFO_CACHE = {'mtime': None, 'size': None, 'data': None}
+
 def get_active_trade_info():
     """Get the current active trade info from file.
     
+    The parsed file is cached and only re-read when its mtime or size changes,
+    since the dashboard and trade monitor poll this far more often than it is written.
+    
     Returns:
         dict: {'order_id': int, 'entry_price': float, 'position_type': str, 'entry_timestamp': str} or None
     """
     try:
         trade_info_file = os.path.join('trades', 'active_trade.json')
-        if os.path.exists(trade_info_file):
-            with open(trade_info_file, 'r') as f:
-                return json.load(f)
-        return None
+        try:
+            stat = os.stat(trade_info_file)
+        except FileNotFoundError:
+            _TRADE_INFO_CACHE.update({'mtime': None, 'size': None, 'data': None})
+            return None
+        
+        if _TRADE_INFO_CACHE['mtime'] == stat.st_mtime_ns and _TRADE_INFO_CACHE['size'] == stat.st_size:
+            return _TRADE_INFO_CACHE['data']
+        
+        with open(trade_info_file, 'r') as f:
+            data = json.load(f)
+        _TRADE_INFO_CACHE.update({'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'data': data})
+        return data
     except Exception as e:
         logging.error(f"Error reading active trade info: {e}")
         return None
@@ -440,6 +606,7 @@ def save_active_trade_info(order_id, entry_price, position_type, entry_timestamp
         
         with open(trade_info_file, 'w') as f:
             json.dump(trade_info, f, indent=2)
+        _TRADE_INFO_CACHE['mtime'] = None  # Force re-read on next get_active_trade_info()
         logging.info(f"Saved active trade info: {trade_info}")
     except Exception as e:
         logging.error(f"Error saving active trade info: {e}")
@@ -450,6 +617,7 @@ def clear_active_trade_info():
         trade_info_file = os.path.join('trades', 'active_trade.json')
         if os.path.exists(trade_info_file):
             os.remove(trade_info_file)
+            _TRADE_INFO_CACHE.update({'mtime': None, 'size': None, 'data': None})
             logging.info("Cleared active trade info")
     except Exception as e:
         logging.error(f"Error clearing active trade info: {e}")
@@ -494,6 +662,68 @@ def determine_exit_type(exit_trade_order_id, stop_loss_order_id, take_profit_ord
     
     return "CLOSED"
 
+# LLM CSV rows are appended by a background writer in small batches so the
+# trading loop never waits on disk I/O; pending rows are flushed at exit
+LLM_CSV_QUEUE = queue.Queue()
+_LLM_CSV_BATCH_SIZE = 20
+_LLM_CSV_FLUSH_SECONDS = 1.0
+_LLM_CSV_HEADER = [
+    'date_time', 'request', 'response', 'action', 'entry_price',
+    'price_target', 'stop_loss', 'confidence', 'reasoning', 'context', 'waiting_for', 'key_levels'
+]
+
+def _write_llm_csv_rows(batch):
+    """Append a batch of (csv_file, row) pairs, opening each file once."""
+    rows_by_file = {}
+    for csv_file, row in batch:
+        rows_by_file.setdefault(csv_file, []).append(row)
+    
+    for csv_file, rows in rows_by_file.items():
+        try:
+            # Check if file exists to determine if we need to write header
+            file_exists = os.path.exists(csv_file)
+            with open(csv_file, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if not file_exists:
+                    writer.writerow(_LLM_CSV_HEADER)
+                writer.writerows(rows)
+        except Exception as e:
+            logging.error(f"Error writing LLM log {csv_file}: {e}")
+
+def _llm_csv_writer():
+    """Write queued LLM CSV rows every 20 rows or 1s (runs in a daemon thread; None stops it)."""
+    while True:
+        item = LLM_CSV_QUEUE.get()
+        stop = item is None
+        batch = [] if stop else [item]
+        deadline = time.monotonic() + _LLM_CSV_FLUSH_SECONDS
+        while not stop and len(batch) < _LLM_CSV_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = LLM_CSV_QUEUE.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                stop = True
+            else:
+                batch.append(item)
+        if batch:
+            _write_llm_csv_rows(batch)
+        if stop:
+            return
+
+_LLM_CSV_THREAD = threading.Thread(target=_llm_csv_writer, name="LLMCsvWriter", daemon=True)
+_LLM_CSV_THREAD.start()
+
+def _flush_llm_csv_log():
+    """Stop the LLM CSV writer after it has written any pending rows."""
+    LLM_CSV_QUEUE.put(None)
+    _LLM_CSV_THREAD.join(timeout=5)
+
+atexit.register(_flush_llm_csv_log)
+
 def log_llm_interaction(request_prompt, response_text, action=None, entry_price=None, 
                         price_target=None, stop_loss=None, confidence=None, reasoning=None, context=None, waiting_for=None, key_levels=None, suggestion=None):
     """Log LLM request and response to daily CSV file.
@@ -546,36 +776,23 @@ def log_llm_interaction(request_prompt, response_text, action=None, entry_price=
             'suggestion': suggestion[:500] if suggestion else ''
         }
         
-        # Check if file exists to determine if we need to write header
-        file_exists = os.path.exists(csv_file)
-        
-        with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
-            # Write header if new file
-            if not file_exists:
-                writer.writerow([
-                    'date_time', 'request', 'response', 'action', 'entry_price', 
-                    'price_target', 'stop_loss', 'confidence', 'reasoning', 'context', 'waiting_for', 'key_levels'
-                ])
-            
-            # Write the log entry
-            writer.writerow([
-                timestamp,
-                LATEST_LLM_DATA['request'],
-                LATEST_LLM_DATA['response'],
-                LATEST_LLM_DATA['action'],
-                LATEST_LLM_DATA['entry_price'],
-                LATEST_LLM_DATA['price_target'],
-                LATEST_LLM_DATA['stop_loss'],
-                LATEST_LLM_DATA['confidence'],
-                LATEST_LLM_DATA['reasoning'],
-                LATEST_LLM_DATA['context'],
-                LATEST_LLM_DATA['waiting_for'],
-                LATEST_LLM_DATA['key_levels']
-            ])
-        
-        logging.info(f"LLM interaction logged to {csv_file}")
+        # Hand the row to the background writer
+        LLM_CSV_QUEUE.put((csv_file, [
+            timestamp,
+            LATEST_LLM_DATA['request'],
+            LATEST_LLM_DATA['response'],
+            LATEST_LLM_DATA['action'],
+            LATEST_LLM_DATA['entry_price'],
+            LATEST_LLM_DATA['price_target'],
+            LATEST_LLM_DATA['stop_loss'],
+            LATEST_LLM_DATA['confidence'],
+            LATEST_LLM_DATA['reasoning'],
+            LATEST_LLM_DATA['context'],
+            LATEST_LLM_DATA['waiting_for'],
+            LATEST_LLM_DATA['key_levels']
+        ]))
+        
+        logging.info(f"LLM interaction queued for {csv_file}")
         
         # Also log to Supabase if enabled (with FULL, untruncated data)
         if SUPABASE_CLIENT:
@@ -759,8 +976,8 @@ def is_after_hours():
     current_time = datetime.datetime.now().time()
     
     # Regular Trading Hours (RTH): 8:30 AM - 3:00 PM CT
-    rth_start = datetime.datetime.strptime("09:30", "%H:%M").time()
-    rth_end = datetime.datetime.strptime("16:00", "%H:%M").time()
+    rth_start = _parse_hhmm("09:30")
+    rth_end = _parse_hhmm("16:00")
     
     # Check if we're outside RTH
     is_eth = current_time < rth_start or current_time >= rth_end
@@ -914,7 +1131,30 @@ def save_daily_context(new_context, old_context):
         logging.error(f"Error saving LLM context: {e}")
         logging.exception("Full traceback:")
 
-def reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, telegram_config=None, screenshot_config=None):
+def reconcile_all(topstep_config, enable_trading, auth_token, telegram_config=None, screenshot_config=None):
+    """Run reconcile_closed_trades() then reconcile_supabase_open_trades() sharing one position query.
+    
+    The position is fetched from the API at most once, and only if one of the passes needs it.
+    The passes stay sequential because the first may log the CLOSE event the second checks for.
+    
+    Args:
+        topstep_config: TopstepX configuration
+        enable_trading: Whether trading is enabled
+        auth_token: Authentication token
+        telegram_config: Optional Telegram config for notifications
+        screenshot_config: Optional dict with screenshot params
+    """
+    position_cache = {}
+    
+    def position_lookup():
+        if 'position_type' not in position_cache:
+            position_cache['position_type'] = get_current_position(SYMBOL, topstep_config, enable_trading, auth_token)
+        return position_cache['position_type']
+    
+    reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram_config, screenshot_config, position_lookup)
+    reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, telegram_config, screenshot_config, position_lookup)
+
+def reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, telegram_config=None, screenshot_config=None, position_lookup=None):
     """Check Supabase for ENTRY events without matching CLOSE events and reconcile them.
     
     This function queries Supabase for open trades (ENTRY without CLOSE) and checks if they
@@ -926,6 +1166,7 @@ def reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, t
         auth_token: Authentication token
         telegram_config: Optional Telegram config for notifications
         screenshot_config: Optional dict with screenshot params
+        position_lookup: Optional callable returning the current position type (shared by reconcile_all)
     """
     if not SUPABASE_CLIENT or not enable_trading or not auth_token:
         return
@@ -955,15 +1196,19 @@ def reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, t
             return
         
         # No CLOSE event found - check if position still exists in API
-        current_position_type = get_current_position(SYMBOL, topstep_config, enable_trading, auth_token)
+        if position_lookup:
+            current_position_type = position_lookup()
+        else:
+            current_position_type = get_current_position(SYMBOL, topstep_config, enable_trading, auth_token)
         
         tracked_position = most_recent_entry.get('position_type')
         if tracked_position in ['long', 'short'] and current_position_type == 'none':
             logging.info(f"🔄 SUPABASE RECONCILIATION: Found unclosed {tracked_position} trade (order {order_id}) - fetching trade history")
             
             # Fetch trade history from entry time to now
-            start_time = entry_timestamp if entry_timestamp else datetime.datetime.now().replace(hour=0, minute=0, second=0).strftime("%Y-%m-%dT%H:%M:%SZ")
-            end_time = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+            now = datetime.datetime.now()
+            start_time = entry_timestamp if entry_timestamp else today_midnight_timestamp(now)
+            end_time = format_api_timestamp(now)
             
             trades = fetch_trade_results(account_id, topstep_config, enable_trading, auth_token, start_time, end_time)
             
@@ -1053,16 +1298,16 @@ def reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, t
                         telegram_msg += f"Size: {exit_quantity} contract(s)\n\n"
                         telegram_msg += f"{pnl_emoji} <b>P&L: ${pnl_dollars:+,.2f} ({pnl_points:+.2f} pts)</b>\n\n"
                         telegram_msg += f"💰 Account Balance: ${balance:,.2f}\n" if balance else ""
-                        telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        telegram_msg += f"Time: {time.strftime(_TIMESTAMP_FORMAT)}"
                         
-                        send_telegram_message(telegram_msg, telegram_config)
-                        logging.info("Telegram notification sent for Supabase reconciled trade closure")
+                        queue_telegram_message(telegram_msg, telegram_config)
+                        logging.info("Telegram notification queued for Supabase reconciled trade closure")
                     
     except Exception as e:
         logging.error(f"Error in Supabase reconciliation: {e}")
         logging.exception("Full traceback:")
 
-def reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram_config=None, screenshot_config=None):
+def reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram_config=None, screenshot_config=None, position_lookup=None):
     """Reconcile trades that were closed via stop loss or take profit but not logged.
     
     Checks if we have an active trade in our tracking, verifies it still exists in API,
@@ -1076,6 +1321,7 @@ def reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram
         auth_token: Authentication token
         telegram_config: Optional Telegram config for notifications
         screenshot_config: Optional dict with screenshot params (window_title, window_process_name, etc.)
+        position_lookup: Optional callable returning the current position type (shared by reconcile_all)
     """
     if not enable_trading or not auth_token:
         return
@@ -1088,7 +1334,10 @@ def reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram
     
     try:
         # Check if position still exists in API
-        current_position_type = get_current_position(SYMBOL, topstep_config, enable_trading, auth_token)
+        if position_lookup:
+            current_position_type = position_lookup()
+        else:
+            current_position_type = get_current_position(SYMBOL, topstep_config, enable_trading, auth_token)
         
         # If we think we have a position but API shows none, it was closed
         tracked_position = trade_info.get('position_type', 'none')
@@ -1097,14 +1346,14 @@ def reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram
             
             # Fetch trade history to find the close
             entry_timestamp = trade_info.get('entry_timestamp')
+            now = datetime.datetime.now()
+            end_time = format_api_timestamp(now)
             if entry_timestamp:
                 # Parse entry timestamp and fetch trades from then until now
                 start_time = entry_timestamp  # Already in ISO format
-                end_time = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
             else:
                 # Fallback: fetch today's trades
-                start_time = datetime.datetime.now().replace(hour=0, minute=0, second=0).strftime("%Y-%m-%dT%H:%M:%SZ")
-                end_time = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                start_time = today_midnight_timestamp(now)
             
             trades = fetch_trade_results(
                 topstep_config['account_id'],
@@ -1220,10 +1469,10 @@ def reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram
                         telegram_msg += f"Size: {exit_quantity} contract(s)\n\n"
                         telegram_msg += f"{pnl_emoji} <b>P&L: ${pnl_dollars:+,.2f} ({pnl_points:+.2f} pts)</b>\n\n"
                         telegram_msg += f"💰 Account Balance: ${balance:,.2f}\n" if balance else ""
-                        telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        telegram_msg += f"Time: {time.strftime(_TIMESTAMP_FORMAT)}"
                         
-                        send_telegram_message(telegram_msg, telegram_config)
-                        logging.info("Telegram notification sent for closed trade")
+                        queue_telegram_message(telegram_msg, telegram_config)
+                        logging.info("Telegram notification queued for closed trade")
                 else:
                     logging.warning("Position closed but no exit trade found in history - clearing tracking")
                     clear_active_trade_info()
@@ -1422,9 +1671,9 @@ def correct_position_state(discrepancy, api_position_type, api_position_details,
             
             if api_position_details:
                 # Extract position details from API
-                api_entry_price = api_position_details.get('average_price') or api_position_details.get('averagePrice') or api_position_details.get('entryPrice') or 0
+                api_entry_price = _first(api_position_details, ('average_price', 'averagePrice', 'entryPrice'), 0)
                 api_symbol = api_position_details.get('symbol', 'UNKNOWN')
-                api_quantity = abs(api_position_details.get('quantity', 0) or api_position_details.get('size', 0))
+                api_quantity = abs(_first(api_position_details, ('quantity', 'size'), 0))
                 
                 # Parse working orders to get stop loss and take profit
                 contract_id = topstep_config.get('contract_id', '')
@@ -1452,7 +1701,7 @@ def correct_position_state(discrepancy, api_position_type, api_position_details,
                     logging.info(f"Using position ID from API: {order_id}")
                 
                 # Save active trade info
-                entry_timestamp = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                entry_timestamp = format_api_timestamp(datetime.datetime.now())
                 save_active_trade_info(
                     order_id=order_id,
                     entry_price=api_entry_price,
@@ -1572,6 +1821,31 @@ def send_telegram_message(message, telegram_config):
         logging.error(f"Error sending Telegram notification: {e}")
         return False
 
+# Telegram notifications are sent from a background thread so trade management never
+# waits on the Telegram API; when the queue is full the oldest message is dropped
+TELEGRAM_QUEUE = queue.Queue(maxsize=256)
+
+def queue_telegram_message(message, telegram_config):
+    """Queue a Telegram message for the background sender (returns immediately)."""
+    while True:
+        try:
+            TELEGRAM_QUEUE.put_nowait((message, telegram_config))
+            return
+        except queue.Full:
+            try:
+                TELEGRAM_QUEUE.get_nowait()
+                logging.warning("Telegram queue full - dropped oldest notification")
+            except queue.Empty:
+                pass
+
+def _telegram_worker():
+    """Send queued Telegram messages one at a time (runs in a daemon thread)."""
+    while True:
+        message, telegram_config = TELEGRAM_QUEUE.get()
+        send_telegram_message(message, telegram_config)
+
+threading.Thread(target=_telegram_worker, name="TelegramSender", daemon=True).start()
+
 def get_window_by_partial_title(partial_title, process_name=None):
     """Find a window handle by partial, case-insensitive title match, optionally filtered by process name.
     
@@ -1897,6 +2171,50 @@ def capture_screenshot(window_title=None, window_process_name=None, top_offset=0
 
     return image_base64
 
+def strip_llm_markdown(llm_response):
+    """Strip whitespace and a surrounding ```json / ``` code fence from an LLM response."""
+    llm_response = llm_response.strip()
+    if llm_response.startswith('```') and llm_response.endswith('```'):
+        llm_response = llm_response.removesuffix('```')
+        if llm_response.startswith('```json'):
+            llm_response = llm_response.removeprefix('```json')
+        else:
+            llm_response = llm_response.removeprefix('```')
+        llm_response = llm_response.strip()
+    return llm_response
+
+def parse_llm_json(llm_response):
+    """Parse a cleaned LLM response (see strip_llm_markdown) as JSON (orjson when installed)."""
+    return _json_loads(llm_response)
+
+# (sha1 digest, advice) of the last 'hold' response, stored as one tuple for thread safety
+_LLM_HOLD_CACHE = {'entry': (None, None)}
+
+def parse_llm_advice(llm_response):
+    """Parse a cleaned LLM response, reusing the previous advice for a repeated 'hold'.
+    
+    In a flat market the LLM often returns a byte-identical 'hold' response on
+    consecutive cycles. Only 'hold' advice is cached, so a trade action is never
+    short-circuited.
+    
+    Args:
+        llm_response: Cleaned LLM response text
+    
+    Returns:
+        tuple: (advice dict, True if the response repeats the last 'hold' response)
+    """
+    digest = hashlib.sha1(llm_response.encode('utf-8')).digest()
+    cached_digest, cached_advice = _LLM_HOLD_CACHE['entry']
+    if digest == cached_digest:
+        return cached_advice, True
+    
+    advice = parse_llm_json(llm_response)
+    if isinstance(advice, dict) and str(advice.get('action', '')).lower() == 'hold':
+        _LLM_HOLD_CACHE['entry'] = (digest, advice)
+    else:
+        _LLM_HOLD_CACHE['entry'] = (None, None)
+    return advice, False
+
 def upload_to_llm(image_base64, prompt, model, enable_llm, api_url, api_key):
     """Upload the screenshot to OpenAI API with custom prompt and model, and get a response (or mock if disabled)."""
     try:
@@ -1937,11 +2255,16 @@ def upload_to_llm(image_base64, prompt, model, enable_llm, api_url, api_key):
         logging.error(f"Error uploading to LLM: {e}")
         return None
 
+@functools.lru_cache(maxsize=32)
+def _parse_hhmm(value):
+    """Parse an "HH:MM" string into a datetime.time (memoized, the same few strings are parsed every tick)."""
+    return datetime.datetime.strptime(value, "%H:%M").time()
+
 def is_within_time_range(begin_time, end_time):
     """Check if current time is within the specified range."""
     now = datetime.datetime.now().time()
-    begin = datetime.datetime.strptime(begin_time, "%H:%M").time()
-    end = datetime.datetime.strptime(end_time, "%H:%M").time()
+    begin = _parse_hhmm(begin_time)
+    end = _parse_hhmm(end_time)
     return begin <= now <= end
 
 def is_in_no_new_trades_window(no_new_trades_windows_str):
@@ -1969,8 +2292,8 @@ def is_in_no_new_trades_window(no_new_trades_windows_str):
                 continue
             
             start_str, end_str = window.split('-', 1)
-            start_time = datetime.datetime.strptime(start_str.strip(), "%H:%M").time()
-            end_time = datetime.datetime.strptime(end_str.strip(), "%H:%M").time()
+            start_time = _parse_hhmm(start_str.strip())
+            end_time = _parse_hhmm(end_str.strip())
             
             # Check if we're in this window (handle overnight windows)
             in_window = False
@@ -1990,25 +2313,28 @@ def is_in_no_new_trades_window(no_new_trades_windows_str):
     
     return (False, None)
 
-def get_next_active_interval(interval_schedule_str):
-    """Get the next active time from interval_schedule.
+def _seconds_since_midnight(t):
+    """Convert a datetime.time to (fractional) seconds since midnight."""
+    return t.hour * 3600 + t.minute * 60 + t.second + t.microsecond / 1e6
+
+@functools.lru_cache(maxsize=4)
+def _build_schedule(interval_schedule_str):
+    """Parse interval_schedule into slot tuples (memoized on the raw string).
+    
+    A config reload that changes the schedule string simply produces a new cache entry.
     
     Args:
         interval_schedule_str: Comma-separated time ranges with intervals (e.g., "00:00-09:20=-1,09:32-15:45=45")
         
     Returns:
-        datetime.time or None: The next active time, or None if no active period found
+        tuple: (ordered, by_start) - the same (start_sec, end_sec, interval_seconds, start_time, end_time)
+               slots in config order (the first matching range wins) and sorted by start time
     """
-    if not interval_schedule_str or interval_schedule_str.strip() == '':
-        return None
-    
-    current_time = datetime.datetime.now().time()
-    
-    # Parse schedule
-    schedule_parts = [s.strip() for s in interval_schedule_str.split(',') if s.strip()]
-    
-    active_periods = []
-    for part in schedule_parts:
+    slots = []
+    for part in interval_schedule_str.split(','):
+        part = part.strip()
+        if not part:
+            continue
         try:
             if '=' not in part:
                 continue
@@ -2016,28 +2342,55 @@ def get_next_active_interval(interval_schedule_str):
             time_range, interval = part.split('=', 1)
             interval_seconds = int(interval)
             
-            # Skip disabled intervals
-            if interval_seconds < 0:
-                continue
-            
             # Parse time range
             if '-' not in time_range:
                 continue
             
             start_str, end_str = time_range.split('-', 1)
-            start_time = datetime.datetime.strptime(start_str.strip(), "%H:%M").time()
-            end_time = datetime.datetime.strptime(end_str.strip(), "%H:%M").time()
-            
-            active_periods.append((start_time, end_time))
+            start_time = _parse_hhmm(start_str.strip())
+            end_time = _parse_hhmm(end_str.strip())
         except (ValueError, AttributeError) as e:
             logging.debug(f"Error parsing interval schedule part '{part}': {e}")
             continue
+        
+        slots.append((_seconds_since_midnight(start_time), _seconds_since_midnight(end_time),
+                      interval_seconds, start_time, end_time))
+    
+    return tuple(slots), tuple(sorted(slots))
+
+def _schedule_slot_at(interval_schedule_str, now_sec):
+    """Return the first slot in config order containing now_sec (start <= now <= end), or None.
+    
+    Ranges may overlap (e.g. a catch-all "00:00-23:59=-1" after the active hours),
+    so the scan keeps config order rather than looking up by start time.
+    """
+    for slot in _build_schedule(interval_schedule_str)[0]:
+        if slot[0] <= now_sec <= slot[1]:
+            return slot
+    return None
+
+def get_next_active_interval(interval_schedule_str):
+    """Get the next active time from interval_schedule.
+    
+    Args:
+        interval_schedule_str: Comma-separated time ranges with intervals (e.g., "00:00-09:20=-1,09:32-15:45=45")
+        
+    Returns:
+        datetime.time or None: The next active time, or None if no active period found
+    """
+    if not interval_schedule_str or interval_schedule_str.strip() == '':
+        return None
+    
+    current_time = datetime.datetime.now().time()
+    
+    # Active (non-disabled) periods, already sorted by start time
+    active_periods = [(slot[3], slot[4]) for slot in _build_schedule(interval_schedule_str)[1] if slot[2] >= 0]
     
     if not active_periods:
         return None
     
     # Find next active period
-    for start_time, end_time in sorted(active_periods):
+    for start_time, end_time in active_periods:
         # If current time is before this period starts, return the start time
         if current_time < start_time:
             return start_time
@@ -2046,12 +2399,8 @@ def get_next_active_interval(interval_schedule_str):
             return None  # Already in active period
     
     # If we're past all periods today, return first period of tomorrow
-    if active_periods:
-        first_start = sorted(active_periods)[0][0]
-        # Return tomorrow's time (will be displayed as HH:MM)
-        return first_start
-    
-    return None
+    # (will be displayed as HH:MM)
+    return active_periods[0][0]
 
 def is_in_disabled_interval(interval_schedule_str):
     """Check if current time is in a disabled interval (interval=-1).
@@ -2065,49 +2414,30 @@ def is_in_disabled_interval(interval_schedule_str):
     if not interval_schedule_str or interval_schedule_str.strip() == '':
         return (False, None)
     
-    current_time = datetime.datetime.now().time()
-    
-    # Parse schedule
-    schedule_parts = [s.strip() for s in interval_schedule_str.split(',') if s.strip()]
-    
-    in_disabled = False
-    for part in schedule_parts:
-        try:
-            if '=' not in part:
-                continue
-            
-            time_range, interval = part.split('=', 1)
-            interval_seconds = int(interval)
-            
-            # Parse time range
-            if '-' not in time_range:
-                continue
-            
-            start_str, end_str = time_range.split('-', 1)
-            start_time = datetime.datetime.strptime(start_str.strip(), "%H:%M").time()
-            end_time = datetime.datetime.strptime(end_str.strip(), "%H:%M").time()
-            
-            # Check if current time is in this range
-            if start_time <= current_time <= end_time:
-                if interval_seconds < 0:
-                    # We're in a disabled interval
-                    in_disabled = True
-                    break
-                else:
-                    # We're in an active interval
-                    return (False, None)
-        except (ValueError, AttributeError) as e:
-            logging.debug(f"Error parsing interval schedule part '{part}': {e}")
-            continue
+    now_sec = _seconds_since_midnight(datetime.datetime.now().time())
+    slot = _schedule_slot_at(interval_schedule_str, now_sec)
     
-    if in_disabled:
-        next_time = get_next_active_interval(interval_schedule_str)
-        return (True, next_time)
+    if slot is not None and slot[2] < 0:
+        # We're in a disabled interval
+        return (True, get_next_active_interval(interval_schedule_str))
     
     return (False, None)
 
+# (error_code, error_message) pairs the user already chose to continue past; cleared
+# after the next successful trade so a repeating broker error doesn't re-open the modal
+_DISMISSED_ERRORS = set()
+
 def show_error_dialog(error_message, error_code):
-    """Show Windows native error dialog with Continue/Exit options."""
+    """Show Windows native error dialog with Continue/Exit options.
+    
+    Returns immediately (no dialog) for an error the user already continued past
+    since the last successful trade.
+    """
+    error_key = (error_code, error_message)
+    if error_key in _DISMISSED_ERRORS:
+        logging.error(f"Trading error (Code {error_code}) repeated - already continued past it, not showing dialog again: {error_message}")
+        return
+    
     logging.critical("="*80)
     logging.critical(f"CRITICAL ERROR (Code {error_code}): {error_message}")
     logging.critical("Displaying Windows native error dialog to user...")
@@ -2151,6 +2481,7 @@ def show_error_dialog(error_message, error_code):
         if result == 6:  # IDYES - Continue
             logging.warning("User chose to CONTINUE after error code 2")
             logging.warning("Program continuing despite error code 2 - user override")
+            _DISMISSED_ERRORS.add(error_key)
         else:  # IDNO (7) or dialog closed - Exit
             logging.critical("User chose to EXIT after error code 2")
             logging.critical("Program terminated due to trading error")
@@ -2162,6 +2493,18 @@ def show_error_dialog(error_message, error_code):
         logging.critical("MessageBox failed - exiting program for safety")
         sys.exit(1)
 
+# TopstepX order side (0 = bid/buy, 1 = ask/sell) for entry actions, and for the
+# order that reduces an open position (sell out of a long, buy back a short)
+_ACTION_SIDE = {'buy': 0, 'sell': 1}
+_EXIT_SIDE = {'long': 1, 'short': 0}
+# Entry actions, and actions/position types shown as buys or sells in notifications
+_ENTRY_ACTIONS = frozenset(('buy', 'sell'))
+_BUY_LIKE = frozenset(('buy', 'long'))
+_SELL_LIKE = frozenset(('sell', 'short'))
+# Bracket tick sign by entry side: a long's stop sits below entry, a short's target below entry
+_STOP_LOSS_TICK_SIGN = {0: -1, 1: 1}
+_TAKE_PROFIT_TICK_SIGN = {0: 1, 1: -1}
+
 def close_position(position_details, topstep_config, enable_trading, auth_token=None, execute_trades=False, telegram_config=None, reasoning=None, market_context=None):
     """Close the entire position by placing an opposite market order."""
     try:
@@ -2189,15 +2532,11 @@ def close_position(position_details, topstep_config, enable_trading, auth_token=
         
         # Determine the side for closing: opposite of current position
         # If long, sell to close. If short, buy to close.
-        if position_type == 'long':
-            side = 1  # Ask (sell to close long)
-            action_text = "SELL to close LONG"
-        elif position_type == 'short':
-            side = 0  # Bid (buy to close short)
-            action_text = "BUY to close SHORT"
-        else:
+        side = _EXIT_SIDE.get(position_type)
+        if side is None:
             logging.error(f"Invalid position type for closing: {position_type}")
             return
+        action_text = "SELL to close LONG" if side == 1 else "BUY to close SHORT"
         
         # Build the close order payload
         account_id = topstep_config['account_id']
@@ -2212,23 +2551,21 @@ def close_position(position_details, topstep_config, enable_trading, auth_token=
         }
         
         logging.info(f"Placing CLOSE order: {action_text}")
-        logging.info(f"Payload: {json.dumps(payload, indent=2)}")
+        logging.info("Payload: %s", _LazyJson(payload))
         
         # Place the order
         base_url = topstep_config['base_url']
         endpoint = topstep_config['buy_endpoint']  # Same endpoint for buy/sell
         url = base_url + endpoint
         
-        headers = {
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {auth_token}'
-        }
+        headers = _topstep_request_context(topstep_config, auth_token)['headers']
         
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
-        response_data = response.json()
+        response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=10)
+        invalidate_positions_cache()
+        response_data = _json_loads(response.content)
         
         logging.info(f"Close Order Response (Status {response.status_code}):")
-        logging.info(json.dumps(response_data, indent=2))
+        logging.info("%s", _LazyJson(response_data))
         
         # Check for errors
         if not response_data.get('success', True):
@@ -2263,9 +2600,9 @@ def close_position(position_details, topstep_config, enable_trading, auth_token=
                     start_time = entry_timestamp
                 else:
                     # Fallback to today's start if no timestamp
-                    start_time = datetime.datetime.now().replace(hour=0, minute=0, second=0).strftime("%Y-%m-%dT%H:%M:%SZ")
+                    start_time = today_midnight_timestamp()
                 
-                end_time = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                end_time = format_api_timestamp(datetime.datetime.now())
                 
                 trades = fetch_trade_results(
                     account_id,
@@ -2278,8 +2615,7 @@ def close_position(position_details, topstep_config, enable_trading, auth_token=
                 
                 if trades:
                     # Calculate net P&L from all fills
-                    total_pnl = sum(trade.get('profitAndLoss', 0) for trade in trades)
-                    total_fees = sum(trade.get('fees', 0) for trade in trades)
+                    total_pnl, total_fees = sum_trade_pnl_and_fees(trades)
                     net_pnl = total_pnl - total_fees
                     
                     # Calculate P&L in points (assuming ES multiplier of $50 per point)
@@ -2330,15 +2666,63 @@ def close_position(position_details, topstep_config, enable_trading, auth_token=
             if reasoning:
                 telegram_msg += f"📝 Reason: {reasoning}\n"
             
-            telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            telegram_msg += f"Time: {time.strftime(_TIMESTAMP_FORMAT)}"
             
-            send_telegram_message(telegram_msg, telegram_config)
-            logging.info(f"Telegram notification sent for position CLOSE with P&L results")
+            queue_telegram_message(telegram_msg, telegram_config)
+            logging.info(f"Telegram notification queued for position CLOSE with P&L results")
             
     except Exception as e:
         logging.error(f"Error closing position: {e}")
         logging.exception("Full traceback:")
 
+def price_to_ticks(price, tick_size=0.25):
+    """Convert a price to an integer number of ticks for exact price comparisons."""
+    return int(round(float(price) / tick_size))
+
+def _orders_list(working_orders):
+    """Return the list of orders from a get_working_orders response (list, or dict with 'orders')."""
+    if isinstance(working_orders, list):
+        return working_orders
+    if isinstance(working_orders, dict):
+        return working_orders.get('orders') or []
+    return []
+
+# Bracket order type -> (kind, price field, log label): 4 = Stop order (stop loss), 1 = Limit order (take profit)
+_BRACKET_ORDER_FIELDS = {
+    4: ('stop_loss', 'stopPrice', 'stop loss'),
+    1: ('take_profit', 'limitPrice', 'price target')
+}
+
+# Index of the most recently parsed working-orders response (see index_working_orders)
+_WORKING_ORDER_INDEX = {'entry': (None, {})}
+
+def index_working_orders(working_orders):
+    """Index a working-orders response by (contractId, type).
+    
+    The index for the last response object is cached, so repeated
+    parse_working_orders() calls on the same response are dict lookups
+    instead of a scan over every order.
+    
+    Args:
+        working_orders: Response from get_working_orders (list, or dict with 'orders')
+    
+    Returns:
+        dict: {(contract_id, order_type): order} keeping the last order seen per key
+    """
+    # (source, index) is stored as one tuple so the scheduler and trade-monitor
+    # threads never see a source paired with another response's index
+    cached_source, cached_index = _WORKING_ORDER_INDEX['entry']
+    if working_orders is cached_source:
+        return cached_index
+    
+    index = {}
+    for order in _orders_list(working_orders):
+        if isinstance(order, dict):
+            index[(order.get('contractId'), order.get('type'))] = order
+    
+    _WORKING_ORDER_INDEX['entry'] = (working_orders, index)
+    return index
+
 def parse_working_orders(working_orders, contract_id):
     """Parse working orders to extract stop loss and take profit order IDs and prices.
     
@@ -2360,35 +2744,103 @@ def parse_working_orders(working_orders, contract_id):
     if not working_orders:
         return result
     
-    # Extract orders list from response
-    orders_list = []
-    if isinstance(working_orders, list):
-        orders_list = working_orders
-    elif isinstance(working_orders, dict) and 'orders' in working_orders:
-        orders_list = working_orders.get('orders', [])
+    # Stop loss = type 4 (stop), take profit = type 1 (limit)
+    order_index = index_working_orders(working_orders)
     
-    # Find stop loss and take profit orders for this contract
-    for order in orders_list:
-        if not isinstance(order, dict):
-            continue
-        
-        order_contract_id = order.get('contractId')
-        order_type = order.get('type')
-        order_id = order.get('id')
-        
-        # Match contract and identify order type
-        if order_contract_id == contract_id:
-            if order_type == 4:  # Stop loss
-                result['stop_loss_order_id'] = order_id
-                result['stop_loss_price'] = order.get('stopPrice')
-                logging.info(f"Found stop loss order ID: {order_id}, Price: {result['stop_loss_price']}")
-            elif order_type == 1:  # Take profit (limit order)
-                result['take_profit_order_id'] = order_id
-                result['take_profit_price'] = order.get('limitPrice')
-                logging.info(f"Found take profit order ID: {order_id}, Price: {result['take_profit_price']}")
+    stop_order = order_index.get((contract_id, 4))
+    if stop_order is not None:
+        result['stop_loss_order_id'] = stop_order.get('id')
+        result['stop_loss_price'] = stop_order.get('stopPrice')
+        logging.info(f"Found stop loss order ID: {result['stop_loss_order_id']}, Price: {result['stop_loss_price']}")
+    
+    limit_order = order_index.get((contract_id, 1))
+    if limit_order is not None:
+        result['take_profit_order_id'] = limit_order.get('id')
+        result['take_profit_price'] = limit_order.get('limitPrice')
+        logging.info(f"Found take profit order ID: {result['take_profit_order_id']}, Price: {result['take_profit_price']}")
     
     return result
 
+def _modify_orders_batch(batch_url, headers, payloads):
+    """POST several order modify payloads as one batch request.
+    
+    Args:
+        batch_url: Full URL of the batch modify endpoint
+        headers: Request headers (including the bearer token)
+        payloads: Individual modify payloads ({accountId, orderId, stopPrice|limitPrice})
+    
+    Returns:
+        dict: {orderId: result entry}, or None if the batch call is unsupported or failed
+    """
+    batch_payload = {
+        "accountId": payloads[0]['accountId'],
+        "orders": [{key: value for key, value in payload.items() if key != 'accountId'} for payload in payloads]
+    }
+    logging.info("Batch modify payload: %s", _LazyJson(batch_payload))
+    try:
+        response = _HTTP_SESSION.post(batch_url, headers=headers, json=batch_payload, timeout=10)
+        if response.status_code in (404, 405):
+            logging.warning(f"Batch order modify not supported (HTTP {response.status_code}) - falling back to individual modifies")
+            return None
+        response_data = _json_loads(response.content)
+        entries = response_data if isinstance(response_data, list) else response_data.get('orders')
+        if not isinstance(entries, list):
+            logging.warning("Unexpected batch modify response: %s - falling back to individual modifies", _LazyJson(response_data))
+            return None
+        return {entry.get('orderId'): entry for entry in entries if isinstance(entry, dict)}
+    except Exception as e:
+        logging.warning(f"Batch order modify failed ({e}) - falling back to individual modifies")
+        return None
+
+def modify_orders(topstep_config, headers, payloads):
+    """Send order modify payloads to TopstepX and return the response data for each.
+    
+    Payloads are sent concurrently on _MODIFY_POOL. With use_batch_modify enabled
+    and more than one order to change, they go out as a single request to
+    modify_batch_endpoint instead; if that fails the individual modifies are sent
+    (modifies set absolute prices, so resending is safe).
+    
+    TopstepX only accepts order changes over REST (its realtime hubs push updates
+    but take no orders), so modifies go over the pooled _HTTP_SESSION connection
+    that TopstepKeepAlive keeps warm rather than a separate trading socket.
+    
+    Args:
+        topstep_config: Topstep configuration dict
+        headers: Request headers (including the bearer token)
+        payloads: Modify payloads ({accountId, orderId, stopPrice|limitPrice}); None entries are skipped
+    
+    Returns:
+        list: Per payload, the response data dict, the Exception raised, or None for skipped entries
+    """
+    base_url = topstep_config['base_url']
+    active = [payload for payload in payloads if payload is not None]
+    invalidate_positions_cache()
+    
+    if len(active) > 1 and topstep_config.get('use_batch_modify'):
+        batch_url = base_url + topstep_config.get('modify_batch_endpoint', '/api/Order/modifyBatch')
+        by_order_id = _modify_orders_batch(batch_url, headers, active)
+        if by_order_id is not None:
+            missing = {'success': False, 'errorMessage': 'Order missing from batch modify response'}
+            return [None if payload is None else by_order_id.get(payload['orderId'], missing) for payload in payloads]
+    
+    # Both legs are independent orders, so submit them together and wait on
+    # the responses afterwards instead of paying the broker round-trip twice
+    modify_url = base_url + topstep_config.get('modify_order_endpoint', '/api/Order/modify')
+    futures = [
+        None if payload is None else _MODIFY_POOL.submit(_HTTP_SESSION.post, modify_url, headers=headers, json=payload, timeout=10)
+        for payload in payloads
+    ]
+    results = []
+    for future in futures:
+        if future is None:
+            results.append(None)
+            continue
+        try:
+            results.append(_json_loads(future.result().content))
+        except Exception as e:
+            results.append(e)
+    return results
+
 def modify_stops_and_targets(position_details, new_price_target, new_stop_loss, topstep_config, enable_trading, auth_token=None, execute_trades=False, position_type='none', working_orders=None, reasoning=None, market_context=None):
     """Modify existing stop loss and take profit orders using /api/Order/modify endpoint."""
     try:
@@ -2422,8 +2874,6 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
         # Get configuration
         account_id = topstep_config['account_id']
         contract_id = topstep_config['contract_id']
-        base_url = topstep_config['base_url']
-        modify_order_endpoint = topstep_config.get('modify_order_endpoint', '/api/Order/modify')
         
         # Validate price data
         if not new_price_target or not new_stop_loss:
@@ -2441,16 +2891,17 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
         current_stop_loss = order_ids.get('stop_loss_price')
         current_take_profit = order_ids.get('take_profit_price')
         
-        # Check if values actually changed (tolerance for floating point comparison)
-        tolerance = 0.01
+        # Check if values actually changed - compare in whole ticks so float noise
+        # from the LLM (e.g. 4567.2500000001) never triggers a broker modification
+        tick_size = topstep_config.get('tick_size', 0.25)
         stop_changed = False
         target_changed = False
         
         if current_stop_loss and new_stop_loss:
-            stop_changed = abs(float(current_stop_loss) - float(new_stop_loss)) > tolerance
+            stop_changed = price_to_ticks(current_stop_loss, tick_size) != price_to_ticks(new_stop_loss, tick_size)
         
         if current_take_profit and new_price_target:
-            target_changed = abs(float(current_take_profit) - float(new_price_target)) > tolerance
+            target_changed = price_to_ticks(current_take_profit, tick_size) != price_to_ticks(new_price_target, tick_size)
         
         values_changed = stop_changed or target_changed
         
@@ -2459,12 +2910,7 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
         logging.info(f"Values changed: Stop={stop_changed}, Target={target_changed}, Overall={values_changed}")
         
         # Set up headers for modify requests
-        headers = {
-            'Authorization': f'Bearer {auth_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        modify_url = base_url + modify_order_endpoint
+        headers = _topstep_request_context(topstep_config, auth_token)['headers']
         
         # Only modify orders if values actually changed
         if not values_changed:
@@ -2472,6 +2918,9 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
         else:
             logging.info("Values changed - proceeding with broker modifications")
         
+        stop_loss_payload = None
+        take_profit_payload = None
+        
         # Modify stop loss order if order ID found AND value changed
         if stop_loss_order_id and new_stop_loss and stop_changed:
             stop_loss_payload = {
@@ -2481,27 +2930,7 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
             }
             
             logging.info(f"Modifying stop loss order ID {stop_loss_order_id} to price {new_stop_loss}")
-            logging.info(f"Modify URL: {modify_url}")
-            logging.info(f"Stop Loss Payload: {json.dumps(stop_loss_payload, indent=2)}")
-            
-            try:
-                sl_response = requests.post(modify_url, headers=headers, json=stop_loss_payload, timeout=10)
-                sl_response_data = sl_response.json()
-                
-                logging.info(f"Stop loss modify response: {json.dumps(sl_response_data, indent=2)}")
-                
-                if sl_response_data.get('success', True):
-                    logging.info(f"Successfully modified stop loss to {new_stop_loss}")
-                else:
-                    error_msg = sl_response_data.get('errorMessage', 'Unknown error')
-                    error_code = sl_response_data.get('errorCode', 0)
-                    logging.error(f"Failed to modify stop loss: {error_msg}")
-                    if error_code == 2:
-                        show_error_dialog(error_msg, error_code)
-                        
-            except Exception as e:
-                logging.error(f"Error modifying stop loss order: {e}")
-                logging.exception("Full traceback:")
+            logging.info("Stop Loss Payload: %s", _LazyJson(stop_loss_payload))
         else:
             if not stop_loss_order_id:
                 logging.warning("No stop loss order ID found - cannot modify")
@@ -2515,31 +2944,41 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
             }
             
             logging.info(f"Modifying take profit order ID {take_profit_order_id} to price {new_price_target}")
-            logging.info(f"Modify URL: {modify_url}")
-            logging.info(f"Take Profit Payload: {json.dumps(take_profit_payload, indent=2)}")
-            
-            try:
-                tp_response = requests.post(modify_url, headers=headers, json=take_profit_payload, timeout=10)
-                tp_response_data = tp_response.json()
-                
-                logging.info(f"Take profit modify response: {json.dumps(tp_response_data, indent=2)}")
-                
-                if tp_response_data.get('success', True):
-                    logging.info(f"Successfully modified take profit to {new_price_target}")
-                else:
-                    error_msg = tp_response_data.get('errorMessage', 'Unknown error')
-                    error_code = tp_response_data.get('errorCode', 0)
-                    logging.error(f"Failed to modify take profit: {error_msg}")
-                    if error_code == 2:
-                        show_error_dialog(error_msg, error_code)
-                        
-            except Exception as e:
-                logging.error(f"Error modifying take profit order: {e}")
-                logging.exception("Full traceback:")
+            logging.info("Take Profit Payload: %s", _LazyJson(take_profit_payload))
         else:
             if not take_profit_order_id:
                 logging.warning("No take profit order ID found - cannot modify")
         
+        sl_response_data, tp_response_data = modify_orders(topstep_config, headers, [stop_loss_payload, take_profit_payload])
+        
+        if isinstance(sl_response_data, Exception):
+            logging.error(f"Error modifying stop loss order: {sl_response_data}", exc_info=sl_response_data)
+        elif sl_response_data is not None:
+            if sl_response_data.get('success', True):
+                logging.info(f"Successfully modified stop loss to {new_stop_loss}")
+            else:
+                # Full response body is only worth serializing when the modify failed
+                logging.info("Stop loss modify response: %s", _LazyJson(sl_response_data))
+                error_msg = sl_response_data.get('errorMessage', 'Unknown error')
+                error_code = sl_response_data.get('errorCode', 0)
+                logging.error(f"Failed to modify stop loss: {error_msg}")
+                if error_code == 2:
+                    show_error_dialog(error_msg, error_code)
+        
+        if isinstance(tp_response_data, Exception):
+            logging.error(f"Error modifying take profit order: {tp_response_data}", exc_info=tp_response_data)
+        elif tp_response_data is not None:
+            if tp_response_data.get('success', True):
+                logging.info(f"Successfully modified take profit to {new_price_target}")
+            else:
+                # Full response body is only worth serializing when the modify failed
+                logging.info("Take profit modify response: %s", _LazyJson(tp_response_data))
+                error_msg = tp_response_data.get('errorMessage', 'Unknown error')
+                error_code = tp_response_data.get('errorCode', 0)
+                logging.error(f"Failed to modify take profit: {error_msg}")
+                if error_code == 2:
+                    show_error_dialog(error_msg, error_code)
+        
         # Log event to CSV - ADJUSTMENT if values changed, HOLD if they stayed the same
         # Get order_id from active trade info
         trade_info = get_active_trade_info()
@@ -2584,8 +3023,25 @@ def modify_stops_and_targets(position_details, new_price_target, new_stop_loss,
         logging.info("=" * 80)
             
     except Exception as e:
-        logging.error(f"Error modifying stops and targets: {e}")
-        logging.exception("Full traceback:")
+        logging.error(f"Error modifying stops and targets: {e}", exc_info=True)
+
+# Incremental read state for the daily LLM CSV (see get_latest_llm_data)
+_LLM_CSV_CACHE = {'path': None, 'mtime': 0, 'size': 0, 'header': None, 'last': None}
+
+def _complete_csv_records_end(text):
+    """Return the index just past the last newline that ends a CSV record in text (0 if none).
+    
+    Newlines inside quoted fields (multi-line prompts/responses) don't end a record;
+    a doubled "" escape toggles the quote state twice, so it needs no special case.
+    """
+    end = 0
+    in_quotes = False
+    for i, char in enumerate(text):
+        if char == '"':
+            in_quotes = not in_quotes
+        elif char == '\n' and not in_quotes:
+            end = i + 1
+    return end
 
 def get_latest_llm_data():
     """Get the most recent LLM interaction from today's log.
@@ -2608,24 +3064,252 @@ def get_latest_llm_data():
         if not os.path.exists(csv_file):
             return None
         
-        # Read the CSV and get the last row
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            if rows:
-                return rows[-1]  # Return the most recent entry
-        return None
+        cache = _LLM_CSV_CACHE
+        stat = os.stat(csv_file)
+        
+        # Unchanged since last read - reuse the cached row
+        if cache['path'] == csv_file and cache['mtime'] == stat.st_mtime and cache['size'] == stat.st_size:
+            return cache['last']
+        
+        # New day's file or file was truncated/rewritten - start over from the top
+        if cache['path'] != csv_file or stat.st_size < cache['size']:
+            cache.update({'path': csv_file, 'mtime': 0, 'size': 0, 'header': None, 'last': None})
+        
+        # The log is append-only, so only parse the bytes written since the last read.
+        # Rows can span multiple lines (quoted prompts/responses), so we resume from a
+        # known record boundary instead of guessing where the last row starts.
+        with open(csv_file, 'rb') as f:
+            f.seek(cache['size'])
+            chunk = f.read(stat.st_size - cache['size'])
+        
+        # Only decode up to the last newline byte: it never falls inside a multi-byte
+        # UTF-8 character, so a character split at the read boundary is left for later
+        try:
+            text = chunk[:chunk.rfind(b'\n') + 1].decode('utf-8')
+        except UnicodeDecodeError as e:
+            logging.debug(f"LLM log not decodable yet, keeping last row: {e}")
+            return cache['last']
+        
+        # Stop at the end of the last complete record; a row still being written
+        # (possibly mid quoted field) is picked up on a later refresh
+        text = text[:_complete_csv_records_end(text)]
+        if not text:
+            return cache['last']
+        
+        reader = csv.reader(StringIO(text, newline=''))
+        if cache['header'] is None:
+            cache['header'] = next(reader, None)
+        
+        last_row = None
+        for last_row in reader:
+            pass
+        
+        if last_row and cache['header']:
+            cache['last'] = dict(zip(cache['header'], last_row))
+        
+        cache['mtime'] = stat.st_mtime
+        cache['size'] += len(text.encode('utf-8'))
+        return cache['last']
     except Exception as e:
         logging.error(f"Error reading latest LLM data: {e}")
         return None
 
-def show_dashboard(root=None):
-    """Show a GUI dashboard with current trading status and latest LLM analysis."""
-    global DASHBOARD_WINDOW, ACCOUNT_BALANCE, DASHBOARD_WIDGETS
+# Dashboard color tables (built once instead of on every refresh)
+_ACTION_COLORS = {
+    'BUY': '#00ff00', 'SELL': '#ff4444', 'HOLD': '#ffaa00',
+    'CLOSE': '#ff4444', 'ADJUST': '#00aaff', 'SCALE': '#ffaa00'
+}
+_POSITION_COLORS = {'LONG': '#00ff00', 'SHORT': '#ff4444', 'FLAT': '#888888'}
+
+def _set_text_widget(widget, text):
+    """Replace the contents of a read-only Text widget, skipping the update if unchanged.
+    
+    The last value written is remembered on the widget itself, so refreshes that
+    re-display the same LLM response avoid the NORMAL/delete/insert/DISABLED cycle.
+    Widgets not yet written through this helper are compared against their content.
+    """
+    current = getattr(widget, '_dashboard_text', None)
+    if current is None:
+        current = widget.get('1.0', 'end-1c')
+    if current == text:
+        widget._dashboard_text = text
+        return
+    widget.config(state=tk.NORMAL)
+    widget.delete(1.0, tk.END)
+    widget.insert(1.0, text)
+    widget.config(state=tk.DISABLED)
+    widget._dashboard_text = text
+
+@functools.lru_cache(maxsize=16)
+def _parse_key_levels(key_levels_json_str):
+    """json.loads() a key-levels string, returning None if it is not valid JSON.
     
+    The failure is cached too, so a malformed value is not re-decoded on every refresh.
+    """
     try:
-        # Determine if this is initial build or refresh
-        is_initial_build = not DASHBOARD_WIDGETS
+        return json.loads(key_levels_json_str)
+    except json.JSONDecodeError:
+        return None
+
+@functools.lru_cache(maxsize=8)
+def _format_key_levels_json(key_levels_json_str):
+    """Parse a key-levels JSON string and format it for the dashboard (memoized on the raw string)."""
+    key_levels_json = _parse_key_levels(key_levels_json_str)
+    
+    formatted_levels = []
+    if key_levels_json and isinstance(key_levels_json, list):
+        for level in key_levels_json:
+            if isinstance(level, dict):
+                price = level.get('price', 'N/A')
+                level_type = level.get('type', 'N/A')
+                reason = level.get('reason', '')
+                if reason:
+                    formatted_levels.append(f"{price} ({level_type}): {reason}")
+                else:
+                    formatted_levels.append(f"{price} ({level_type})")
+    
+    return "\n".join(formatted_levels)
+
+def format_key_levels_for_dashboard(key_levels_value):
+    """Format key levels (JSON string or list of dicts) as one line per level for the dashboard.
+    
+    Results are memoized on the raw JSON string, so refreshes that show a
+    recently seen LLM response skip the JSON parse and formatting entirely.
+    
+    Returns:
+        str: Newline-separated levels, or '' if there is nothing to show (or the JSON is invalid)
+    """
+    if not isinstance(key_levels_value, str):
+        # Canonical string key so equivalent lists share a cache entry
+        key_levels_value = json.dumps(key_levels_value, sort_keys=True)
+    return _format_key_levels_json(key_levels_value)
+
+# Target/stop label templates keyed by (field, confirmed); a check mark means the price
+# comes from the live bracket order rather than the LLM suggestion
+_PRICE_LABEL_FORMATS = {
+    ('target', False): "Target: {}",
+    ('target', True): "Target: {} ✓",
+    ('stop', False): "Stop: {}",
+    ('stop', True): "Stop: {} ✓"
+}
+
+def _optional_dashboard_text(value):
+    """Return value if it is worth displaying (non-blank and not a literal 'null'), else ''."""
+    if value and value.strip() and value.lower() != 'null':
+        return value
+    return ''
+
+# Last rendered options per dashboard widget and the keys of widgets currently packed,
+# so refresh_dashboard only touches widgets whose displayed values actually change
+DASHBOARD_STATE = {}
+_DASHBOARD_PACKED = set()
+# Which group each dashboard section currently shows ('active' or 'empty'), so refreshes
+# only pack/forget the position and no-position groups when the section actually flips
+_DASHBOARD_MODES = {}
+
+# Labels whose text is driven by a StringVar (textvariable) instead of config(text=...)
+DASHBOARD_VARS = {}
+_DASHBOARD_TEXT_VAR_KEYS = ('balance_label', 'session_rpl_label', 'position_label', 'entry_price_label',
+                            'stop_loss_label', 'price_target_label', 'order_id_label', 'action_label',
+                            'timestamp_label', 'countdown_label', 'target_label_llm', 'stop_label_llm',
+                            'confidence_label')
+
+_POSITION_WIDGET_KEYS = ('position_label', 'entry_price_label', 'stop_loss_label', 'price_target_label', 'order_id_label')
+_LLM_WIDGET_KEYS = ('action_label', 'time_frame', 'target_label_llm', 'stop_label_llm', 'confidence_label',
+                    'reasoning_title', 'reasoning_text', 'waiting_for_title', 'waiting_for_text',
+                    'key_levels_title', 'key_levels_text', 'suggestion_title', 'suggestion_text')
+
+# Widget option writes queued while refresh_dashboard() runs (None when not batching)
+_DASHBOARD_BATCH = {'ops': None}
+
+def _apply_widget_update(widget, text_var, changed):
+    """Write changed options to a widget, routing 'text' through its StringVar if bound."""
+    if text_var is not None and 'text' in changed:
+        changed = dict(changed)
+        text_var.set(changed.pop('text'))
+    if changed:
+        widget.config(**changed)
+
+def _apply_widget_updates(ops):
+    """Apply a batch of queued widget updates in one idle callback (one redraw pass)."""
+    for widget, text_var, changed in ops:
+        try:
+            _apply_widget_update(widget, text_var, changed)
+        except tk.TclError:
+            pass  # Widget destroyed before the batch ran
+
+def _config_widget(key, **options):
+    """Apply options to a dashboard widget, skipping any that match the last rendered value.
+    
+    During refresh_dashboard() the write is queued and applied with the rest of the batch.
+    """
+    widget = DASHBOARD_WIDGETS.get(key)
+    if widget is None:
+        return
+    state = DASHBOARD_STATE.setdefault(key, {})
+    changed = {name: value for name, value in options.items() if state.get(name) != value}
+    if not changed:
+        return
+    state.update(changed)
+    ops = _DASHBOARD_BATCH['ops']
+    if ops is not None:
+        ops.append((widget, DASHBOARD_VARS.get(key), changed))
+    else:
+        _apply_widget_update(widget, DASHBOARD_VARS.get(key), changed)
+
+def _bind_dashboard_vars(dashboard):
+    """Attach a StringVar to each dynamic dashboard label, seeded with its current text."""
+    DASHBOARD_VARS.clear()
+    for key in _DASHBOARD_TEXT_VAR_KEYS:
+        widget = DASHBOARD_WIDGETS.get(key)
+        if widget is None:
+            continue
+        text_var = tk.StringVar(master=dashboard, value=widget.cget('text'))
+        widget.config(textvariable=text_var)
+        DASHBOARD_VARS[key] = text_var
+        DASHBOARD_STATE.setdefault(key, {})['text'] = text_var.get()
+
+def _pack_widget(key, **pack_options):
+    """Pack a dashboard widget unless it is already packed."""
+    widget = DASHBOARD_WIDGETS.get(key)
+    if widget is None or key in _DASHBOARD_PACKED:
+        return
+    widget.pack(**pack_options)
+    _DASHBOARD_PACKED.add(key)
+
+def _forget_widget(key):
+    """Unpack a dashboard widget if it is currently packed."""
+    widget = DASHBOARD_WIDGETS.get(key)
+    if widget is None or key not in _DASHBOARD_PACKED:
+        return
+    widget.pack_forget()
+    _DASHBOARD_PACKED.discard(key)
+
+def _set_dashboard_text(key, text):
+    """Update a dashboard Text widget by key (no-op if unchanged)."""
+    widget = DASHBOARD_WIDGETS.get(key)
+    if widget is not None:
+        _set_text_widget(widget, text)
+
+def _dashboard_fingerprint(trade_info, llm_data):
+    """Everything the dashboard displays, used to skip refreshes when nothing changed.
+    
+    trade_info and llm_data are cached objects that are only replaced when their
+    underlying data changes, so they are compared by identity.
+    """
+    return (llm_data, trade_info, ACCOUNT_BALANCE, CURRENT_RPL, SESSION_START_BALANCE)
+
+def show_dashboard(root=None):
+    """Show a GUI dashboard with current trading status and latest LLM analysis.
+    
+    The widgets are built once (at startup, or when opened from the tray menu);
+    later calls only update the existing widgets in place via refresh_dashboard().
+    """
+    global DASHBOARD_WINDOW
+    
+    try:
+        # Determine if this is initial build or refresh
+        is_initial_build = not DASHBOARD_WIDGETS
         
         # Create new window (or use root if provided)
         if root is None:
@@ -2642,11 +3326,6 @@ def show_dashboard(root=None):
             if dashboard.state() == 'withdrawn':
                 dashboard.deiconify()
         
-        dashboard.title("ES Trader Dashboard")
-        if is_initial_build:
-            dashboard.geometry("650x850")
-        dashboard.configure(bg='#1e1e1e')
-        
         # Get current data - verify position from API if trading is enabled
         trade_info = get_active_trade_info()
         
@@ -2656,542 +3335,524 @@ def show_dashboard(root=None):
         
         llm_data = get_latest_llm_data()
         
-        # Use cached balance or display N/A
-        balance = "N/A"
-        if ACCOUNT_BALANCE is not None:
-            balance = f"${ACCOUNT_BALANCE:,.2f}"
-        
-        # If this is just a data refresh, update existing widgets
-        if not is_initial_build and DASHBOARD_WIDGETS:
-            # Update balance
-            if 'balance_label' in DASHBOARD_WIDGETS:
-                DASHBOARD_WIDGETS['balance_label'].config(text=f"Balance: {balance}")
-            
-            # Update session RPL (always update, even if 0 or None)
-            if SESSION_START_BALANCE is not None:
-                rpl_color = '#00ff00' if CURRENT_RPL >= 0 else '#ff4444'
-                rpl_text = f"${CURRENT_RPL:+,.2f}"
-                session_start_text = f"${SESSION_START_BALANCE:,.2f}"
-            else:
-                rpl_color = '#aaaaaa'
-                rpl_text = "$0.00"
-                session_start_text = "N/A"
-            
-            if 'session_rpl_label' in DASHBOARD_WIDGETS:
-                DASHBOARD_WIDGETS['session_rpl_label'].config(text=rpl_text, fg=rpl_color)
-            # Session start label hidden for cleaner UI
-            # if 'session_start_label' in DASHBOARD_WIDGETS:
-            #     DASHBOARD_WIDGETS['session_start_label'].config(text=f"Session Start (18:00): {session_start_text}")
-            
-            # Update position info
-            if trade_info:
-                position_type = trade_info.get('position_type', 'None').upper()
-                entry_price = trade_info.get('entry_price', 'N/A')
-                stop_loss = trade_info.get('stop_loss', 'N/A')
-                price_target = trade_info.get('price_target', 'N/A')
-                order_id = trade_info.get('order_id', 'N/A')
-                size = trade_info.get('size', '')
-                pos_color = '#00ff00' if position_type == 'LONG' else '#ff4444'
-                
-                # Show position type with size in parentheses
-                position_text = f"Position: {position_type}"
-                if size:
-                    position_text += f" ({size})"
-                
-                if 'position_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['position_label'].config(text=position_text, fg=pos_color)
-                if 'entry_price_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['entry_price_label'].config(text=f"Entry Price: {entry_price}")
-                if 'stop_loss_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['stop_loss_label'].config(text=f"Stop Loss: {stop_loss}")
-                if 'price_target_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['price_target_label'].config(text=f"Take Profit: {price_target}")
-                if 'order_id_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['order_id_label'].config(text=f"Order ID: {order_id}")
-                
-                # Show position labels, hide no-position label
-                for key in ['position_label', 'entry_price_label', 'stop_loss_label', 'price_target_label', 'order_id_label']:
-                    if key in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS[key].pack(anchor="w")
-                if 'no_position_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['no_position_label'].pack_forget()
-            else:
-                # Hide position labels, show no-position label
-                for key in ['position_label', 'entry_price_label', 'stop_loss_label', 'price_target_label', 'order_id_label']:
-                    if key in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS[key].pack_forget()
-                if 'no_position_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['no_position_label'].pack(anchor="w")
-            
-            # Update LLM data
-            if llm_data:
-                action = llm_data.get('action', 'N/A').upper()
-                action_colors = {
-                    'BUY': '#00ff00', 'SELL': '#ff4444', 'HOLD': '#ffaa00',
-                    'CLOSE': '#ff4444', 'ADJUST': '#00aaff', 'SCALE': '#ffaa00'
-                }
-                action_color = action_colors.get(action, '#ffffff')
-                
-                if 'action_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['action_label'].config(text=f"Action: {action}", fg=action_color)
-                if 'timestamp_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['timestamp_label'].config(text=f"Time: {llm_data.get('date_time', 'N/A')}")
-                
-                # Update prices
-                price_info = []
-                if llm_data.get('entry_price'):
-                    price_info.append(f"Entry: {llm_data['entry_price']}")
-                
-                actual_stop = None
-                actual_target = None
-                if trade_info:
-                    actual_stop = trade_info.get('stop_loss')
-                    actual_target = trade_info.get('price_target')
-                
-                # Debug logging
-                logging.debug(f"Dashboard price display - LLM: Target={llm_data.get('price_target')}, Stop={llm_data.get('stop_loss')}")
-                logging.debug(f"Dashboard price display - Actual: Target={actual_target}, Stop={actual_stop}")
-                
-                target_value = actual_target if actual_target else llm_data.get('price_target')
-                if target_value:
-                    target_text = f"Target: {target_value}"
-                    if actual_target:
-                        target_text += " ✓"
-                    if 'target_label_llm' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['target_label_llm'].config(text=target_text)
-                        DASHBOARD_WIDGETS['target_label_llm'].pack(anchor="w")
-                else:
-                    if 'target_label_llm' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['target_label_llm'].config(text="")
-                        DASHBOARD_WIDGETS['target_label_llm'].pack_forget()
-                
-                stop_value = actual_stop if actual_stop else llm_data.get('stop_loss')
-                if stop_value:
-                    stop_text = f"Stop: {stop_value}"
-                    if actual_stop:
-                        stop_text += " ✓"
-                    if 'stop_label_llm' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['stop_label_llm'].config(text=stop_text)
-                        DASHBOARD_WIDGETS['stop_label_llm'].pack(anchor="w")
-                else:
-                    if 'stop_label_llm' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['stop_label_llm'].config(text="")
-                        DASHBOARD_WIDGETS['stop_label_llm'].pack_forget()
-                
-                if 'confidence_label' in DASHBOARD_WIDGETS:
-                    conf_text = f"Confidence: {llm_data['confidence']}" if llm_data.get('confidence') else ""
-                    DASHBOARD_WIDGETS['confidence_label'].config(text=conf_text)
-                
-                if 'reasoning_text' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['reasoning_text'].config(state=tk.NORMAL)
-                    DASHBOARD_WIDGETS['reasoning_text'].delete(1.0, tk.END)
-                    DASHBOARD_WIDGETS['reasoning_text'].insert(1.0, llm_data.get('reasoning', 'N/A'))
-                    DASHBOARD_WIDGETS['reasoning_text'].config(state=tk.DISABLED)
-                
-                # Update waiting_for text if available
-                waiting_for_value = llm_data.get('waiting_for', '')
-                if waiting_for_value and waiting_for_value.strip():
-                    if 'waiting_for_title' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['waiting_for_title'].pack(anchor="w", pady=(10, 5))
-                    if 'waiting_for_text' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['waiting_for_text'].config(state=tk.NORMAL)
-                        DASHBOARD_WIDGETS['waiting_for_text'].delete(1.0, tk.END)
-                        DASHBOARD_WIDGETS['waiting_for_text'].insert(1.0, waiting_for_value)
-                        DASHBOARD_WIDGETS['waiting_for_text'].config(state=tk.DISABLED)
-                        DASHBOARD_WIDGETS['waiting_for_text'].pack(fill="x", pady=5)
-                else:
-                    # Hide waiting_for widgets if no data
-                    if 'waiting_for_title' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['waiting_for_title'].pack_forget()
-                    if 'waiting_for_text' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['waiting_for_text'].pack_forget()
-                
-                # Update key_levels text if available
-                key_levels_value = llm_data.get('key_levels', '')
-                if key_levels_value and key_levels_value.strip():
-                    # Format key levels for display
-                    try:
-                        if isinstance(key_levels_value, str):
-                            key_levels_json = json.loads(key_levels_value)
-                        else:
-                            key_levels_json = key_levels_value
-                        
-                        if key_levels_json and isinstance(key_levels_json, list):
-                            formatted_levels = []
-                            for level in key_levels_json:
-                                if isinstance(level, dict):
-                                    price = level.get('price', 'N/A')
-                                    level_type = level.get('type', 'N/A')
-                                    reason = level.get('reason', '')
-                                    if reason:
-                                        formatted_levels.append(f"{price} ({level_type}): {reason}")
-                                    else:
-                                        formatted_levels.append(f"{price} ({level_type})")
-                            
-                            if formatted_levels:
-                                if 'key_levels_title' in DASHBOARD_WIDGETS:
-                                    DASHBOARD_WIDGETS['key_levels_title'].pack(anchor="w", pady=(10, 5))
-                                if 'key_levels_text' in DASHBOARD_WIDGETS:
-                                    DASHBOARD_WIDGETS['key_levels_text'].config(state=tk.NORMAL)
-                                    DASHBOARD_WIDGETS['key_levels_text'].delete(1.0, tk.END)
-                                    DASHBOARD_WIDGETS['key_levels_text'].insert(1.0, "\n".join(formatted_levels))
-                                    DASHBOARD_WIDGETS['key_levels_text'].config(state=tk.DISABLED)
-                                    DASHBOARD_WIDGETS['key_levels_text'].pack(fill="x", pady=5)
-                    except:
-                        pass  # Skip if parsing fails
-                else:
-                    # Hide key_levels widgets if no data
-                    if 'key_levels_title' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['key_levels_title'].pack_forget()
-                    if 'key_levels_text' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['key_levels_text'].pack_forget()
-                
-                # Update suggestion text if available (only show if not null/empty)
-                suggestion_value = llm_data.get('suggestion', '')
-                if suggestion_value and suggestion_value.strip() and suggestion_value.lower() != 'null':
-                    if 'suggestion_title' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['suggestion_title'].pack(anchor="w", pady=(10, 5))
-                    if 'suggestion_text' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['suggestion_text'].config(state=tk.NORMAL)
-                        DASHBOARD_WIDGETS['suggestion_text'].delete(1.0, tk.END)
-                        DASHBOARD_WIDGETS['suggestion_text'].insert(1.0, suggestion_value)
-                        DASHBOARD_WIDGETS['suggestion_text'].config(state=tk.DISABLED)
-                        DASHBOARD_WIDGETS['suggestion_text'].pack(fill="x", pady=5)
-                else:
-                    # Hide suggestion widgets if no data
-                    if 'suggestion_title' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['suggestion_title'].pack_forget()
-                    if 'suggestion_text' in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS['suggestion_text'].pack_forget()
-                
-                # Market Context temporarily hidden
-                # if 'context_text' in DASHBOARD_WIDGETS:
-                #     DASHBOARD_WIDGETS['context_text'].config(state=tk.NORMAL)
-                #     DASHBOARD_WIDGETS['context_text'].delete(1.0, tk.END)
-                #     DASHBOARD_WIDGETS['context_text'].insert(1.0, llm_data.get('context', 'N/A'))
-                #     DASHBOARD_WIDGETS['context_text'].config(state=tk.DISABLED)
-                
-                # Hide no-data label when LLM data exists
-                if 'no_llm_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['no_llm_label'].pack_forget()
-            else:
-                # Hide LLM widgets, show no-data label (context temporarily hidden)
-                for key in ['action_label', 'time_frame', 'target_label_llm', 'stop_label_llm', 'confidence_label', 
-                           'reasoning_title', 'reasoning_text', 'waiting_for_title', 'waiting_for_text',
-                           'key_levels_title', 'key_levels_text', 'suggestion_title', 'suggestion_text']:
-                    if key in DASHBOARD_WIDGETS:
-                        DASHBOARD_WIDGETS[key].pack_forget()
-                if 'no_llm_label' in DASHBOARD_WIDGETS:
-                    DASHBOARD_WIDGETS['no_llm_label'].pack(pady=20)
-            
-            # Update clock
-            if 'clock_label' in DASHBOARD_WIDGETS:
-                current_time = datetime.datetime.now().strftime("%H:%M:%S")
-                DASHBOARD_WIDGETS['clock_label'].config(text=current_time)
-            
-            return  # Exit after updating existing widgets
-        
-        # INITIAL BUILD - Create all widgets from scratch
-        # Clear any existing widgets
-        for widget in dashboard.winfo_children():
-            widget.destroy()
-        DASHBOARD_WIDGETS.clear()
-        
-        # Title bar with clock
-        title_frame = tk.Frame(dashboard, bg='#1e1e1e')
-        title_frame.pack(fill="x", pady=10)
-        
-        # Title (centered)
-        title = tk.Label(title_frame, text="ES TRADER DASHBOARD", font=("Arial", 20, "bold"), 
-                        bg='#1e1e1e', fg='#00ff00')
-        title.pack(side="left", expand=True)
-        
-        # Clock (top right)
-        clock_label = tk.Label(title_frame, text="", font=("Arial", 14), 
-                              bg='#1e1e1e', fg='#00aaff', padx=20)
-        clock_label.pack(side="right")
-        DASHBOARD_WIDGETS['clock_label'] = clock_label
-        
-        # Account Section
-        account_frame = tk.LabelFrame(dashboard, text="Account Status", font=("Arial", 12, "bold"),
-                                     bg='#2d2d2d', fg='#ffffff', padx=10, pady=10)
-        account_frame.pack(fill="x", padx=20, pady=10)
-        
-        # Balance and RPL on same line
-        balance_rpl_frame = tk.Frame(account_frame, bg='#2d2d2d')
-        balance_rpl_frame.pack(anchor="w")
-        
-        balance_label = tk.Label(balance_rpl_frame, text=f"Balance: {balance}", 
-                                font=("Arial", 14), bg='#2d2d2d', fg='#00ff00')
-        balance_label.pack(side="left")
-        DASHBOARD_WIDGETS['balance_label'] = balance_label
-        
-        # Session RPL (displayed next to balance with 50px spacing)
-        if SESSION_START_BALANCE is not None:
-            rpl_color = '#00ff00' if CURRENT_RPL >= 0 else '#ff4444'
-            rpl_text = f"${CURRENT_RPL:+,.2f}"
-            session_start_text = f"${SESSION_START_BALANCE:,.2f}"
+        if is_initial_build:
+            build_dashboard(dashboard, trade_info, llm_data)
         else:
-            # Initial state before first balance query
-            rpl_color = '#aaaaaa'
-            rpl_text = "$0.00"
-            session_start_text = "N/A"
-        
-        session_rpl_label = tk.Label(balance_rpl_frame, text=rpl_text,
-                                    font=("Arial", 14, "bold"), bg='#2d2d2d', fg=rpl_color)
-        session_rpl_label.pack(side="left", padx=(20, 0))
-        DASHBOARD_WIDGETS['session_rpl_label'] = session_rpl_label
-        
-        # Session start label hidden for cleaner UI
-        # session_start_label = tk.Label(account_frame, text=f"Session Start (18:00): {session_start_text}",
-        #                               font=("Arial", 11), bg='#2d2d2d', fg='#aaaaaa')
-        # session_start_label.pack(anchor="w", pady=(5, 0))
-        # DASHBOARD_WIDGETS['session_start_label'] = session_start_label
-        
-        # Position Section
-        position_frame = tk.LabelFrame(dashboard, text="Current Position", font=("Arial", 12, "bold"),
-                                      bg='#2d2d2d', fg='#ffffff', padx=10, pady=10)
-        position_frame.pack(fill="x", padx=20, pady=10)
-        
-        # Create position labels (shown/hidden based on state)
-        position_label = tk.Label(position_frame, text="", font=("Arial", 14, "bold"), bg='#2d2d2d')
-        entry_price_label = tk.Label(position_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#ffffff')
-        stop_loss_label = tk.Label(position_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#ff6666')
-        price_target_label = tk.Label(position_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#66ff66')
-        order_id_label = tk.Label(position_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#aaaaaa')
-        no_position_label = tk.Label(position_frame, text="No Active Position", 
-                                     font=("Arial", 14), bg='#2d2d2d', fg='#888888')
-        
-        DASHBOARD_WIDGETS['position_label'] = position_label
-        DASHBOARD_WIDGETS['entry_price_label'] = entry_price_label
-        DASHBOARD_WIDGETS['stop_loss_label'] = stop_loss_label
-        DASHBOARD_WIDGETS['price_target_label'] = price_target_label
-        DASHBOARD_WIDGETS['order_id_label'] = order_id_label
-        DASHBOARD_WIDGETS['no_position_label'] = no_position_label
+            refresh_dashboard(trade_info, llm_data)
         
-        if trade_info:
-            position_type = trade_info.get('position_type', 'None').upper()
-            entry_price = trade_info.get('entry_price', 'N/A')
-            stop_loss = trade_info.get('stop_loss', 'N/A')
-            price_target = trade_info.get('price_target', 'N/A')
-            order_id = trade_info.get('order_id', 'N/A')
-            size = trade_info.get('size', '')
-            pos_color = '#00ff00' if position_type == 'LONG' else '#ff4444'
-            
-            # Show position type with size in parentheses
-            position_text = f"Position: {position_type}"
-            if size:
-                position_text += f" ({size})"
-            
-            position_label.config(text=position_text, fg=pos_color)
-            entry_price_label.config(text=f"Entry Price: {entry_price}")
-            stop_loss_label.config(text=f"Stop Loss: {stop_loss}")
-            price_target_label.config(text=f"Take Profit: {price_target}")
-            order_id_label.config(text=f"Order ID: {order_id}")
-            
-            position_label.pack(anchor="w")
-            entry_price_label.pack(anchor="w")
-            stop_loss_label.pack(anchor="w")
-            price_target_label.pack(anchor="w")
-            order_id_label.pack(anchor="w")
+    except Exception as e:
+        logging.error(f"Error showing dashboard: {e}")
+        logging.exception("Full traceback:")
+
+def refresh_dashboard(trade_info, llm_data):
+    """Update the existing dashboard widgets in place (must be called from main thread).
+    
+    Only widgets whose displayed text/color/visibility changed are touched.
+    """
+    dashboard = DASHBOARD_WINDOW
+    
+    # Nothing observable changed since the last refresh - only the clock needs updating
+    fingerprint = _dashboard_fingerprint(trade_info, llm_data)
+    last_fingerprint = getattr(dashboard, '_dashboard_fingerprint', None)
+    if (last_fingerprint is not None and last_fingerprint[0] is llm_data and last_fingerprint[1] is trade_info
+            and last_fingerprint[2:] == fingerprint[2:]):
+        clock_label = DASHBOARD_WIDGETS.get('clock_label')
+        if clock_label:
+            _set_clock_label(clock_label)
+        return
+    dashboard._dashboard_fingerprint = fingerprint
+    
+    # Queue the widget option writes and apply them together in one idle callback
+    _DASHBOARD_BATCH['ops'] = []
+    try:
+        _refresh_dashboard_sections(trade_info, llm_data)
+    finally:
+        ops = _DASHBOARD_BATCH['ops']
+        _DASHBOARD_BATCH['ops'] = None
+        if ops:
+            dashboard.after_idle(_apply_widget_updates, ops)
+    
+    # Update clock
+    clock_label = DASHBOARD_WIDGETS.get('clock_label')
+    if clock_label:
+        _set_clock_label(clock_label)
+
+def _refresh_dashboard_sections(trade_info, llm_data):
+    """Update the account, position and LLM sections for refresh_dashboard()."""
+    # Update balance
+    balance = "N/A"
+    if ACCOUNT_BALANCE is not None:
+        balance = f"${ACCOUNT_BALANCE:,.2f}"
+    _config_widget('balance_label', text=f"Balance: {balance}")
+    
+    # Update session RPL (always update, even if 0 or None)
+    if SESSION_START_BALANCE is not None:
+        rpl_color = '#00ff00' if CURRENT_RPL >= 0 else '#ff4444'
+        rpl_text = f"${CURRENT_RPL:+,.2f}"
+        session_start_text = f"${SESSION_START_BALANCE:,.2f}"
+    else:
+        rpl_color = '#aaaaaa'
+        rpl_text = "$0.00"
+        session_start_text = "N/A"
+    
+    _config_widget('session_rpl_label', text=rpl_text, fg=rpl_color)
+    # Session start label hidden for cleaner UI
+    # _config_widget('session_start_label', text=f"Session Start (18:00): {session_start_text}")
+    
+    # Unpack trade info once; actual_stop/actual_target are reused for the LLM price display
+    actual_stop = None
+    actual_target = None
+    
+    # Update position info
+    if trade_info:
+        trade_get = trade_info.get
+        actual_stop = trade_get('stop_loss')
+        actual_target = trade_get('price_target')
+        position_type = trade_get('position_type', 'None').upper()
+        entry_price = trade_get('entry_price', 'N/A')
+        stop_loss = actual_stop if 'stop_loss' in trade_info else 'N/A'
+        price_target = actual_target if 'price_target' in trade_info else 'N/A'
+        order_id = trade_get('order_id', 'N/A')
+        size = trade_get('size', '')
+        pos_color = _POSITION_COLORS.get(position_type, '#888888')
+        
+        # Show position type with size in parentheses
+        position_text = f"Position: {position_type}"
+        if size:
+            position_text += f" ({size})"
+        
+        _config_widget('position_label', text=position_text, fg=pos_color)
+        _config_widget('entry_price_label', text=f"Entry Price: {entry_price}")
+        _config_widget('stop_loss_label', text=f"Stop Loss: {stop_loss}")
+        _config_widget('price_target_label', text=f"Take Profit: {price_target}")
+        _config_widget('order_id_label', text=f"Order ID: {order_id}")
+        
+        # Show position labels, hide no-position label
+        if _DASHBOARD_MODES.get('position') != 'active':
+            for key in _POSITION_WIDGET_KEYS:
+                _pack_widget(key, anchor="w")
+            _forget_widget('no_position_label')
+            _DASHBOARD_MODES['position'] = 'active'
+    elif _DASHBOARD_MODES.get('position') != 'empty':
+        # Hide position labels, show no-position label
+        for key in _POSITION_WIDGET_KEYS:
+            _forget_widget(key)
+        _pack_widget('no_position_label', anchor="w")
+        _DASHBOARD_MODES['position'] = 'empty'
+    
+    # Update LLM data
+    if llm_data:
+        # Hide no-data label when LLM data exists
+        if _DASHBOARD_MODES.get('llm') != 'active':
+            _forget_widget('no_llm_label')
+            _DASHBOARD_MODES['llm'] = 'active'
+        
+        action = llm_data.get('action', 'N/A').upper()
+        action_color = _ACTION_COLORS.get(action, '#ffffff')
+        
+        _config_widget('action_label', text=f"Action: {action}", fg=action_color)
+        _pack_widget('action_label', anchor="w", pady=5)
+        _config_widget('timestamp_label', text=f"Time: {llm_data.get('date_time', 'N/A')}")
+        _pack_widget('timestamp_label', side="left")
+        _pack_widget('countdown_label', side="left", padx=10)
+        _pack_widget('time_frame', anchor="w")
+        
+        # Update prices
+        # Debug logging
+        logging.debug("Dashboard price display - LLM: Target=%s, Stop=%s", llm_data.get('price_target'), llm_data.get('stop_loss'))
+        logging.debug("Dashboard price display - Actual: Target=%s, Stop=%s", actual_target, actual_stop)
+        
+        target_value = actual_target if actual_target else llm_data.get('price_target')
+        if target_value:
+            target_text = _PRICE_LABEL_FORMATS[('target', bool(actual_target))].format(target_value)
+            _config_widget('target_label_llm', text=target_text)
+            _pack_widget('target_label_llm', anchor="w")
+        else:
+            _config_widget('target_label_llm', text="")
+            _forget_widget('target_label_llm')
+        
+        stop_value = actual_stop if actual_stop else llm_data.get('stop_loss')
+        if stop_value:
+            stop_text = _PRICE_LABEL_FORMATS[('stop', bool(actual_stop))].format(stop_value)
+            _config_widget('stop_label_llm', text=stop_text)
+            _pack_widget('stop_label_llm', anchor="w")
         else:
-            no_position_label.pack(anchor="w")
+            _config_widget('stop_label_llm', text="")
+            _forget_widget('stop_label_llm')
         
-        # LLM Analysis Section
-        llm_frame = tk.LabelFrame(dashboard, text="Latest LLM Analysis", font=("Arial", 12, "bold"),
-                                 bg='#2d2d2d', fg='#ffffff', padx=10, pady=10)
-        llm_frame.pack(fill="both", expand=True, padx=20, pady=10)
-        
-        # Create LLM widgets (shown/hidden based on data availability)
-        action_label = tk.Label(llm_frame, text="", font=("Arial", 14, "bold"), bg='#2d2d2d')
-        
-        # Timestamp and countdown on same line
-        time_frame = tk.Frame(llm_frame, bg='#2d2d2d')
-        timestamp_label = tk.Label(time_frame, text="", font=("Arial", 10), bg='#2d2d2d', fg='#aaaaaa')
-        countdown_label = tk.Label(time_frame, text="", font=("Arial", 10), bg='#2d2d2d', fg='#00ff00')
-        
-        target_label_llm = tk.Label(llm_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#00ff00')
-        stop_label_llm = tk.Label(llm_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#ff4444')
-        confidence_label = tk.Label(llm_frame, text="", font=("Arial", 11), bg='#2d2d2d', fg='#ffaa00')
-        reasoning_title = tk.Label(llm_frame, text="Reasoning:", font=("Arial", 11, "bold"), bg='#2d2d2d', fg='#ffffff')
-        reasoning_text = tk.Text(llm_frame, height=6, wrap=tk.WORD, font=("Arial", 10),
-                                bg='#2d2d2d', fg='#ffffff', relief=tk.FLAT)
-        waiting_for_title = tk.Label(llm_frame, text="Waiting For:", font=("Arial", 11, "bold"), bg='#2d2d2d', fg='#ffffff')
-        waiting_for_text = tk.Text(llm_frame, height=2, wrap=tk.WORD, font=("Arial", 10),
-                                   bg='#2d2d2d', fg='#ffaa00', relief=tk.FLAT)
-        key_levels_title = tk.Label(llm_frame, text="Key Levels:", font=("Arial", 11, "bold"), bg='#2d2d2d', fg='#ffffff')
-        key_levels_text = tk.Text(llm_frame, height=4, wrap=tk.WORD, font=("Arial", 10),
-                                  bg='#2d2d2d', fg='#00aaff', relief=tk.FLAT)
-        suggestion_title = tk.Label(llm_frame, text="💡 Suggestion:", font=("Arial", 11, "bold"), bg='#2d2d2d', fg='#ffffff')
-        suggestion_text = tk.Text(llm_frame, height=2, wrap=tk.WORD, font=("Arial", 10),
-                                  bg='#2d2d2d', fg='#ff66ff', relief=tk.FLAT)
-        context_title = tk.Label(llm_frame, text="Market Context:", font=("Arial", 11, "bold"), bg='#2d2d2d', fg='#ffffff')
-        context_text = tk.Text(llm_frame, height=4, wrap=tk.WORD, font=("Arial", 10),
-                              bg='#1e1e1e', fg='#aaaaaa', relief=tk.FLAT)
-        no_llm_label = tk.Label(llm_frame, text="No LLM data available yet", 
-                               font=("Arial", 12), bg='#2d2d2d', fg='#888888')
-        
-        DASHBOARD_WIDGETS['action_label'] = action_label
-        DASHBOARD_WIDGETS['time_frame'] = time_frame
-        DASHBOARD_WIDGETS['timestamp_label'] = timestamp_label
-        DASHBOARD_WIDGETS['countdown_label'] = countdown_label
-        DASHBOARD_WIDGETS['target_label_llm'] = target_label_llm
-        DASHBOARD_WIDGETS['stop_label_llm'] = stop_label_llm
-        DASHBOARD_WIDGETS['confidence_label'] = confidence_label
-        DASHBOARD_WIDGETS['reasoning_title'] = reasoning_title
-        DASHBOARD_WIDGETS['reasoning_text'] = reasoning_text
-        DASHBOARD_WIDGETS['waiting_for_title'] = waiting_for_title
-        DASHBOARD_WIDGETS['waiting_for_text'] = waiting_for_text
-        DASHBOARD_WIDGETS['key_levels_title'] = key_levels_title
-        DASHBOARD_WIDGETS['key_levels_text'] = key_levels_text
-        DASHBOARD_WIDGETS['suggestion_title'] = suggestion_title
-        DASHBOARD_WIDGETS['suggestion_text'] = suggestion_text
-        DASHBOARD_WIDGETS['context_title'] = context_title
-        DASHBOARD_WIDGETS['context_text'] = context_text
-        DASHBOARD_WIDGETS['no_llm_label'] = no_llm_label
-        
-        if llm_data:
-            action = llm_data.get('action', 'N/A').upper()
-            action_colors = {
-                'BUY': '#00ff00', 'SELL': '#ff4444', 'HOLD': '#ffaa00',
-                'CLOSE': '#ff4444', 'ADJUST': '#00aaff', 'SCALE': '#ffaa00'
-            }
-            action_color = action_colors.get(action, '#ffffff')
-            
-            action_label.config(text=f"Action: {action}", fg=action_color)
-            action_label.pack(anchor="w", pady=5)
-            
-            timestamp_label.config(text=f"Time: {llm_data.get('date_time', 'N/A')}")
-            timestamp_label.pack(side="left")
-            
-            # Countdown will be updated by update_countdown()
-            countdown_label.pack(side="left", padx=10)
-            time_frame.pack(anchor="w")
-            
-            # Prices - Entry shown separately, Target (green) and Stop (red)
-            actual_stop = None
-            actual_target = None
-            if trade_info:
-                actual_stop = trade_info.get('stop_loss')
-                actual_target = trade_info.get('price_target')
-            
-            # Debug logging
-            logging.debug(f"Dashboard price display (initial) - LLM: Target={llm_data.get('price_target')}, Stop={llm_data.get('stop_loss')}")
-            logging.debug(f"Dashboard price display (initial) - Actual: Target={actual_target}, Stop={actual_stop}")
-            
-            target_value = actual_target if actual_target else llm_data.get('price_target')
-            if target_value:
-                target_text = f"Target: {target_value}"
-                if actual_target:
-                    target_text += " ✓"
-                target_label_llm.config(text=target_text)
-                target_label_llm.pack(anchor="w")
-            
-            stop_value = actual_stop if actual_stop else llm_data.get('stop_loss')
-            if stop_value:
-                stop_text = f"Stop: {stop_value}"
-                if actual_stop:
-                    stop_text += " ✓"
-                stop_label_llm.config(text=stop_text)
-                stop_label_llm.pack(anchor="w")
-            
-            if llm_data.get('confidence'):
-                confidence_label.config(text=f"Confidence: {llm_data['confidence']}")
-                confidence_label.pack(anchor="w")
-            
-            reasoning_title.pack(anchor="w", pady=(10, 5))
-            reasoning_text.insert(1.0, llm_data.get('reasoning', 'N/A'))
-            reasoning_text.config(state=tk.DISABLED)
-            reasoning_text.pack(fill="x", pady=5)
-            
-            # Waiting For section (if available)
-            waiting_for_value = llm_data.get('waiting_for', '')
-            if waiting_for_value and waiting_for_value.strip():
-                waiting_for_title.pack(anchor="w", pady=(10, 5))
-                waiting_for_text.insert(1.0, waiting_for_value)
-                waiting_for_text.config(state=tk.DISABLED)
-                waiting_for_text.pack(fill="x", pady=5)
-            
-            # Key Levels section (if available)
-            key_levels_value = llm_data.get('key_levels', '')
-            if key_levels_value and key_levels_value.strip():
-                # Format key levels for display
-                try:
-                    if isinstance(key_levels_value, str):
-                        key_levels_json = json.loads(key_levels_value)
-                    else:
-                        key_levels_json = key_levels_value
-                    
-                    if key_levels_json and isinstance(key_levels_json, list):
-                        formatted_levels = []
-                        for level in key_levels_json:
-                            if isinstance(level, dict):
-                                price = level.get('price', 'N/A')
-                                level_type = level.get('type', 'N/A')
-                                reason = level.get('reason', '')
-                                if reason:
-                                    formatted_levels.append(f"{price} ({level_type}): {reason}")
-                                else:
-                                    formatted_levels.append(f"{price} ({level_type})")
-                        
-                        if formatted_levels:
-                            key_levels_title.pack(anchor="w", pady=(10, 5))
-                            key_levels_text.insert(1.0, "\n".join(formatted_levels))
-                            key_levels_text.config(state=tk.DISABLED)
-                            key_levels_text.pack(fill="x", pady=5)
-                except:
-                    pass  # Skip if parsing fails
-            
-            # Display suggestion if present (only show if not null/empty)
-            suggestion_value = llm_data.get('suggestion', '')
-            if suggestion_value and suggestion_value.strip() and suggestion_value.lower() != 'null':
-                suggestion_title.pack(anchor="w", pady=(10, 5))
-                suggestion_text.insert(1.0, suggestion_value)
-                suggestion_text.config(state=tk.DISABLED)
-                suggestion_text.pack(fill="x", pady=5)
-            
-            # Market Context temporarily hidden
-            # context_title.pack(anchor="w", pady=(10, 5))
-            # context_text.insert(1.0, llm_data.get('context', 'N/A'))
-            # context_text.config(state=tk.DISABLED)
-            # context_text.pack(fill="x", pady=5)
+        if llm_data.get('confidence'):
+            _config_widget('confidence_label', text=f"Confidence: {llm_data['confidence']}")
+            _pack_widget('confidence_label', anchor="w")
         else:
-            no_llm_label.pack(pady=20)
-        
-        # Close/Refresh buttons
-        btn_frame = tk.Frame(dashboard, bg='#1e1e1e')
-        btn_frame.pack(pady=10)
-        
-        # Centered refresh button that triggers full screenshot workflow
-        refresh_btn = tk.Button(btn_frame, text="Refresh", 
-                               command=manual_job,
-                               font=("Arial", 11), bg='#006600', fg='#ffffff',
-                               activebackground='#008800', relief=tk.FLAT, padx=20, pady=5)
-        refresh_btn.pack(side="left", padx=5)
-        
-        # Trades history button
-        trades_btn = tk.Button(btn_frame, text="Trades", 
-                              command=show_trades_window,
-                              font=("Arial", 11), bg='#0066aa', fg='#ffffff',
-                              activebackground='#0088cc', relief=tk.FLAT, padx=20, pady=5)
-        trades_btn.pack(side="left", padx=5)
-        
-        # Center the window only on initial build
-        if is_initial_build:
-            dashboard.update_idletasks()
-            width = dashboard.winfo_width()
-            height = dashboard.winfo_height()
-            x = (dashboard.winfo_screenwidth() // 2) - (width // 2)
-            y = (dashboard.winfo_screenheight() // 2) - (height // 2)
-            dashboard.geometry(f'{width}x{height}+{x}+{y}')
-            
-            # Start the clock and countdown updates (only on initial build to avoid multiple timers)
-            update_clock()
-            update_countdown()
+            _config_widget('confidence_label', text="")
+            _forget_widget('confidence_label')
+        
+        _pack_widget('reasoning_title', anchor="w", pady=(10, 5))
+        _set_dashboard_text('reasoning_text', llm_data.get('reasoning', 'N/A'))
+        _pack_widget('reasoning_text', fill="x", pady=5)
+        
+        # Update waiting_for text if available
+        waiting_for_value = _optional_dashboard_text(llm_data.get('waiting_for', ''))
+        if waiting_for_value:
+            _pack_widget('waiting_for_title', anchor="w", pady=(10, 5))
+            _set_dashboard_text('waiting_for_text', waiting_for_value)
+            _pack_widget('waiting_for_text', fill="x", pady=5)
+        else:
+            # Hide waiting_for widgets if no data
+            _forget_widget('waiting_for_title')
+            _forget_widget('waiting_for_text')
+        
+        # Update key_levels text if available
+        key_levels_value = llm_data.get('key_levels', '')
+        if key_levels_value and key_levels_value.strip():
+            # Format key levels for display ('' if the JSON is invalid)
+            formatted_levels = format_key_levels_for_dashboard(key_levels_value)
+            
+            if formatted_levels:
+                _pack_widget('key_levels_title', anchor="w", pady=(10, 5))
+                _set_dashboard_text('key_levels_text', formatted_levels)
+                _pack_widget('key_levels_text', fill="x", pady=5)
+            else:
+                _forget_widget('key_levels_title')
+                _forget_widget('key_levels_text')
+        else:
+            # Hide key_levels widgets if no data
+            _forget_widget('key_levels_title')
+            _forget_widget('key_levels_text')
+        
+        # Update suggestion text if available (only show if not null/empty)
+        suggestion_value = _optional_dashboard_text(llm_data.get('suggestion', ''))
+        if suggestion_value:
+            _pack_widget('suggestion_title', anchor="w", pady=(10, 5))
+            _set_dashboard_text('suggestion_text', suggestion_value)
+            _pack_widget('suggestion_text', fill="x", pady=5)
+        else:
+            # Hide suggestion widgets if no data
+            _forget_widget('suggestion_title')
+            _forget_widget('suggestion_text')
+        
+        # Market Context temporarily hidden
+        # _set_dashboard_text('context_text', llm_data.get('context', 'N/A'))
+    elif _DASHBOARD_MODES.get('llm') != 'empty':
+        # Hide LLM widgets, show no-data label (context temporarily hidden)
+        for key in _LLM_WIDGET_KEYS:
+            _forget_widget(key)
+        _pack_widget('no_llm_label', pady=20)
+        _DASHBOARD_MODES['llm'] = 'empty'
+
+# Dashboard fonts (family, size[, weight]); Font objects are shared by all widgets of one Tk root
+_DASHBOARD_FONT_SPECS = {
+    'title': ("Arial", 20, "bold"),
+    'large_bold': ("Arial", 14, "bold"),
+    'large': ("Arial", 14),
+    'section': ("Arial", 12, "bold"),
+    'medium': ("Arial", 12),
+    'body_bold': ("Arial", 11, "bold"),
+    'body': ("Arial", 11),
+    'small': ("Arial", 10)
+}
+_DASHBOARD_FONT_CACHE = {'root': None, 'fonts': {}}
+
+def _dashboard_fonts(dashboard):
+    """Return the shared dashboard Font objects, creating them once per Tk root."""
+    if _DASHBOARD_FONT_CACHE['root'] is not dashboard:
+        _DASHBOARD_FONT_CACHE['fonts'] = {
+            name: tkfont.Font(root=dashboard, family=spec[0], size=spec[1],
+                              weight=spec[2] if len(spec) > 2 else 'normal')
+            for name, spec in _DASHBOARD_FONT_SPECS.items()
+        }
+        _DASHBOARD_FONT_CACHE['root'] = dashboard
+    return _DASHBOARD_FONT_CACHE['fonts']
+
+DASHBOARD_SIZE = (650, 850)
+
+def build_dashboard(dashboard, trade_info, llm_data):
+    """Create all dashboard widgets from scratch and start the clock/countdown timers."""
+    dashboard.title("ES Trader Dashboard")
+    dashboard.configure(bg='#1e1e1e')
+    fonts = _dashboard_fonts(dashboard)
+    
+    # Use cached balance or display N/A
+    balance = "N/A"
+    if ACCOUNT_BALANCE is not None:
+        balance = f"${ACCOUNT_BALANCE:,.2f}"
+    
+    dashboard._dashboard_fingerprint = _dashboard_fingerprint(trade_info, llm_data)
+    
+    # Clear any existing widgets
+    for widget in dashboard.winfo_children():
+        widget.destroy()
+    DASHBOARD_WIDGETS.clear()
+    DASHBOARD_STATE.clear()
+    _DASHBOARD_PACKED.clear()
+    _DASHBOARD_MODES['position'] = 'active' if trade_info else 'empty'
+    _DASHBOARD_MODES['llm'] = 'active' if llm_data else 'empty'
+    
+    # Title bar with clock
+    title_frame = tk.Frame(dashboard, bg='#1e1e1e')
+    title_frame.pack(fill="x", pady=10)
+    
+    # Title (centered)
+    title = tk.Label(title_frame, text="ES TRADER DASHBOARD", font=fonts['title'], 
+                    bg='#1e1e1e', fg='#00ff00')
+    title.pack(side="left", expand=True)
+    
+    # Clock (top right)
+    clock_label = tk.Label(title_frame, text="", font=fonts['large'], 
+                          bg='#1e1e1e', fg='#00aaff', padx=20)
+    clock_label.pack(side="right")
+    DASHBOARD_WIDGETS['clock_label'] = clock_label
+    
+    # Account Section
+    account_frame = tk.LabelFrame(dashboard, text="Account Status", font=fonts['section'],
+                                 bg='#2d2d2d', fg='#ffffff', padx=10, pady=10)
+    account_frame.pack(fill="x", padx=20, pady=10)
+    
+    # Balance and RPL on same line
+    balance_rpl_frame = tk.Frame(account_frame, bg='#2d2d2d')
+    balance_rpl_frame.pack(anchor="w")
+    
+    balance_label = tk.Label(balance_rpl_frame, text=f"Balance: {balance}", 
+                            font=fonts['large'], bg='#2d2d2d', fg='#00ff00')
+    balance_label.pack(side="left")
+    DASHBOARD_WIDGETS['balance_label'] = balance_label
+    
+    # Session RPL (displayed next to balance with 50px spacing)
+    if SESSION_START_BALANCE is not None:
+        rpl_color = '#00ff00' if CURRENT_RPL >= 0 else '#ff4444'
+        rpl_text = f"${CURRENT_RPL:+,.2f}"
+        session_start_text = f"${SESSION_START_BALANCE:,.2f}"
+    else:
+        # Initial state before first balance query
+        rpl_color = '#aaaaaa'
+        rpl_text = "$0.00"
+        session_start_text = "N/A"
+    
+    session_rpl_label = tk.Label(balance_rpl_frame, text=rpl_text,
+                                font=fonts['large_bold'], bg='#2d2d2d', fg=rpl_color)
+    session_rpl_label.pack(side="left", padx=(20, 0))
+    DASHBOARD_WIDGETS['session_rpl_label'] = session_rpl_label
+    
+    # Session start label hidden for cleaner UI
+    # session_start_label = tk.Label(account_frame, text=f"Session Start (18:00): {session_start_text}",
+    #                               font=fonts['body'], bg='#2d2d2d', fg='#aaaaaa')
+    # session_start_label.pack(anchor="w", pady=(5, 0))
+    # DASHBOARD_WIDGETS['session_start_label'] = session_start_label
+    
+    # Position Section
+    position_frame = tk.LabelFrame(dashboard, text="Current Position", font=fonts['section'],
+                                  bg='#2d2d2d', fg='#ffffff', padx=10, pady=10)
+    position_frame.pack(fill="x", padx=20, pady=10)
+    
+    # Create position labels (shown/hidden based on state)
+    position_label = tk.Label(position_frame, text="", font=fonts['large_bold'], bg='#2d2d2d')
+    entry_price_label = tk.Label(position_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#ffffff')
+    stop_loss_label = tk.Label(position_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#ff6666')
+    price_target_label = tk.Label(position_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#66ff66')
+    order_id_label = tk.Label(position_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#aaaaaa')
+    no_position_label = tk.Label(position_frame, text="No Active Position", 
+                                 font=fonts['large'], bg='#2d2d2d', fg='#888888')
+    
+    DASHBOARD_WIDGETS['position_label'] = position_label
+    DASHBOARD_WIDGETS['entry_price_label'] = entry_price_label
+    DASHBOARD_WIDGETS['stop_loss_label'] = stop_loss_label
+    DASHBOARD_WIDGETS['price_target_label'] = price_target_label
+    DASHBOARD_WIDGETS['order_id_label'] = order_id_label
+    DASHBOARD_WIDGETS['no_position_label'] = no_position_label
+    
+    if trade_info:
+        position_type = trade_info.get('position_type', 'None').upper()
+        entry_price = trade_info.get('entry_price', 'N/A')
+        stop_loss = trade_info.get('stop_loss', 'N/A')
+        price_target = trade_info.get('price_target', 'N/A')
+        order_id = trade_info.get('order_id', 'N/A')
+        size = trade_info.get('size', '')
+        pos_color = _POSITION_COLORS.get(position_type, '#888888')
+        
+        # Show position type with size in parentheses
+        position_text = f"Position: {position_type}"
+        if size:
+            position_text += f" ({size})"
+        
+        position_label.config(text=position_text, fg=pos_color)
+        entry_price_label.config(text=f"Entry Price: {entry_price}")
+        stop_loss_label.config(text=f"Stop Loss: {stop_loss}")
+        price_target_label.config(text=f"Take Profit: {price_target}")
+        order_id_label.config(text=f"Order ID: {order_id}")
+        
+        position_label.pack(anchor="w")
+        entry_price_label.pack(anchor="w")
+        stop_loss_label.pack(anchor="w")
+        price_target_label.pack(anchor="w")
+        order_id_label.pack(anchor="w")
+    else:
+        no_position_label.pack(anchor="w")
+    
+    # LLM Analysis Section
+    llm_frame = tk.LabelFrame(dashboard, text="Latest LLM Analysis", font=fonts['section'],
+                             bg='#2d2d2d', fg='#ffffff', padx=10, pady=10)
+    llm_frame.pack(fill="both", expand=True, padx=20, pady=10)
+    
+    # Create LLM widgets (shown/hidden based on data availability)
+    action_label = tk.Label(llm_frame, text="", font=fonts['large_bold'], bg='#2d2d2d')
+    
+    # Timestamp and countdown on same line
+    time_frame = tk.Frame(llm_frame, bg='#2d2d2d')
+    timestamp_label = tk.Label(time_frame, text="", font=fonts['small'], bg='#2d2d2d', fg='#aaaaaa')
+    countdown_label = tk.Label(time_frame, text="", font=fonts['small'], bg='#2d2d2d', fg='#00ff00')
+    
+    target_label_llm = tk.Label(llm_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#00ff00')
+    stop_label_llm = tk.Label(llm_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#ff4444')
+    confidence_label = tk.Label(llm_frame, text="", font=fonts['body'], bg='#2d2d2d', fg='#ffaa00')
+    reasoning_title = tk.Label(llm_frame, text="Reasoning:", font=fonts['body_bold'], bg='#2d2d2d', fg='#ffffff')
+    reasoning_text = tk.Text(llm_frame, height=6, wrap=tk.WORD, font=fonts['small'],
+                            bg='#2d2d2d', fg='#ffffff', relief=tk.FLAT)
+    waiting_for_title = tk.Label(llm_frame, text="Waiting For:", font=fonts['body_bold'], bg='#2d2d2d', fg='#ffffff')
+    waiting_for_text = tk.Text(llm_frame, height=2, wrap=tk.WORD, font=fonts['small'],
+                               bg='#2d2d2d', fg='#ffaa00', relief=tk.FLAT)
+    key_levels_title = tk.Label(llm_frame, text="Key Levels:", font=fonts['body_bold'], bg='#2d2d2d', fg='#ffffff')
+    key_levels_text = tk.Text(llm_frame, height=4, wrap=tk.WORD, font=fonts['small'],
+                              bg='#2d2d2d', fg='#00aaff', relief=tk.FLAT)
+    suggestion_title = tk.Label(llm_frame, text="💡 Suggestion:", font=fonts['body_bold'], bg='#2d2d2d', fg='#ffffff')
+    suggestion_text = tk.Text(llm_frame, height=2, wrap=tk.WORD, font=fonts['small'],
+                              bg='#2d2d2d', fg='#ff66ff', relief=tk.FLAT)
+    context_title = tk.Label(llm_frame, text="Market Context:", font=fonts['body_bold'], bg='#2d2d2d', fg='#ffffff')
+    context_text = tk.Text(llm_frame, height=4, wrap=tk.WORD, font=fonts['small'],
+                          bg='#1e1e1e', fg='#aaaaaa', relief=tk.FLAT)
+    no_llm_label = tk.Label(llm_frame, text="No LLM data available yet", 
+                           font=fonts['medium'], bg='#2d2d2d', fg='#888888')
+    
+    DASHBOARD_WIDGETS['action_label'] = action_label
+    DASHBOARD_WIDGETS['time_frame'] = time_frame
+    DASHBOARD_WIDGETS['timestamp_label'] = timestamp_label
+    DASHBOARD_WIDGETS['countdown_label'] = countdown_label
+    DASHBOARD_WIDGETS['target_label_llm'] = target_label_llm
+    DASHBOARD_WIDGETS['stop_label_llm'] = stop_label_llm
+    DASHBOARD_WIDGETS['confidence_label'] = confidence_label
+    DASHBOARD_WIDGETS['reasoning_title'] = reasoning_title
+    DASHBOARD_WIDGETS['reasoning_text'] = reasoning_text
+    DASHBOARD_WIDGETS['waiting_for_title'] = waiting_for_title
+    DASHBOARD_WIDGETS['waiting_for_text'] = waiting_for_text
+    DASHBOARD_WIDGETS['key_levels_title'] = key_levels_title
+    DASHBOARD_WIDGETS['key_levels_text'] = key_levels_text
+    DASHBOARD_WIDGETS['suggestion_title'] = suggestion_title
+    DASHBOARD_WIDGETS['suggestion_text'] = suggestion_text
+    DASHBOARD_WIDGETS['context_title'] = context_title
+    DASHBOARD_WIDGETS['context_text'] = context_text
+    DASHBOARD_WIDGETS['no_llm_label'] = no_llm_label
+    
+    if llm_data:
+        action = llm_data.get('action', 'N/A').upper()
+        action_color = _ACTION_COLORS.get(action, '#ffffff')
+        
+        action_label.config(text=f"Action: {action}", fg=action_color)
+        action_label.pack(anchor="w", pady=5)
+        
+        timestamp_label.config(text=f"Time: {llm_data.get('date_time', 'N/A')}")
+        timestamp_label.pack(side="left")
+        
+        # Countdown will be updated by update_countdown()
+        countdown_label.pack(side="left", padx=10)
+        time_frame.pack(anchor="w")
+        
+        # Prices - Entry shown separately, Target (green) and Stop (red)
+        actual_stop = None
+        actual_target = None
+        if trade_info:
+            actual_stop = trade_info.get('stop_loss')
+            actual_target = trade_info.get('price_target')
         
-    except Exception as e:
-        logging.error(f"Error showing dashboard: {e}")
-        logging.exception("Full traceback:")
+        # Debug logging
+        logging.debug("Dashboard price display (initial) - LLM: Target=%s, Stop=%s", llm_data.get('price_target'), llm_data.get('stop_loss'))
+        logging.debug("Dashboard price display (initial) - Actual: Target=%s, Stop=%s", actual_target, actual_stop)
+        
+        target_value = actual_target if actual_target else llm_data.get('price_target')
+        if target_value:
+            target_text = _PRICE_LABEL_FORMATS[('target', bool(actual_target))].format(target_value)
+            target_label_llm.config(text=target_text)
+            target_label_llm.pack(anchor="w")
+        
+        stop_value = actual_stop if actual_stop else llm_data.get('stop_loss')
+        if stop_value:
+            stop_text = _PRICE_LABEL_FORMATS[('stop', bool(actual_stop))].format(stop_value)
+            stop_label_llm.config(text=stop_text)
+            stop_label_llm.pack(anchor="w")
+        
+        if llm_data.get('confidence'):
+            confidence_label.config(text=f"Confidence: {llm_data['confidence']}")
+            confidence_label.pack(anchor="w")
+        
+        reasoning_title.pack(anchor="w", pady=(10, 5))
+        _set_text_widget(reasoning_text, llm_data.get('reasoning', 'N/A'))
+        reasoning_text.pack(fill="x", pady=5)
+        
+        # Waiting For section (if available)
+        waiting_for_value = _optional_dashboard_text(llm_data.get('waiting_for', ''))
+        if waiting_for_value:
+            waiting_for_title.pack(anchor="w", pady=(10, 5))
+            _set_text_widget(waiting_for_text, waiting_for_value)
+            waiting_for_text.pack(fill="x", pady=5)
+        
+        # Key Levels section (if available)
+        key_levels_value = llm_data.get('key_levels', '')
+        if key_levels_value and key_levels_value.strip():
+            # Format key levels for display ('' if the JSON is invalid)
+            formatted_levels = format_key_levels_for_dashboard(key_levels_value)
+            
+            if formatted_levels:
+                key_levels_title.pack(anchor="w", pady=(10, 5))
+                _set_text_widget(key_levels_text, formatted_levels)
+                key_levels_text.pack(fill="x", pady=5)
+        
+        # Display suggestion if present (only show if not null/empty)
+        suggestion_value = _optional_dashboard_text(llm_data.get('suggestion', ''))
+        if suggestion_value:
+            suggestion_title.pack(anchor="w", pady=(10, 5))
+            _set_text_widget(suggestion_text, suggestion_value)
+            suggestion_text.pack(fill="x", pady=5)
+        
+        # Market Context temporarily hidden
+        # context_title.pack(anchor="w", pady=(10, 5))
+        # _set_text_widget(context_text, llm_data.get('context', 'N/A'))
+        # context_text.pack(fill="x", pady=5)
+    else:
+        no_llm_label.pack(pady=20)
+    
+    # Later text updates go through StringVars rather than label option parsing
+    _bind_dashboard_vars(dashboard)
+    
+    # Close/Refresh buttons
+    btn_frame = tk.Frame(dashboard, bg='#1e1e1e')
+    btn_frame.pack(pady=10)
+    
+    # Centered refresh button that triggers full screenshot workflow
+    refresh_btn = tk.Button(btn_frame, text="Refresh", 
+                           command=manual_job,
+                           font=fonts['body'], bg='#006600', fg='#ffffff',
+                           activebackground='#008800', relief=tk.FLAT, padx=20, pady=5)
+    refresh_btn.pack(side="left", padx=5)
+    
+    # Trades history button
+    trades_btn = tk.Button(btn_frame, text="Trades", 
+                          command=show_trades_window,
+                          font=fonts['body'], bg='#0066aa', fg='#ffffff',
+                          activebackground='#0088cc', relief=tk.FLAT, padx=20, pady=5)
+    trades_btn.pack(side="left", padx=5)
+    
+    # Record which widgets the build left packed so refreshes only pack/forget on transitions
+    _DASHBOARD_PACKED.update(key for key, w in DASHBOARD_WIDGETS.items() if w.winfo_manager())
+    
+    # Size and center the window in a single geometry call (no update_idletasks() measuring pass)
+    width, height = DASHBOARD_SIZE
+    x = (dashboard.winfo_screenwidth() // 2) - (width // 2)
+    y = (dashboard.winfo_screenheight() // 2) - (height // 2)
+    dashboard.geometry(f'{width}x{height}+{x}+{y}')
+    
+    # Refresh once when the window is restored if updates arrived while it was minimized
+    dashboard.bind('<Map>', _on_dashboard_map)
+    
+    # Start the clock and countdown updates (once per window, never from the refresh path)
+    _ensure_timers_started(dashboard)
 
 # ============================================================================
 # TRADES HISTORY WINDOW
@@ -3793,55 +4454,187 @@ def show_trades_window():
         logging.error(f"Error showing trades window: {e}")
         logging.exception("Full traceback:")
 
+# Coalescing state for update_dashboard_data(): at most one refresh is pending at a time,
+# and every request made while it is pending is folded into it
+_REFRESH_STATE = {'pending': False}
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_DEBOUNCE_MS = 250
+# Set when a refresh was skipped because the dashboard was minimized/hidden
+_DASHBOARD_DIRTY = False
+
 def update_dashboard_data():
-    """Update the dashboard with latest data if it exists.
+    """Request a dashboard refresh (fire-and-forget, callable from any thread).
     
-    This function is thread-safe and can be called from any thread.
-    It schedules the update on the Tkinter main thread.
+    The refresh runs on the Tkinter main thread at most _REFRESH_DEBOUNCE_MS later.
+    Calls that arrive while a refresh is already pending return immediately without
+    touching Tk, so bursts (reconcile, LLM response, close) cost a single refresh.
     """
-    global DASHBOARD_WINDOW
-    if DASHBOARD_WINDOW and DASHBOARD_WINDOW.winfo_exists():
-        try:
-            # Schedule the update on the main Tkinter thread (thread-safe)
-            # Using after(0) ensures it runs on the next event loop iteration
+    with _REFRESH_LOCK:
+        if _REFRESH_STATE['pending']:
+            # A trailing refresh is already scheduled and will pick up this change
+            return
+        _REFRESH_STATE['pending'] = True
+    
+    # Tk calls are made outside the lock (they may wait on the main thread)
+    try:
+        if DASHBOARD_WINDOW and DASHBOARD_WINDOW.winfo_exists():
             logging.debug("Scheduling dashboard update on main thread")
-            DASHBOARD_WINDOW.after(0, lambda: _update_dashboard_widgets())
-        except Exception as e:
-            logging.error(f"Error scheduling dashboard update: {e}")
-    else:
+            DASHBOARD_WINDOW.after(_REFRESH_DEBOUNCE_MS, _do_debounced_refresh)
+            return
         logging.debug("Dashboard window not available for update")
+    except Exception as e:
+        logging.error(f"Error scheduling dashboard update: {e}")
+    with _REFRESH_LOCK:
+        _REFRESH_STATE['pending'] = False
+
+def _do_debounced_refresh():
+    """Run the pending dashboard refresh scheduled by update_dashboard_data()."""
+    with _REFRESH_LOCK:
+        _REFRESH_STATE['pending'] = False
+    _update_dashboard_widgets()
 
 def _update_dashboard_widgets():
-    """Internal function to update dashboard widgets (must be called from main thread)."""
-    global DASHBOARD_WINDOW
+    """Internal function to update dashboard widgets (must be called from main thread).
+    
+    While the window is minimized or hidden the refresh is deferred; _on_dashboard_map()
+    runs it once when the window is shown again.
+    """
+    global DASHBOARD_WINDOW, _DASHBOARD_DIRTY
     try:
+        if DASHBOARD_WINDOW.state() == 'iconic' or not DASHBOARD_WINDOW.winfo_viewable():
+            _DASHBOARD_DIRTY = True
+            return
+        _DASHBOARD_DIRTY = False
         logging.debug("Updating dashboard widgets")
-        # Refresh the dashboard
-        show_dashboard(DASHBOARD_WINDOW)
+        # Refresh the existing widgets in place (the window was built by show_dashboard)
+        refresh_dashboard(get_active_trade_info(), get_latest_llm_data())
         # Force immediate GUI update
         DASHBOARD_WINDOW.update_idletasks()
         logging.debug("Dashboard widgets updated successfully")
     except Exception as e:
         logging.error(f"Error updating dashboard widgets: {e}")
 
+def _on_dashboard_map(event):
+    """Catch up on refreshes skipped while the dashboard was minimized/hidden."""
+    if event.widget is DASHBOARD_WINDOW and _DASHBOARD_DIRTY:
+        _update_dashboard_widgets()
+
+# Last second rendered on the dashboard clock and the label it was rendered to
+_CLOCK_CACHE = {'second': None, 'label': None}
+
+def _set_clock_label(clock_label):
+    """Show the current time (HH:MM:SS) on the clock label, at most once per second."""
+    now = time.time()
+    second = int(now)
+    if second == _CLOCK_CACHE['second'] and clock_label is _CLOCK_CACHE['label']:
+        return
+    clock_label.config(text=time.strftime("%H:%M:%S", time.localtime(now)))
+    _CLOCK_CACHE['second'] = second
+    _CLOCK_CACHE['label'] = clock_label
+
+# Tk root whose clock/countdown after() chains are running
+_TIMERS_STARTED = {'root': None}
+
+def _ensure_timers_started(root):
+    """Start the 1-second clock and countdown timers for this window exactly once.
+    
+    Rebuilding the dashboard on the same window must not start a second
+    after(1000, ...) chain, which would double the timer work on every tick.
+    """
+    if _TIMERS_STARTED['root'] is root:
+        return
+    _TIMERS_STARTED['root'] = root
+    update_clock()
+    update_countdown()
+
 def update_clock():
     """Update the clock label with current time (HH:MM:SS)."""
     global DASHBOARD_WINDOW, DASHBOARD_WIDGETS
     if DASHBOARD_WINDOW and DASHBOARD_WINDOW.winfo_exists() and 'clock_label' in DASHBOARD_WIDGETS:
         try:
-            current_time = datetime.datetime.now().strftime("%H:%M:%S")
-            DASHBOARD_WIDGETS['clock_label'].config(text=current_time)
+            _set_clock_label(DASHBOARD_WIDGETS['clock_label'])
             # Schedule next update in 1 second
             DASHBOARD_WINDOW.after(1000, update_clock)
         except Exception as e:
-            logging.debug(f"Error updating clock: {e}")
+            logging.debug("Error updating clock: %s", e)
     else:
         logging.debug("Dashboard window or clock widget not available")
 
+# Last disabled-interval result and when it expires (see _cached_disabled_interval)
+_DISABLED_INTERVAL_CACHE = {'schedule': None, 'until': None, 'next_active_time': None}
+
+def _cached_disabled_interval(interval_schedule_str):
+    """is_in_disabled_interval() for the 1 Hz countdown, reusing a disabled result until it expires.
+    
+    Once we know screenshots are disabled until next_active_time, that answer holds until
+    the clock reaches it (or the schedule changes), so the schedule isn't re-parsed every tick.
+    """
+    cache = _DISABLED_INTERVAL_CACHE
+    now = datetime.datetime.now()
+    if cache['schedule'] == interval_schedule_str and cache['until'] is not None and now < cache['until']:
+        return (True, cache['next_active_time'])
+    
+    in_disabled, next_active_time = is_in_disabled_interval(interval_schedule_str)
+    if in_disabled and next_active_time:
+        until = datetime.datetime.combine(now.date(), next_active_time)
+        if until <= now:
+            until += datetime.timedelta(days=1)  # Next active period starts tomorrow
+        cache.update({'schedule': interval_schedule_str, 'until': until, 'next_active_time': next_active_time})
+    else:
+        cache.update({'schedule': None, 'until': None, 'next_active_time': None})
+    return (in_disabled, next_active_time)
+
+def _compute_countdown_state(now, last_job_time, interval_schedule_str):
+    """Work out what the countdown label should show (excluding economic event windows).
+    
+    Returns:
+        tuple: (state, payload) - one of ('counting', remaining_seconds),
+               ('disabled_until', next_active_time), ('disabled', None),
+               ('waiting_until', next_active_time) or ('waiting', None)
+    """
+    if last_job_time is None:
+        # No job has run yet - check if waiting for next active interval
+        in_disabled, next_active_time = _cached_disabled_interval(interval_schedule_str)
+        if in_disabled and next_active_time:
+            return ('waiting_until', next_active_time)
+        return ('waiting', None)
+    
+    current_interval = get_current_interval()
+    if current_interval == -1:
+        # In a disabled interval - show next active time if there is one
+        in_disabled, next_active_time = _cached_disabled_interval(interval_schedule_str)
+        if in_disabled and next_active_time:
+            return ('disabled_until', next_active_time)
+        return ('disabled', None)
+    
+    # Calculate seconds since last job
+    elapsed = (now - last_job_time).total_seconds()
+    return ('counting', max(0, int(current_interval - elapsed)))
+
+def _render_countdown_state(state, payload):
+    """Map a _compute_countdown_state() result to the countdown label's (text, color)."""
+    if state == 'counting':
+        # Color based on urgency
+        if payload <= 5:
+            color = '#ff4444'  # Red - imminent
+        elif payload <= 15:
+            color = '#ffaa00'  # Orange - soon
+        else:
+            color = '#00ff00'  # Green - plenty of time
+        return (f"{payload}s", color)
+    if state == 'disabled_until':
+        return (f"[Waiting until {payload.strftime('%H:%M')}]", '#888888')
+    if state == 'disabled':
+        return ("[Screenshots disabled]", '#888888')
+    if state == 'waiting_until':
+        return (f"[Waiting until {payload.strftime('%H:%M')}]", '#aaaaaa')
+    return ("[Waiting...]", '#aaaaaa')
+
 def update_countdown():
     """Update the countdown label showing seconds until next screenshot."""
     global DASHBOARD_WINDOW, DASHBOARD_WIDGETS, LAST_JOB_TIME, INTERVAL_SCHEDULE
-    if DASHBOARD_WINDOW and DASHBOARD_WINDOW.winfo_exists() and 'countdown_label' in DASHBOARD_WIDGETS:
+    # All label writes go through _config_widget, which skips text/color that is unchanged
+    if DASHBOARD_WINDOW and DASHBOARD_WINDOW.winfo_exists() and DASHBOARD_WIDGETS.get('countdown_label') is not None:
         try:
             # First check if we're in an economic event window (highest priority display)
             in_event_window, active_events = is_in_economic_event_window()
@@ -3890,55 +4683,19 @@ def update_countdown():
                 else:
                     color = '#ffff00'  # Yellow
                 
-                DASHBOARD_WIDGETS['countdown_label'].config(
+                _config_widget('countdown_label',
                     text=status_text,
                     fg=color
                 )
-            elif LAST_JOB_TIME is not None:
-                current_interval = get_current_interval()
-                
-                # Check if in disabled interval and show next active time
-                if current_interval == -1:
-                    in_disabled, next_active_time = is_in_disabled_interval(INTERVAL_SCHEDULE)
-                    if in_disabled and next_active_time:
-                        DASHBOARD_WIDGETS['countdown_label'].config(
-                            text=f"[Waiting until {next_active_time.strftime('%H:%M')}]", 
-                            fg='#888888'
-                        )
-                    else:
-                        DASHBOARD_WIDGETS['countdown_label'].config(text="[Screenshots disabled]", fg='#888888')
-                else:
-                    # Calculate seconds since last job
-                    elapsed = (datetime.datetime.now() - LAST_JOB_TIME).total_seconds()
-                    remaining = max(0, int(current_interval - elapsed))
-                    
-                    # Color based on urgency
-                    if remaining <= 5:
-                        color = '#ff4444'  # Red - imminent
-                    elif remaining <= 15:
-                        color = '#ffaa00'  # Orange - soon
-                    else:
-                        color = '#00ff00'  # Green - plenty of time
-                    
-                    DASHBOARD_WIDGETS['countdown_label'].config(
-                        text=f"{remaining}s", 
-                        fg=color
-                    )
             else:
-                # Check if waiting for next active interval
-                in_disabled, next_active_time = is_in_disabled_interval(INTERVAL_SCHEDULE)
-                if in_disabled and next_active_time:
-                    DASHBOARD_WIDGETS['countdown_label'].config(
-                        text=f"[Waiting until {next_active_time.strftime('%H:%M')}]", 
-                        fg='#aaaaaa'
-                    )
-                else:
-                    DASHBOARD_WIDGETS['countdown_label'].config(text="[Waiting...]", fg='#aaaaaa')
+                state, payload = _compute_countdown_state(datetime.datetime.now(), LAST_JOB_TIME, INTERVAL_SCHEDULE)
+                text, color = _render_countdown_state(state, payload)
+                _config_widget('countdown_label', text=text, fg=color)
             
             # Schedule next update in 1 second
             DASHBOARD_WINDOW.after(1000, update_countdown)
         except Exception as e:
-            logging.debug(f"Error updating countdown: {e}")
+            logging.debug("Error updating countdown: %s", e)
     else:
         logging.debug("Dashboard window or countdown widget not available")
 
@@ -4060,17 +4817,16 @@ def is_in_economic_event_window():
                 return _ECONOMIC_EVENT_CACHE['in_window'], _ECONOMIC_EVENT_CACHE['events']
         
         # Need to refresh cache
-        if not CONFIG.has_section('EconomicCalendar') or not CONFIG.getboolean('EconomicCalendar', 'enable_economic_calendar', fallback=False):
+        if not ECONOMIC_CALENDAR_CONFIG['enabled']:
             _ECONOMIC_EVENT_CACHE['last_check'] = now
             _ECONOMIC_EVENT_CACHE['in_window'] = False
             _ECONOMIC_EVENT_CACHE['events'] = []
             return False, []
         
-        calendar_file = CONFIG.get('EconomicCalendar', 'data_file', fallback='market_data/economic_calendar.json')
-        minutes_before = CONFIG.getint('EconomicCalendar', 'minutes_before_event', fallback=15)
-        minutes_after = CONFIG.getint('EconomicCalendar', 'minutes_after_event', fallback=15)
-        severity_threshold_str = CONFIG.get('EconomicCalendar', 'severity_threshold', fallback='High,Medium')
-        severity_filter = [s.strip() for s in severity_threshold_str.split(',')]
+        calendar_file = ECONOMIC_CALENDAR_CONFIG['data_file']
+        minutes_before = ECONOMIC_CALENDAR_CONFIG['minutes_before']
+        minutes_after = ECONOMIC_CALENDAR_CONFIG['minutes_after']
+        severity_filter = list(ECONOMIC_CALENDAR_CONFIG['severity_filter'])
         
         # Get upcoming events within the window
         upcoming_events = economic_calendar.get_upcoming_events(
@@ -4123,6 +4879,22 @@ def is_in_economic_event_window():
         return False, []
 
 
+@functools.lru_cache(maxsize=1)
+def _load_upcoming_events_cached(minute_bucket, calendar_file, minutes_before, minutes_after, severity_filter):
+    """Upcoming economic events for job(), loaded at most once per wall-clock minute.
+    
+    minute_bucket is int(time.time() // 60); it only serves as the cache key.
+    """
+    return economic_calendar.get_upcoming_events(
+        calendar_file,
+        minutes_before,
+        minutes_after,
+        list(severity_filter)
+    )
+
+# Reopen time in holiday notes, e.g. "Reopen @ 17:00 CT (18:00 ET)" -> hour, minute, timezone
+_REOPEN_RE = re.compile(r'(?:Reopen|Open)\s+@\s+(\d{1,2}):(\d{2})\s+(CT|ET)', re.IGNORECASE)
+
 def job(window_title, window_process_name, top_offset, bottom_offset, left_offset, right_offset, save_folder, begin_time, end_time, symbol, position_type, no_position_prompt, long_position_prompt, short_position_prompt, runner_prompt, model, topstep_config, enable_llm, enable_trading, openai_api_url, openai_api_key, enable_save_screenshots, auth_token=None, execute_trades=False, telegram_config=None, no_new_trades_windows='', force_close_time='23:59'):
     """The main job to run periodically."""
     global PREVIOUS_POSITION_TYPE, LAST_WAITING_FOR, LAST_KEY_LEVELS
@@ -4138,7 +4910,25 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
             logging.info(f"📅 {reason} - Skipping all operations")
             return
     
-    # Check if we're in any no-new-trades window BEFORE doing anything
+    logging.info(f"Starting job at {time.ctime()}")
+    
+    # Position management prompt lookup ('runners' when only runner contracts remain)
+    position_prompts = {'long': long_position_prompt, 'short': short_position_prompt, 'runners': runner_prompt}
+    
+    # Verify Bookmap is available before the holiday/no-trades checks and any file or API work
+    if window_title:
+        try:
+            hwnd = get_window_by_partial_title(window_title, window_process_name)
+            if not hwnd:
+                logging.warning(f"Bookmap window not found ('{window_title}'{' / process ' + window_process_name if window_process_name else ''}) - skipping all processing for this cycle")
+                return  # Exit early, scheduler will retry on next interval
+            logging.info(f"Bookmap window verified: HWND={hwnd}")
+        except Exception as e:
+            logging.error(f"Error checking for Bookmap window: {e}")
+            logging.warning("Bookmap not available - skipping all processing for this cycle")
+            return  # Exit early, scheduler will retry on next interval
+    
+    # Check if we're in any no-new-trades window (after the Bookmap check, before any file or API work)
     in_no_trades_window, current_window = is_in_no_new_trades_window(no_new_trades_windows)
     
     # Check if today is a market holiday (full close)
@@ -4165,14 +4955,13 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                         reopen_time = None
                         if 'reopen' in notes.lower():
                             # Try to extract reopen time from notes (format: "18:00 ET" or "17:00 CT (18:00 ET)")
-                            import re
                             # Look for time in format HH:MM after "Reopen" or "Open @"
-                            match = re.search(r'(?:Reopen|Open)\s+@\s+(\d{1,2}):(\d{2})\s+(?:CT|ET)', notes, re.IGNORECASE)
+                            match = _REOPEN_RE.search(notes)
                             if match:
                                 hour = int(match.group(1))
                                 minute = int(match.group(2))
                                 # If it says CT, convert to ET
-                                if 'CT' in match.group(0):
+                                if match.group(3).upper() == 'CT':
                                     hour += 1  # CT to ET conversion
                                 reopen_time = datetime.time(hour, minute)
                                 logging.info(f"ℹ️  Detected Trading Halt with reopen at {reopen_time.strftime('%H:%M')} ET")
@@ -4206,13 +4995,12 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
 
     # Check if we're in no-new-trades window BEFORE taking any screenshots or querying positions
     # (except if we have an active position that needs force closing)
+    force_close = _parse_hhmm(force_close_time)
     if in_no_trades_window:
         # Check if we have an active position that needs to be force-closed
         trade_info = get_active_trade_info()
         has_active_trade = trade_info and trade_info.get('position_type') in ['long', 'short']
         
-        # Parse force close time
-        force_close = datetime.datetime.strptime(force_close_time, "%H:%M").time()
         current_time = datetime.datetime.now().time()
         
         # Only proceed if we have an active trade AND it's past force close time
@@ -4223,25 +5011,9 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
             logging.info(f"In no-new-trades window '{current_window}' - Skipping all operations (screenshots, analysis, new entries)")
             return
 
-    logging.info(f"Starting job at {time.ctime()}")
-    
-    # First, verify Bookmap is available before doing anything else
-    if window_title:
-        try:
-            hwnd = get_window_by_partial_title(window_title, window_process_name)
-            if not hwnd:
-                logging.warning(f"Bookmap window not found ('{window_title}'{' / process ' + window_process_name if window_process_name else ''}) - skipping all processing for this cycle")
-                return  # Exit early, scheduler will retry on next interval
-            logging.info(f"Bookmap window verified: HWND={hwnd}")
-        except Exception as e:
-            logging.error(f"Error checking for Bookmap window: {e}")
-            logging.warning("Bookmap not available - skipping all processing for this cycle")
-            return  # Exit early, scheduler will retry on next interval
-    
     current_time = datetime.datetime.now().time()
-    begin = datetime.datetime.strptime(begin_time, "%H:%M").time()
-    end = datetime.datetime.strptime(end_time, "%H:%M").time()
-    force_close = datetime.datetime.strptime(force_close_time, "%H:%M").time()
+    begin = _parse_hhmm(begin_time)
+    end = _parse_hhmm(end_time)
     
     # Determine if this is an overnight session (begin_time > end_time, e.g., 18:00 - 05:00)
     is_overnight_session = begin > end
@@ -4252,14 +5024,14 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
     # Load economic calendar and get upcoming events (if enabled)
     upcoming_events = []
     try:
-        if CONFIG.has_section('EconomicCalendar') and CONFIG.getboolean('EconomicCalendar', 'enable_economic_calendar', fallback=False):
-            calendar_file = CONFIG.get('EconomicCalendar', 'data_file', fallback='market_data/economic_calendar.json')
-            minutes_before = CONFIG.getint('EconomicCalendar', 'minutes_before_event', fallback=15)
-            minutes_after = CONFIG.getint('EconomicCalendar', 'minutes_after_event', fallback=15)
-            severity_threshold_str = CONFIG.get('EconomicCalendar', 'severity_threshold', fallback='High,Medium')
-            severity_filter = [s.strip() for s in severity_threshold_str.split(',')]
-            
-            upcoming_events = economic_calendar.get_upcoming_events(
+        if ECONOMIC_CALENDAR_CONFIG['enabled']:
+            calendar_file = ECONOMIC_CALENDAR_CONFIG['data_file']
+            minutes_before = ECONOMIC_CALENDAR_CONFIG['minutes_before']
+            minutes_after = ECONOMIC_CALENDAR_CONFIG['minutes_after']
+            severity_filter = ECONOMIC_CALENDAR_CONFIG['severity_filter']
+            
+            upcoming_events = _load_upcoming_events_cached(
+                int(time.time() // 60),
                 calendar_file,
                 minutes_before,
                 minutes_after,
@@ -4364,8 +5136,7 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                     'save_folder': save_folder,
                     'enable_save_screenshots': enable_save_screenshots
                 }
-                reconcile_closed_trades(topstep_config, enable_trading, auth_token, telegram_config, screenshot_config_for_reconcile)
-                reconcile_supabase_open_trades(topstep_config, enable_trading, auth_token, telegram_config, screenshot_config_for_reconcile)
+                reconcile_all(topstep_config, enable_trading, auth_token, telegram_config, screenshot_config_for_reconcile)
             else:
                 logging.debug("Using position state from recent reconciliation")
             
@@ -4375,6 +5146,7 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
             # Detect if position changed from active to closed
             if PREVIOUS_POSITION_TYPE in ['long', 'short'] and current_position_type == 'none':
                 logging.info(f"Position changed from {PREVIOUS_POSITION_TYPE} to none - Fetching trade results")
+                now = datetime.datetime.now()  # One timestamp for the trade window and the notification
                 trade_info = get_active_trade_info()
                 if trade_info:
                     # Fetch trade results from API
@@ -4383,9 +5155,9 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                         start_time = entry_timestamp
                     else:
                         # Fallback to today's start if no timestamp
-                        start_time = datetime.datetime.now().replace(hour=0, minute=0, second=0).strftime("%Y-%m-%dT%H:%M:%SZ")
+                        start_time = today_midnight_timestamp(now)
                     
-                    end_time = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                    end_time = format_api_timestamp(now)
                     
                     trades = fetch_trade_results(
                         topstep_config['account_id'],
@@ -4397,9 +5169,11 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                     )
                     
                     if trades:
+                        # Fetch the updated balance in the background while the summary is built
+                        balance_future = _PREFETCH_POOL.submit(get_account_balance, topstep_config['account_id'], topstep_config, enable_trading, auth_token)
+                        
                         # Calculate net P&L from all fills
-                        total_pnl = sum(trade.get('profitAndLoss', 0) for trade in trades)
-                        total_fees = sum(trade.get('fees', 0) for trade in trades)
+                        total_pnl, total_fees = sum_trade_pnl_and_fees(trades)
                         net_pnl = total_pnl - total_fees
                         
                         # Get entry price and position details
@@ -4414,17 +5188,28 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                         emoji = "✅" if is_success else "❌"
                         result_text = "PROFIT" if is_success else "LOSS"
                         
-                        logging.info(f"="*80)
-                        logging.info(f"TRADE CLOSED - {result_text}")
-                        logging.info(f"Position: {trade_position_type.upper()}")
-                        logging.info(f"Entry Price: {entry_price}")
-                        logging.info(f"Net P&L: ${net_pnl:.2f} ({pnl_points:+.2f} pts)")
-                        logging.info(f"Fees: ${total_fees:.2f}")
-                        logging.info(f"Total Fills: {len(trades)}")
-                        logging.info(f"="*80)
+                        logging.info(
+                            "%s\nTRADE CLOSED - %s\nPosition: %s\nEntry Price: %s\n"
+                            "Net P&L: $%.2f (%+.2f pts)\nFees: $%.2f\nTotal Fills: %d\n%s",
+                            _RULE80, result_text, trade_position_type.upper(), entry_price,
+                            net_pnl, pnl_points, total_fees, len(trades), _RULE80
+                        )
+                        
+                        # Build Telegram notification (balance is appended once it arrives)
+                        telegram_parts = [
+                            f"{emoji} <b>TRADE CLOSED - {result_text}</b>",
+                            f"Position: {trade_position_type.upper()}",
+                            f"Entry Price: {entry_price}",
+                            f"P&L: ${net_pnl:+,.2f} ({pnl_points:+.2f} pts)",
+                            f"Fees: ${total_fees:.2f}",
+                        ]
                         
                         # Get updated balance
-                        balance = get_account_balance(topstep_config['account_id'], topstep_config, enable_trading, auth_token)
+                        try:
+                            balance = balance_future.result(timeout=5)
+                        except Exception as e:
+                            logging.warning(f"Could not get updated balance for closed position: {e}")
+                            balance = None
                         
                         # Log CLOSE event with actual P&L
                         log_trade_event(
@@ -4443,22 +5228,15 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                         )
                         
                         # Send Telegram notification
-                        telegram_msg = (
-                            f"{emoji} <b>TRADE CLOSED - {result_text}</b>\n"
-                            f"Position: {trade_position_type.upper()}\n"
-                            f"Entry Price: {entry_price}\n"
-                            f"P&L: ${net_pnl:+,.2f} ({pnl_points:+.2f} pts)\n"
-                            f"Fees: ${total_fees:.2f}\n"
-                        )
-                        
                         if balance is not None:
-                            telegram_msg += f"💰 Balance: ${balance:,.2f}\n"
+                            telegram_parts.append(f"💰 Balance: ${balance:,.2f}")
                         
-                        telegram_msg += f"📝 Reason: Position closed - fetched actual results from API\n"
-                        telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                        telegram_parts.append("📝 Reason: Position closed - fetched actual results from API")
+                        telegram_parts.append(f"Time: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+                        telegram_msg = "\n".join(telegram_parts)
                         
-                        send_telegram_message(telegram_msg, telegram_config)
-                        logging.info("Telegram notification sent for closed position")
+                        queue_telegram_message(telegram_msg, telegram_config)
+                        logging.info("Telegram notification queued for closed position")
                         
                         # Clear active trade info
                         clear_active_trade_info()
@@ -4503,27 +5281,27 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
         
         # Log working orders info
         if working_orders:
-            if isinstance(working_orders, list):
-                logging.info(f"Found {len(working_orders)} working order(s)")
-            elif isinstance(working_orders, dict) and 'orders' in working_orders:
-                orders_list = working_orders.get('orders', [])
-                logging.info(f"Found {len(orders_list)} working order(s)")
-            else:
-                logging.info("Working orders retrieved but format unclear")
+            logging.info(f"Found {len(_orders_list(working_orders))} working order(s)")
         else:
             logging.info("No working orders returned (may be none or query failed)")
         
         # If we have an active position, manage it instead of looking for new entries
         if current_position_type in ['long', 'short'] and position_details:
             logging.info(f"Managing active {current_position_type} position...")
-            logging.info(f"Position details: Size={position_details.get('size')}, "
-                        f"Avg Price={position_details.get('average_price')}, "
-                        f"Unrealized P&L={position_details.get('unrealized_pnl')}")
+            # Unpack position details once for logging, syncing and prompt formatting
+            pos_size = position_details.get('size', 0)
+            pos_average_price = position_details.get('average_price', 0)
+            pos_type = position_details.get('position_type', 'unknown')
+            pos_quantity = position_details.get('quantity', 0)
+            pos_unrealized_pnl = position_details.get('unrealized_pnl', 0)
+            logging.info(f"Position details: Size={pos_size}, "
+                        f"Avg Price={pos_average_price}, "
+                        f"Unrealized P&L={pos_unrealized_pnl}")
             
             # Sync active_trade.json with actual API values (entry price, stop, target)
             trade_info = get_active_trade_info()
             if trade_info:
-                api_entry_price = position_details.get('average_price')
+                api_entry_price = pos_average_price
                 stored_entry_price = trade_info.get('entry_price')
                 
                 # Parse working orders for actual stop/target
@@ -4556,13 +5334,17 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                         stop_loss=actual_stop if actual_stop else stored_stop,
                         price_target=actual_target if actual_target else stored_target,
                         reasoning=trade_info.get('reasoning'),
-                        size=position_details.get('size') or trade_info.get('size'),
+                        size=pos_size or trade_info.get('size'),
                         stop_loss_order_id=order_info.get('stop_loss_order_id'),
                         take_profit_order_id=order_info.get('take_profit_order_id')
                     )
                     logging.info("Synced active_trade.json with actual API values")
             
             # Take screenshot for position management
+            # Fetch bar data (network) in the background while the screenshot (GDI) is captured
+            contract_id = topstep_config.get('contract_id', '')
+            bars_future = _PREFETCH_POOL.submit(get_bars_for_llm, contract_id, topstep_config, auth_token)
+            
             try:
                 image_base64 = capture_screenshot(window_title, window_process_name, top_offset, bottom_offset, left_offset, right_offset, save_folder, enable_save_screenshots)
             except (ValueError, Exception) as e:
@@ -4570,59 +5352,26 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                 logging.warning("Bookmap screenshot not available - skipping all LLM and trading processing for this cycle")
                 return  # Exit early, scheduler will retry on next interval
             
-            # Fetch bar data and generate market data JSON
-            try:
-                contract_id = topstep_config.get('contract_id', '')
-                bars_result = get_bars_for_llm(contract_id, topstep_config, auth_token)
-                raw_bars = bars_result.get('bars', [])
-                
-                # Fallback to Yahoo Finance if TopStep returns no bars
-                if not raw_bars:
-                    logging.warning("TopStep returned no bars - falling back to Yahoo Finance")
-                    try:
-                        from yahoo_bars import get_yahoo_bars_for_llm
-                        yahoo_result = get_yahoo_bars_for_llm(num_bars=36)
-                        raw_bars = yahoo_result.get('bars', [])
-                        if raw_bars:
-                            logging.info(f"Successfully retrieved {len(raw_bars)} bars from Yahoo Finance fallback")
-                        else:
-                            logging.warning("Yahoo Finance fallback also returned no bars")
-                    except Exception as yahoo_e:
-                        logging.error(f"Yahoo Finance fallback failed: {yahoo_e}")
-                
-                # Generate structured JSON market data
-                market_data_json = generate_market_data_json(
-                    raw_bars,
-                    daily_context,
-                    current_position_type,
-                    position_details,
-                    working_orders,
-                    contract_id,
-                    upcoming_events=upcoming_events
-                )
-                
-                # TEMPORARY: Send only JSON format (disabled text blob market context)
-                json_section = f"\n\nMarket Data JSON:\n{market_data_json}\n"
-                daily_context_with_bars = json_section  # Temporarily disabled: daily_context + json_section
-            except Exception as e:
-                logging.warning(f"Error fetching bar data (non-critical): {e}")
-                daily_context_with_bars = daily_context
+            # Collect bar data and generate market data JSON
+            daily_context_with_bars = build_market_data_context(
+                bars_future, daily_context, current_position_type, position_details,
+                working_orders, contract_id, upcoming_events=upcoming_events
+            )
             
             # Format prompt with position details
             # Use the pre-loaded global variable (which has the file content, not the path)
             
             # Check if we're managing runners (position size equals runners_quantity)
             runners_qty = topstep_config.get('runners_quantity', 0)
-            current_position_size = position_details.get('size', 0) if position_details else 0
+            current_position_size = pos_size
             is_managing_runners = (runners_qty > 0 and current_position_size == runners_qty)
             
+            # Runner prompt for runner contracts, otherwise the long/short position prompt
+            prompt_key = 'runners' if is_managing_runners else current_position_type
+            position_prompt_template = position_prompts[prompt_key]
             if is_managing_runners:
-                # Use runner prompt for managing runner contracts
-                position_prompt_template = runner_prompt
                 logging.info(f"Managing RUNNERS position ({current_position_size} contract(s))")
             else:
-                # Use regular position prompt (long/short)
-                position_prompt_template = long_position_prompt if current_position_type == 'long' else short_position_prompt
                 logging.info(f"Managing position ({current_position_size} contract(s))")
             
             # Parse working orders to get current stop loss and take profit
@@ -4645,11 +5394,11 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
             position_prompt = safe_format_prompt(
                 position_prompt_template,
                 symbol=DISPLAY_SYMBOL,
-                size=position_details.get('size', 0),
-                average_price=position_details.get('average_price', 0),
-                position_type=position_details.get('position_type', 'unknown'),
-                quantity=position_details.get('quantity', 0),
-                unrealized_pnl=position_details.get('unrealized_pnl', 0),
+                size=pos_size,
+                average_price=pos_average_price,
+                position_type=pos_type,
+                quantity=pos_quantity,
+                unrealized_pnl=pos_unrealized_pnl,
                 current_stop_loss=current_stop_loss,
                 current_take_profit=current_take_profit,
                 Context=daily_context_with_bars,
@@ -4666,16 +5415,12 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
             llm_response = upload_to_llm(image_base64, position_prompt, model, enable_llm, openai_api_url, openai_api_key)
             if llm_response:
                 # Strip markdown if present
-                llm_response = llm_response.strip()
-                if llm_response.startswith('```json') and llm_response.endswith('```'):
-                    llm_response = llm_response[7:-3].strip()
-                elif llm_response.startswith('```') and llm_response.endswith('```'):
-                    llm_response = llm_response[3:-3].strip()
+                llm_response = strip_llm_markdown(llm_response)
                 logging.info(f"Position Management LLM Response: {llm_response}")
                 
                 # Parse and execute position management action
                 try:
-                    advice = json.loads(llm_response)
+                    advice, repeated_hold = parse_llm_advice(llm_response)
                     action = advice.get('action', '').lower()
                     price_target = advice.get('price_target')
                     stop_loss = advice.get('stop_loss')
@@ -4706,12 +5451,16 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                     LAST_KEY_LEVELS = key_levels if key_levels else None
                     logging.info(f"Updated LAST_KEY_LEVELS to: {len(LAST_KEY_LEVELS) if LAST_KEY_LEVELS else 0} levels")
                     
-                    # Update dashboard with latest LLM response
+                    # Update dashboard with latest LLM response (the logged row has a new timestamp
+                    # even when the advice repeats)
                     update_dashboard_data()
                     logging.info(f"Dashboard update scheduled immediately after LLM response")
                     
-                    # Save updated context if it changed
-                    if new_context:
+                    if repeated_hold:
+                        # Identical 'hold' as last cycle - the saved context already reflects it
+                        logging.info("LLM repeated its previous hold response - skipping context update")
+                    elif new_context:
+                        # Save updated context if it changed
                         save_daily_context(new_context, daily_context)
                     
                     # Handle position management actions
@@ -4743,7 +5492,7 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                                 f"(Likely SL/TP hit during analysis)\n"
                                 f"Triggering new screenshot for fresh analysis"
                             )
-                            send_telegram_message(telegram_msg, telegram_config)
+                            queue_telegram_message(telegram_msg, telegram_config)
                         else:
                             # Position still exists - proceed with close
                             close_position(position_details, topstep_config, enable_trading, auth_token, execute_trades, telegram_config, reasoning, daily_context)
@@ -4773,7 +5522,7 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                                 f"(Likely SL/TP hit during analysis)\n"
                                 f"Triggering new screenshot for fresh analysis"
                             )
-                            send_telegram_message(telegram_msg, telegram_config)
+                            queue_telegram_message(telegram_msg, telegram_config)
                         else:
                             # Position still exists - proceed with scale
                             execute_topstep_trade(action, None, price_target, stop_loss, topstep_config, enable_trading, current_position_type, auth_token, execute_trades, position_details, telegram_config, reasoning, None, daily_context)
@@ -4822,6 +5571,10 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
         logging.info("No active position - analyzing for new entry opportunities")
         logging.info(f"Using context: {daily_context[:50]}..." if len(daily_context) > 50 else f"Using context: {daily_context}")
 
+        # Fetch bar data (network) in the background while the screenshot (GDI) is captured
+        contract_id = topstep_config.get('contract_id', '')
+        bars_future = _PREFETCH_POOL.submit(get_bars_for_llm, contract_id, topstep_config, auth_token)
+        
         try:
             image_base64 = capture_screenshot(window_title, window_process_name, top_offset, bottom_offset, left_offset, right_offset, save_folder, enable_save_screenshots)
         except (ValueError, Exception) as e:
@@ -4829,43 +5582,11 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
             logging.warning("Bookmap screenshot not available - skipping all LLM and trading processing for this cycle")
             return  # Exit early, scheduler will retry on next interval
         
-        # Fetch bar data and generate market data JSON
-        try:
-            contract_id = topstep_config.get('contract_id', '')
-            bars_result = get_bars_for_llm(contract_id, topstep_config, auth_token)
-            raw_bars = bars_result.get('bars', [])
-            
-            # Fallback to Yahoo Finance if TopStep returns no bars
-            if not raw_bars:
-                logging.warning("TopStep returned no bars - falling back to Yahoo Finance")
-                try:
-                    from yahoo_bars import get_yahoo_bars_for_llm
-                    yahoo_result = get_yahoo_bars_for_llm(num_bars=36)
-                    raw_bars = yahoo_result.get('bars', [])
-                    if raw_bars:
-                        logging.info(f"Successfully retrieved {len(raw_bars)} bars from Yahoo Finance fallback")
-                    else:
-                        logging.warning("Yahoo Finance fallback also returned no bars")
-                except Exception as yahoo_e:
-                    logging.error(f"Yahoo Finance fallback failed: {yahoo_e}")
-            
-            # Generate structured JSON market data
-            market_data_json = generate_market_data_json(
-                raw_bars,
-                daily_context,
-                current_position_type,
-                position_details,
-                working_orders,
-                contract_id,
-                upcoming_events=upcoming_events
-            )
-            
-            # TEMPORARY: Send only JSON format (disabled text blob market context)
-            json_section = f"\n\nMarket Data JSON:\n{market_data_json}\n"
-            daily_context_with_bars = json_section  # Temporarily disabled: daily_context + json_section
-        except Exception as e:
-            logging.warning(f"Error fetching bar data (non-critical): {e}")
-            daily_context_with_bars = daily_context
+        # Collect bar data and generate market data JSON
+        daily_context_with_bars = build_market_data_context(
+            bars_future, daily_context, current_position_type, position_details,
+            working_orders, contract_id, upcoming_events=upcoming_events
+        )
         
         # Select and format prompt based on current_position_type (using safe formatting)
         llm_observations = get_llm_observations()
@@ -4887,10 +5608,8 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                 waiting_for=waiting_for_text,
                 key_levels=key_levels_text
             )
-        elif current_position_type == 'long':
-            prompt = safe_format_prompt(long_position_prompt, symbol=DISPLAY_SYMBOL, Context=daily_context_with_bars, LLM_Context=llm_observations)
-        elif current_position_type == 'short':
-            prompt = safe_format_prompt(short_position_prompt, symbol=DISPLAY_SYMBOL, Context=daily_context_with_bars, LLM_Context=llm_observations)
+        elif current_position_type in ('long', 'short'):
+            prompt = safe_format_prompt(position_prompts[current_position_type], symbol=DISPLAY_SYMBOL, Context=daily_context_with_bars, LLM_Context=llm_observations)
         else:
             logging.error(f"Invalid position_type: {current_position_type}")
             raise ValueError(f"Invalid position_type: {current_position_type}")
@@ -4898,16 +5617,12 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
         llm_response = upload_to_llm(image_base64, prompt, model, enable_llm, openai_api_url, openai_api_key)
         if llm_response:
             # Strip markdown if present (e.g., ```json ... ```)
-            llm_response = llm_response.strip()
-            if llm_response.startswith('```json') and llm_response.endswith('```'):
-                llm_response = llm_response[7:-3].strip()  # Remove ```json and trailing ```
-            elif llm_response.startswith('```') and llm_response.endswith('```'):
-                llm_response = llm_response[3:-3].strip()  # Remove generic ```
+            llm_response = strip_llm_markdown(llm_response)
             logging.info(f"Cleaned LLM Response for parsing: {llm_response}")
 
             # Parse JSON response
             try:
-                advice = json.loads(llm_response)
+                advice, repeated_hold = parse_llm_advice(llm_response)
                 action = advice.get('action')
                 entry_price = advice.get('entry_price')
                 price_target = advice.get('price_target')
@@ -4956,12 +5671,16 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                     NEXT_SNAPSHOT_OVERRIDE = None
                     logging.debug("No next_snapshot override from LLM - using schedule")
                 
-                # Update dashboard with latest LLM response
+                # Update dashboard with latest LLM response (the logged row has a new timestamp
+                # even when the advice repeats)
                 update_dashboard_data()
                 logging.info(f"Dashboard update scheduled immediately after LLM response")
-
-                # Save updated context if it changed
-                if new_context:
+                
+                if repeated_hold:
+                    # Identical 'hold' as last cycle - the saved context already reflects it
+                    logging.info("LLM repeated its previous hold response - skipping context update")
+                elif new_context:
+                    # Save updated context if it changed
                     save_daily_context(new_context, daily_context)
 
                 # Execute trade based on action
@@ -4970,56 +5689,53 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                     order_id, trade_position_type = execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_config, enable_trading, current_position_type, auth_token, execute_trades, None, telegram_config, reasoning, confidence, daily_context)
                     
                     # Clear waiting_for when entering a new position (buy/sell)
-                    if action in ['buy', 'sell'] and order_id:
+                    if action in _ENTRY_ACTIONS and order_id:
                         LAST_WAITING_FOR = None
                         logging.info("Cleared LAST_WAITING_FOR after entering new position")
                     
                     # For new entry trades (buy/sell), fetch actual stop/target from working orders
-                    if action in ['buy', 'sell'] and order_id and enable_trading:
+                    if action in _ENTRY_ACTIONS and order_id and enable_trading:
                         logging.info("Fetching working orders to get actual stop loss and take profit values...")
-                        time.sleep(2)  # Wait for orders to be processed
-                        
-                        working_orders = get_working_orders(topstep_config, enable_trading, auth_token)
-                        if working_orders and isinstance(working_orders, dict):
-                            orders = working_orders.get('orders', [])
-                            actual_stop_loss = None
-                            actual_price_target = None
-                            stop_loss_order_id = None
-                            take_profit_order_id = None
+                        # Wait (up to 2s) for the bracket orders to be processed
+                        working_orders = wait_for_bracket_orders(topstep_config, enable_trading, auth_token)
+                        if working_orders:
+                            orders = _orders_list(working_orders)
+                            # kind -> (price, order_id); the last matching order of each type wins
+                            bracket = {'stop_loss': (None, None), 'take_profit': (None, None)}
                             
                             for order in orders:
-                                order_type = order.get('type', 0)
-                                stop_price = order.get('stopPrice')
-                                limit_price = order.get('limitPrice')
-                                order_order_id = order.get('id')
-                                
-                                # Type 4 = Stop order (stop loss)
-                                if order_type == 4 and stop_price:
-                                    actual_stop_loss = stop_price
-                                    stop_loss_order_id = order_order_id
-                                    logging.info(f"Found actual stop loss: {actual_stop_loss} (Order ID: {stop_loss_order_id})")
-                                
-                                # Type 1 = Limit order (take profit)
-                                if order_type == 1 and limit_price:
-                                    actual_price_target = limit_price
-                                    take_profit_order_id = order_order_id
-                                    logging.info(f"Found actual price target: {actual_price_target} (Order ID: {take_profit_order_id})")
+                                fields = _BRACKET_ORDER_FIELDS.get(order.get('type', 0))
+                                if fields is None:
+                                    continue
+                                kind, price_key, label = fields
+                                price = order.get(price_key)
+                                if price:
+                                    bracket[kind] = (price, order.get('id'))
+                                    logging.info(f"Found actual {label}: {price} (Order ID: {order.get('id')})")
                             
-                            # Check if actual values differ from LLM suggestions
-                            needs_modification = False
-                            tolerance = 0.01  # Allow 0.01 point difference for rounding
+                            actual_stop_loss, stop_loss_order_id = bracket['stop_loss']
+                            actual_price_target, take_profit_order_id = bracket['take_profit']
+                            
+                            # Check if actual values differ from LLM suggestions (computed once per leg
+                            # and reused by the modify block below). Prices are compared in whole
+                            # ticks, like modify_stops_and_targets, so float noise never triggers a modify
+                            tick_size = topstep_config.get('tick_size', 0.25)
+                            sl_differs = False
+                            tp_differs = False
                             
                             if stop_loss and actual_stop_loss:
-                                diff = abs(float(stop_loss) - float(actual_stop_loss))
-                                if diff > tolerance:
-                                    logging.info(f"Stop loss differs: LLM suggested {stop_loss}, actual {actual_stop_loss} (diff: {diff:.2f})")
-                                    needs_modification = True
+                                sl_llm, sl_actual = float(stop_loss), float(actual_stop_loss)
+                                sl_differs = price_to_ticks(sl_llm, tick_size) != price_to_ticks(sl_actual, tick_size)
+                                if sl_differs:
+                                    logging.info(f"Stop loss differs: LLM suggested {stop_loss}, actual {actual_stop_loss} (diff: {abs(sl_llm - sl_actual):.2f})")
                             
                             if price_target and actual_price_target:
-                                diff = abs(float(price_target) - float(actual_price_target))
-                                if diff > tolerance:
-                                    logging.info(f"Price target differs: LLM suggested {price_target}, actual {actual_price_target} (diff: {diff:.2f})")
-                                    needs_modification = True
+                                tp_llm, tp_actual = float(price_target), float(actual_price_target)
+                                tp_differs = price_to_ticks(tp_llm, tick_size) != price_to_ticks(tp_actual, tick_size)
+                                if tp_differs:
+                                    logging.info(f"Price target differs: LLM suggested {price_target}, actual {actual_price_target} (diff: {abs(tp_llm - tp_actual):.2f})")
+                            
+                            needs_modification = sl_differs or tp_differs
                             
                             # If values differ, modify the orders to match LLM suggestions
                             if needs_modification and execute_trades:
@@ -5038,56 +5754,48 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                                 }
                                 
                                 # Modify the orders
-                                base_url = topstep_config['base_url']
-                                modify_order_endpoint = topstep_config.get('modify_order_endpoint', '/api/Order/modify')
-                                headers = {
-                                    'Authorization': f'Bearer {auth_token}',
-                                    'Content-Type': 'application/json'
-                                }
-                                modify_url = base_url + modify_order_endpoint
+                                headers = _topstep_request_context(topstep_config, auth_token)['headers']
                                 account_id = topstep_config['account_id']
+                                stop_loss_payload = None
+                                take_profit_payload = None
                                 
                                 # Modify stop loss if needed
-                                if stop_loss and stop_loss_order_id and abs(float(stop_loss) - float(actual_stop_loss)) > tolerance:
+                                if sl_differs and stop_loss_order_id:
                                     stop_loss_payload = {
                                         "accountId": int(account_id),
                                         "orderId": int(stop_loss_order_id),
                                         "stopPrice": float(stop_loss)
                                     }
-                                    
-                                    try:
-                                        logging.info(f"Modifying stop loss order {stop_loss_order_id} from {actual_stop_loss} to {stop_loss}")
-                                        sl_response = requests.post(modify_url, headers=headers, json=stop_loss_payload, timeout=10)
-                                        sl_response_data = sl_response.json()
-                                        
-                                        if sl_response_data.get('success', True):
-                                            logging.info(f"✅ Successfully modified stop loss to {stop_loss}")
-                                            actual_stop_loss = stop_loss  # Update to modified value
-                                        else:
-                                            logging.error(f"❌ Failed to modify stop loss: {sl_response_data.get('errorMessage')}")
-                                    except Exception as e:
-                                        logging.error(f"Error modifying stop loss: {e}")
+                                    logging.info(f"Modifying stop loss order {stop_loss_order_id} from {actual_stop_loss} to {stop_loss}")
                                 
                                 # Modify take profit if needed
-                                if price_target and take_profit_order_id and abs(float(price_target) - float(actual_price_target)) > tolerance:
+                                if tp_differs and take_profit_order_id:
                                     take_profit_payload = {
                                         "accountId": int(account_id),
                                         "orderId": int(take_profit_order_id),
                                         "limitPrice": float(price_target)
                                     }
-                                    
-                                    try:
-                                        logging.info(f"Modifying take profit order {take_profit_order_id} from {actual_price_target} to {price_target}")
-                                        tp_response = requests.post(modify_url, headers=headers, json=take_profit_payload, timeout=10)
-                                        tp_response_data = tp_response.json()
-                                        
-                                        if tp_response_data.get('success', True):
-                                            logging.info(f"✅ Successfully modified take profit to {price_target}")
-                                            actual_price_target = price_target  # Update to modified value
-                                        else:
-                                            logging.error(f"❌ Failed to modify take profit: {tp_response_data.get('errorMessage')}")
-                                    except Exception as e:
-                                        logging.error(f"Error modifying take profit: {e}")
+                                    logging.info(f"Modifying take profit order {take_profit_order_id} from {actual_price_target} to {price_target}")
+                                
+                                sl_response_data, tp_response_data = modify_orders(topstep_config, headers, [stop_loss_payload, take_profit_payload])
+                                
+                                if isinstance(sl_response_data, Exception):
+                                    logging.error(f"Error modifying stop loss: {sl_response_data}")
+                                elif sl_response_data is not None:
+                                    if sl_response_data.get('success', True):
+                                        logging.info(f"✅ Successfully modified stop loss to {stop_loss}")
+                                        actual_stop_loss = stop_loss  # Update to modified value
+                                    else:
+                                        logging.error(f"❌ Failed to modify stop loss: {sl_response_data.get('errorMessage')}")
+                                
+                                if isinstance(tp_response_data, Exception):
+                                    logging.error(f"Error modifying take profit: {tp_response_data}")
+                                elif tp_response_data is not None:
+                                    if tp_response_data.get('success', True):
+                                        logging.info(f"✅ Successfully modified take profit to {price_target}")
+                                        actual_price_target = price_target  # Update to modified value
+                                    else:
+                                        logging.error(f"❌ Failed to modify take profit: {tp_response_data.get('errorMessage')}")
                                 
                                 logging.info("="*80)
                             
@@ -5096,10 +5804,14 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
                                 global LATEST_LLM_DATA
                                 if LATEST_LLM_DATA:
                                     logging.info(f"BEFORE UPDATE - LATEST_LLM_DATA: Target={LATEST_LLM_DATA.get('price_target')}, Stop={LATEST_LLM_DATA.get('stop_loss')}")
+                                    # Fill in a copy and publish it with one assignment so the
+                                    # dashboard never sees a new object before it is complete
+                                    updated_llm_data = dict(LATEST_LLM_DATA)
                                     if actual_stop_loss:
-                                        LATEST_LLM_DATA['stop_loss'] = actual_stop_loss
+                                        updated_llm_data['stop_loss'] = actual_stop_loss
                                     if actual_price_target:
-                                        LATEST_LLM_DATA['price_target'] = actual_price_target
+                                        updated_llm_data['price_target'] = actual_price_target
+                                    LATEST_LLM_DATA = updated_llm_data
                                     logging.info(f"AFTER UPDATE - LATEST_LLM_DATA: Target={LATEST_LLM_DATA.get('price_target')}, Stop={LATEST_LLM_DATA.get('stop_loss')}")
                                     logging.info(f"Updated LLM data with final values - Stop: {actual_stop_loss}, Target: {actual_price_target}")
                                     
@@ -5123,6 +5835,70 @@ def job(window_title, window_process_name, top_offset, bottom_offset, left_offse
     except ValueError as e:
         logging.error(f"Error: {e}")
 
+def wait_for_bracket_orders(topstep_config, enable_trading, auth_token=None, timeout=2.0, poll_interval=0.5):
+    """Poll working orders until the new entry's bracket orders show up (or timeout elapses).
+    
+    Returns as soon as every enabled bracket leg is present - type 4 (stop loss) and/or
+    type 1 (take profit) - instead of always sleeping for the full timeout.
+    
+    Returns:
+        dict or None: The last get_working_orders() result
+    """
+    expected_types = set()
+    if topstep_config.get('enable_stop_loss', True):
+        expected_types.add(4)
+    if topstep_config.get('enable_take_profit', True):
+        expected_types.add(1)
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        time.sleep(poll_interval)
+        working_orders = get_working_orders(topstep_config, enable_trading, auth_token)
+        if working_orders:
+            found_types = {order.get('type') for order in _orders_list(working_orders)}
+            if expected_types <= found_types:
+                return working_orders
+        if time.monotonic() >= deadline:
+            return working_orders
+
+# TopstepX request context (headers, endpoint URLs, account payload) for the current
+# auth token, stored as one (key, context) tuple and rebuilt only when the token,
+# base URL or account changes
+_TOPSTEP_REQUEST_CONTEXT = {'entry': (None, None)}
+
+def _topstep_request_context(topstep_config, auth_token):
+    """Return the shared request pieces for the per-cycle TopstepX calls.
+    
+    Callers must treat the returned dicts as read-only.
+    
+    Returns:
+        dict: 'headers', 'search_headers' (headers plus accept: text/plain, for the account and
+            contract searches), 'positions_url', 'working_orders_url', 'account_payload'
+            ({"accountId": int}) and 'account_body' (account_payload serialized once to JSON bytes for data=)
+    """
+    base_url = topstep_config['base_url']
+    account_id = topstep_config.get('account_id', '')
+    key = (auth_token, base_url, account_id)
+    cached_key, context = _TOPSTEP_REQUEST_CONTEXT['entry']
+    if cached_key == key:
+        return context
+    
+    account_payload = {"accountId": int(account_id)} if account_id else None
+    headers = {
+        "Authorization": f"Bearer {auth_token}",
+        "Content-Type": "application/json"
+    }
+    context = {
+        'headers': headers,
+        'search_headers': {**headers, "accept": "text/plain"},
+        'positions_url': base_url + topstep_config.get('positions_endpoint', '/positions'),
+        'working_orders_url': base_url + topstep_config.get('working_orders_endpoint', '/api/Order/searchOpen'),
+        'account_payload': account_payload,
+        'account_body': _json_dumps(account_payload) if account_payload else None
+    }
+    _TOPSTEP_REQUEST_CONTEXT['entry'] = (key, context)
+    return context
+
 def get_working_orders(topstep_config, enable_trading, auth_token=None):
     """Query Topstep API for all working orders."""
     if not enable_trading:
@@ -5133,43 +5909,36 @@ def get_working_orders(topstep_config, enable_trading, auth_token=None):
         logging.error("No auth token available for working orders query")
         return None
     
-    base_url = topstep_config['base_url']
-    working_orders_endpoint = topstep_config.get('working_orders_endpoint', '/api/Order/searchOpen')
     account_id = topstep_config.get('account_id', '')
     
     if not account_id:
-        logging.error("No account_id configured for working orders query")
-        return None
-    
-    url = base_url + working_orders_endpoint
-    
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
+        logging.error("No account_id configured for working orders query")
+        return None
     
-    payload = {
-        "accountId": int(account_id)
-    }
+    request_context = _topstep_request_context(topstep_config, auth_token)
+    url = request_context['working_orders_url']
+    headers = request_context['headers']
+    body = request_context['account_body']
     
-    logging.info("=== FETCHING WORKING ORDERS ===")
-    logging.info(f"Account ID: {account_id}")
-    logging.info(f"Working Orders URL: {url}")
-    logging.info(f"Payload: {json.dumps(payload)}")
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("=== FETCHING WORKING ORDERS ===")
+        logging.info(f"Account ID: {account_id}")
+        logging.info(f"Working Orders URL: {url}")
+        logging.info("Payload: %s", body.decode())
     
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = _HTTP_SESSION.post(url, headers=headers, data=body, timeout=10)
         response.raise_for_status()
-        orders = response.json()
+        orders = _json_loads(response.content)
         
-        # Log the full JSON response
-        logging.info("="*80)
-        logging.info("WORKING ORDERS API RESPONSE:")
-        logging.info(f"Status Code: {response.status_code}")
-        logging.info(f"Response Type: {type(orders)}")
-        logging.info("Full JSON Response:")
-        logging.info(json.dumps(orders, indent=2) if isinstance(orders, (dict, list)) else str(orders))
-        logging.info("="*80)
+        # Log the full JSON response (pretty-printed only when DEBUG logging is on)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(_RULE80)
+            logging.info("WORKING ORDERS API RESPONSE:")
+            logging.info(f"Status Code: {response.status_code}")
+            logging.info(f"Response Type: {type(orders)}")
+            logging.debug("Full JSON Response:\n%s", _LazyJson(orders))
+            logging.info(_RULE80)
         
         return orders
         
@@ -5186,6 +5955,144 @@ def get_working_orders(topstep_config, enable_trading, auth_token=None):
         logging.exception("Full traceback:")
         return None
 
+# Short-lived cache of positions responses keyed by account_id: {account_id: (monotonic time, generation, positions)}
+# so get_current_position and check_active_trades in the same tick share one API call
+_POSITIONS_CACHE = {}
+_POSITIONS_CACHE_TTL = 1.0
+
+# Bumped by invalidate_positions_cache() so a response to a request sent before an
+# order change is never stored or reused
+_POSITIONS_CACHE_GENERATION = {'value': 0}
+
+# Last check_active_trades() answer as one (monotonic time, account_id, has_active) tuple
+_ACTIVE_TRADES_CACHE = {'entry': (0.0, None, False)}
+_ACTIVE_TRADES_CACHE_TTL = 0.5
+
+def invalidate_positions_cache():
+    """Drop cached positions responses (call after placing, closing or modifying orders)."""
+    _POSITIONS_CACHE_GENERATION['value'] += 1
+    _POSITIONS_CACHE.clear()
+    _ACTIVE_TRADES_CACHE['entry'] = (0.0, None, False)
+
+def _fetch_positions(positions_url, headers, account_id, body):
+    """POST the positions query for account_id, reusing a response younger than _POSITIONS_CACHE_TTL.
+    
+    body is the pre-serialized {"accountId": ...} payload from _topstep_request_context.
+    
+    Returns:
+        Parsed positions JSON (raises on HTTP errors like requests does)
+    """
+    generation = _POSITIONS_CACHE_GENERATION['value']
+    cached = _POSITIONS_CACHE.get(account_id)
+    if cached is not None and cached[1] == generation and time.monotonic() - cached[0] < _POSITIONS_CACHE_TTL:
+        logging.debug("Using cached positions response for account %s", account_id)
+        return cached[2]
+    
+    response = _HTTP_SESSION.post(positions_url, headers=headers, data=body, timeout=10)
+    response.raise_for_status()
+    positions = _json_loads(response.content)
+    # Only cache if no invalidation happened while the request was in flight
+    if _POSITIONS_CACHE_GENERATION['value'] == generation:
+        _POSITIONS_CACHE[account_id] = (time.monotonic(), generation, positions)
+    return positions
+
+# Whether the last detailed get_current_position() call found an open position
+_POSITION_STATE = {'active': False}
+
+def _collect_working_orders(orders_future, topstep_config, enable_trading, auth_token):
+    """Return working orders for an open position and remember that a position is open.
+    
+    Uses the speculative fetch started by get_current_position() when there is one,
+    otherwise queries the API now.
+    """
+    _POSITION_STATE['active'] = True
+    if orders_future is not None:
+        return orders_future.result()
+    return get_working_orders(topstep_config, enable_trading, auth_token)
+
+# Alternative field names used by the positions API, in lookup order
+_SYMBOL_KEYS = ('symbol', 'contractId', 'contract')
+_QUANTITY_KEYS = ('quantity', 'size', 'netQuantity')
+_POSITION_TYPE_KEYS = ('type', 'positionType')
+_AVERAGE_PRICE_KEYS = ('averagePrice', 'avgPrice', 'entryPrice')
+_UNREALIZED_PNL_KEYS = ('unrealizedPnl', 'unrealizedPL', 'pnl')
+
+def _first(d, keys, default=None):
+    """Return the first truthy d[key] for key in keys (same semantics as an `or` chain of .get calls)."""
+    for key in keys:
+        value = d.get(key)
+        if value:
+            return value
+    return default
+
+def _normalize_positions(positions):
+    """Return the position dicts from a positions response.
+    
+    Accepts a list of positions, a {'positions': [...]} (TopstepX) or {'data': [...]}
+    wrapper, or a single position object. Items are not type-checked here;
+    _match_position skips anything that is not a dict.
+    """
+    if isinstance(positions, list):
+        items = positions
+    elif isinstance(positions, dict):
+        if isinstance(positions.get('positions'), list):
+            items = positions['positions']
+        elif isinstance(positions.get('data'), list):
+            items = positions['data']
+        else:
+            items = [positions]
+    else:
+        return []
+    return items
+
+def _iter_open_positions(positions_list):
+    """Yield (symbol, quantity) for each position with a non-zero quantity, skipping non-dict items."""
+    first, quantity_keys = _first, _QUANTITY_KEYS
+    for pos in positions_list:
+        try:
+            quantity = first(pos, quantity_keys, 0)
+        except AttributeError:
+            logging.error(f"Position item is not a dictionary: {type(pos)} - {pos}")
+            continue
+        if quantity != 0:
+            yield first(pos, _SYMBOL_KEYS, 'Unknown'), quantity
+
+def _match_position(pos, symbol, contract_id):
+    """Return position_details for pos if it is the given symbol/contract, otherwise None."""
+    try:
+        pos_symbol = _first(pos, _SYMBOL_KEYS)
+    except AttributeError:
+        logging.error(f"Position item is not a dictionary: {type(pos)} - {pos}")
+        return None
+    if not pos_symbol or (pos_symbol != symbol and pos_symbol != contract_id):
+        return None
+    
+    quantity = _first(pos, _QUANTITY_KEYS, 0)
+    
+    # Get position type: 1 = Long, 2 = Short (fall back to the quantity sign)
+    position_type_code = _first(pos, _POSITION_TYPE_KEYS)
+    if position_type_code == 1:
+        position_type_str = 'long'
+    elif position_type_code == 2:
+        position_type_str = 'short'
+    elif quantity > 0:
+        position_type_str = 'long'
+    elif quantity < 0:
+        position_type_str = 'short'
+    else:
+        position_type_str = 'none'
+    
+    return {
+        'symbol': pos_symbol,
+        'size': abs(quantity),  # Always positive
+        'quantity': quantity,
+        'position_type': position_type_str,
+        'average_price': _first(pos, _AVERAGE_PRICE_KEYS, 0),
+        'unrealized_pnl': _first(pos, _UNREALIZED_PNL_KEYS, 0),
+        'type_code': position_type_code,
+        'rawPosition': pos  # Full position object for reference
+    }
+
 def get_current_position(symbol, topstep_config, enable_trading, auth_token=None, return_details=False):
     """Query Topstep API for current position of the symbol and determine type (or mock if disabled).
     
@@ -5203,8 +6110,6 @@ def get_current_position(symbol, topstep_config, enable_trading, auth_token=None
         logging.error("No auth token available for positions query")
         return ('none', None, None) if return_details else 'none'
 
-    base_url = topstep_config['base_url']
-    positions_endpoint = topstep_config.get('positions_endpoint', '/positions')
     account_id = topstep_config.get('account_id', '')
     contract_id = topstep_config.get('contract_id', '')
     
@@ -5212,251 +6117,73 @@ def get_current_position(symbol, topstep_config, enable_trading, auth_token=None
         logging.error("No account_id configured for positions query")
         return ('none', None, None) if return_details else 'none'
 
-    url = base_url + positions_endpoint
-
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
-    
-    payload = {
-        "accountId": int(account_id)
-    }
+    request_context = _topstep_request_context(topstep_config, auth_token)
+    url = request_context['positions_url']
+    headers = request_context['headers']
+    body = request_context['account_body']
 
     # Debug logging
-    logging.info("=== FETCHING POSITIONS ===")
-    logging.info(f"Positions URL: {url}")
-    logging.info(f"Auth Token: {auth_token[:20]}..." if auth_token else "None")
-    logging.info(f"Headers: {headers}")
-    logging.info(f"Payload: {json.dumps(payload)}")
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("=== FETCHING POSITIONS ===")
+        logging.info(f"Positions URL: {url}")
+        logging.info(f"Auth Token: {auth_token[:20]}..." if auth_token else "None")
+        logging.info(f"Headers: {headers}")
+        logging.info("Payload: %s", body.decode())
+
+    # While a position is open its working orders are needed every cycle, so fetch
+    # them alongside the positions query instead of one round-trip after it
+    orders_future = None
+    if return_details and _POSITION_STATE['active']:
+        orders_future = _PREFETCH_POOL.submit(get_working_orders, topstep_config, enable_trading, auth_token)
+    if return_details:
+        _POSITION_STATE['active'] = False
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
-        response.raise_for_status()
-        positions = response.json()
+        positions = _fetch_positions(url, headers, account_id, body)
         
         # Log the full JSON response for debugging
-        logging.info("="*80)
-        logging.info("POSITIONS API RESPONSE:")
-        logging.info(f"Status Code: {response.status_code}")
-        logging.info(f"Response Type: {type(positions)}")
-        logging.info("Full JSON Response:")
-        logging.info(json.dumps(positions, indent=2) if isinstance(positions, (dict, list)) else str(positions))
-        logging.info("="*80)
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(_RULE80)
+            logging.info("POSITIONS API RESPONSE:")
+            logging.info(f"Response Type: {type(positions)}")
+            logging.debug("Full JSON Response:\n%s", _LazyJson(positions))
+            logging.info(_RULE80)
         
         # Handle different response formats
         if isinstance(positions, str):
             logging.error(f"Unexpected string response from positions API: {positions}")
             return ('none', None, None) if return_details else 'none'
         
-        # If response is a list of positions
-        if isinstance(positions, list):
-            if len(positions) == 0:
-                logging.info("No positions found (empty list)")
-                return ('none', None, None) if return_details else 'none'
-            
-            for pos in positions:
-                if not isinstance(pos, dict):
-                    logging.error(f"Position item is not a dictionary: {type(pos)} - {pos}")
-                    continue
-                    
-                pos_symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract')
-                quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                
-                if pos_symbol == symbol or pos_symbol == contract_id:
-                    logging.info(f"Found matching position: symbol={pos_symbol}, quantity={quantity}")
-                    if quantity > 0:
-                        return ('long', None) if return_details else 'long'
-                    elif quantity < 0:
-                        return ('short', None, None) if return_details else 'short'
-                    else:
-                        return ('none', None, None) if return_details else 'none'
-            
-            logging.info(f"No matching position found for symbol {symbol}")
+        if not isinstance(positions, (list, dict)):
+            logging.error(f"Unexpected positions response type: {type(positions)}")
             return ('none', None, None) if return_details else 'none'
         
-        # If response is a single dict (not a list)
-        elif isinstance(positions, dict):
-            # Check if it's a wrapper with a 'positions' key (TopstepX format)
-            if 'positions' in positions and isinstance(positions['positions'], list):
-                positions_list = positions['positions']
-                logging.info(f"DEBUG: Found {len(positions_list)} position(s) in response")
-                
-                if len(positions_list) == 0:
-                    logging.info("No positions found (empty positions list)")
-                    return ('none', None, None) if return_details else 'none'
-                
-                # Log all positions for debugging
-                logging.info("DEBUG: All positions in response:")
-                for idx, pos in enumerate(positions_list):
-                    if isinstance(pos, dict):
-                        pos_symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract')
-                        quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                        logging.info(f"  Position {idx+1}: symbol={pos_symbol}, quantity={quantity}, full={pos}")
-                    else:
-                        logging.info(f"  Position {idx+1}: Not a dict - {type(pos)} - {pos}")
-                
-                logging.info(f"DEBUG: Looking for symbol='{symbol}' or contract_id='{contract_id}'")
-                
-                for pos in positions_list:
-                    if not isinstance(pos, dict):
-                        continue
-                    pos_symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract')
-                    quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                    
-                    logging.info(f"DEBUG: Comparing '{pos_symbol}' with '{symbol}' or '{contract_id}'")
-                    
-                    if pos_symbol == symbol or pos_symbol == contract_id:
-                        # Get position type: 1 = Long, 2 = Short
-                        position_type_code = pos.get('type') or pos.get('positionType')
-                        
-                        logging.info(f"MATCH FOUND: symbol={pos_symbol}, quantity={quantity}, type={position_type_code}")
-                        
-                        # Determine if long or short based on type field
-                        if position_type_code == 1:
-                            position_type_str = 'long'
-                        elif position_type_code == 2:
-                            position_type_str = 'short'
-                        else:
-                            # Fallback to quantity-based detection if type field not present
-                            if quantity > 0:
-                                position_type_str = 'long'
-                            elif quantity < 0:
-                                position_type_str = 'short'
-                            else:
-                                position_type_str = 'none'
-                        
-                        # Extract position details
-                        position_details = {
-                            'symbol': pos_symbol,
-                            'size': abs(quantity),  # Always positive
-                            'quantity': quantity,
-                            'position_type': position_type_str,
-                            'average_price': pos.get('averagePrice') or pos.get('avgPrice') or pos.get('entryPrice') or 0,
-                            'unrealized_pnl': pos.get('unrealizedPnl') or pos.get('unrealizedPL') or pos.get('pnl') or 0,
-                            'type_code': position_type_code,
-                            'rawPosition': pos  # Full position object for reference
-                        }
-                        
-                        logging.info(f"Returning '{position_type_str}' (type={position_type_code}, size={abs(quantity)})")
-                        
-                        # Fetch working orders only if position exists and details requested
-                        working_orders = None
-                        if return_details and enable_trading and auth_token:
-                            logging.info("Active position detected - fetching working orders")
-                            working_orders = get_working_orders(topstep_config, enable_trading, auth_token)
-                        
-                        return (position_type_str, position_details, working_orders) if return_details else position_type_str
-                
-                logging.info(f"No matching position found for symbol {symbol} in positions list")
-                return ('none', None, None) if return_details else 'none'
-            
-            # Check if it's a wrapper with a 'data' key
-            elif 'data' in positions and isinstance(positions['data'], list):
-                positions_list = positions['data']
-                if len(positions_list) == 0:
-                    logging.info("No positions found (empty data list)")
-                    return ('none', None, None) if return_details else 'none'
-                
-                for pos in positions_list:
-                    if not isinstance(pos, dict):
-                        continue
-                    pos_symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract')
-                    quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                    
-                    if pos_symbol == symbol or pos_symbol == contract_id:
-                        # Get position type: 1 = Long, 2 = Short
-                        position_type_code = pos.get('type') or pos.get('positionType')
-                        
-                        logging.info(f"Found matching position: symbol={pos_symbol}, quantity={quantity}, type={position_type_code}")
-                        
-                        # Determine if long or short based on type field
-                        if position_type_code == 1:
-                            position_type_str = 'long'
-                        elif position_type_code == 2:
-                            position_type_str = 'short'
-                        else:
-                            # Fallback to quantity-based detection
-                            if quantity > 0:
-                                position_type_str = 'long'
-                            elif quantity < 0:
-                                position_type_str = 'short'
-                            else:
-                                position_type_str = 'none'
-                        
-                        position_details = {
-                            'symbol': pos_symbol,
-                            'size': abs(quantity),
-                            'quantity': quantity,
-                            'position_type': position_type_str,
-                            'average_price': pos.get('averagePrice') or pos.get('avgPrice') or pos.get('entryPrice') or 0,
-                            'unrealized_pnl': pos.get('unrealizedPnl') or pos.get('unrealizedPL') or pos.get('pnl') or 0,
-                            'type_code': position_type_code,
-                            'rawPosition': pos
-                        }
-                        
-                        # Fetch working orders only if position exists and details requested
-                        working_orders = None
-                        if return_details and enable_trading and auth_token:
-                            logging.info("Active position detected - fetching working orders")
-                            working_orders = get_working_orders(topstep_config, enable_trading, auth_token)
-                        
-                        return (position_type_str, position_details, working_orders) if return_details else position_type_str
-                
-                logging.info(f"No matching position found for symbol {symbol} in data list")
-                return ('none', None, None) if return_details else 'none'
-            
-            # Check if it's a single position object
-            else:
-                pos_symbol = positions.get('symbol') or positions.get('contractId') or positions.get('contract')
-                quantity = positions.get('quantity', 0) or positions.get('size', 0) or positions.get('netQuantity', 0)
-                
-                if pos_symbol and (pos_symbol == symbol or pos_symbol == contract_id):
-                    # Get position type: 1 = Long, 2 = Short
-                    position_type_code = positions.get('type') or positions.get('positionType')
-                    
-                    logging.info(f"Found matching position: symbol={pos_symbol}, quantity={quantity}, type={position_type_code}")
-                    
-                    # Determine if long or short based on type field
-                    if position_type_code == 1:
-                        position_type_str = 'long'
-                    elif position_type_code == 2:
-                        position_type_str = 'short'
-                    else:
-                        # Fallback to quantity-based detection
-                        if quantity > 0:
-                            position_type_str = 'long'
-                        elif quantity < 0:
-                            position_type_str = 'short'
-                        else:
-                            position_type_str = 'none'
-                    
-                    position_details = {
-                        'symbol': pos_symbol,
-                        'size': abs(quantity),
-                        'quantity': quantity,
-                        'position_type': position_type_str,
-                        'average_price': positions.get('averagePrice') or positions.get('avgPrice') or positions.get('entryPrice') or 0,
-                        'unrealized_pnl': positions.get('unrealizedPnl') or positions.get('unrealizedPL') or positions.get('pnl') or 0,
-                        'type_code': position_type_code,
-                        'rawPosition': positions
-                    }
-                    
-                    # Fetch working orders only if position exists and details requested
-                    working_orders = None
-                    if return_details and enable_trading and auth_token:
-                        logging.info("Active position detected - fetching working orders")
-                        working_orders = get_working_orders(topstep_config, enable_trading, auth_token)
-                    
-                    return (position_type_str, position_details, working_orders) if return_details else position_type_str
-                else:
-                    logging.info(f"No positions found - response indicates no open positions")
-                    return ('none', None, None) if return_details else 'none'
+        positions_list = _normalize_positions(positions)
+        logging.info(f"Found {len(positions_list)} position(s) in response, looking for symbol='{symbol}' or contract_id='{contract_id}'")
         
-        else:
-            logging.error(f"Unexpected positions response type: {type(positions)}")
-            return ('none', None, None) if return_details else 'none'
+        for pos in positions_list:
+            position_details = _match_position(pos, symbol, contract_id)
+            if position_details is None:
+                continue
+            
+            position_type_str = position_details['position_type']
+            logging.info(f"Found matching position: symbol={position_details['symbol']}, quantity={position_details['quantity']}, type={position_details['type_code']}")
+            if position_type_str == 'none':
+                break
+            
+            logging.info(f"Returning '{position_type_str}' (type={position_details['type_code']}, size={position_details['size']})")
+            
+            # Fetch working orders only if position exists and details requested
+            working_orders = None
+            if return_details and enable_trading and auth_token:
+                logging.info("Active position detected - fetching working orders")
+                working_orders = _collect_working_orders(orders_future, topstep_config, enable_trading, auth_token)
             
+            return (position_type_str, position_details, working_orders) if return_details else position_type_str
+        
+        logging.info(f"No open position found for symbol {symbol}")
+        return ('none', None, None) if return_details else 'none'
+    
     except requests.exceptions.Timeout:
         logging.error("Positions query timed out")
         return ('none', None, None) if return_details else 'none'
@@ -5467,12 +6194,16 @@ def get_current_position(symbol, topstep_config, enable_trading, auth_token=None
         return ('none', None, None) if return_details else 'none'
     except json.JSONDecodeError as e:
         logging.error(f"Failed to parse positions response as JSON: {e}")
-        logging.error(f"Raw response: {response.text}")
         return ('none', None, None) if return_details else 'none'
     except Exception as e:
         logging.error(f"Unexpected error querying positions: {e}")
         logging.exception("Full traceback:")
         return ('none', None, None) if return_details else 'none'
+    finally:
+        # Drop the speculative working-orders fetch if no open position needed it
+        # (no-op when it already ran or was consumed)
+        if orders_future is not None:
+            orders_future.cancel()
 
 def check_active_trades(topstep_config, enable_trading, auth_token=None):
     """Check if there are any active open positions - returns True if positions are active."""
@@ -5484,102 +6215,56 @@ def check_active_trades(topstep_config, enable_trading, auth_token=None):
         logging.error("No auth token available for active trades check")
         return False
 
-    base_url = topstep_config['base_url']
     account_id = topstep_config.get('account_id', '')
     
     if not account_id:
         logging.error("No account_id configured for active trades check")
         return False
     
-    logging.debug(f"DEBUG: Checking active trades for account {account_id}")
-
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
+    # Tight polling loops reuse a very recent answer without re-parsing the positions
+    cached_at, cached_account, cached_active = _ACTIVE_TRADES_CACHE['entry']
+    if cached_account == account_id and time.monotonic() - cached_at < _ACTIVE_TRADES_CACHE_TTL:
+        return cached_active
+    
+    logging.debug("DEBUG: Checking active trades for account %s", account_id)
 
-    payload = {
-        "accountId": int(account_id)
-    }
+    request_context = _topstep_request_context(topstep_config, auth_token)
+    headers = request_context['headers']
+    payload = request_context['account_payload']
 
     try:
         # Check for active positions FIRST
-        positions_endpoint = topstep_config.get('positions_endpoint', '/positions')
-        positions_url = base_url + positions_endpoint
+        positions_url = request_context['positions_url']
         
-        logging.debug(f"DEBUG: Querying {positions_url} with payload {payload}")
+        logging.debug("DEBUG: Querying %s with payload %s", positions_url, payload)
         
-        response = requests.post(positions_url, headers=headers, json=payload, timeout=10)
-        response.raise_for_status()
-        positions = response.json()
-        
-        # Log the full JSON response for debugging
-        logging.info("="*80)
-        logging.info("CHECK ACTIVE TRADES - API RESPONSE:")
-        logging.info(f"Status Code: {response.status_code}")
-        logging.info(f"Response Type: {type(positions)}")
-        logging.info("Full JSON Response:")
-        logging.info(json.dumps(positions, indent=2) if isinstance(positions, (dict, list)) else str(positions))
-        logging.info("="*80)
+        positions = _fetch_positions(positions_url, headers, account_id, request_context['account_body'])
         
         # Handle different response formats
         if isinstance(positions, str):
             logging.error(f"Unexpected string response from positions API: {positions}")
             return False
         
-        # Track if we found any active positions
-        has_active_position = False
-        
-        # If positions is a list and has any items with non-zero quantity, we have active trades
-        if isinstance(positions, list) and len(positions) > 0:
-            for pos in positions:
-                if not isinstance(pos, dict):
-                    logging.error(f"Position item is not a dictionary: {type(pos)} - {pos}")
-                    continue
-                
-                quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                if quantity != 0:
-                    symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract', 'Unknown')
-                    logging.info(f"Active position found: {symbol} with quantity {quantity}")
-                    has_active_position = True
-                    break
-        
-        # If response is a single dict with positions data
-        elif isinstance(positions, dict):
-            # Check for 'positions' key (TopstepX format)
-            if 'positions' in positions and isinstance(positions['positions'], list):
-                positions_list = positions['positions']
-                logging.debug(f"DEBUG (check_active_trades): Found {len(positions_list)} position(s)")
-                
-                for idx, pos in enumerate(positions_list):
-                    if not isinstance(pos, dict):
-                        continue
-                    quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                    symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract', 'Unknown')
-                    logging.debug(f"  Position {idx+1}: symbol={symbol}, quantity={quantity}")
-                    
-                    if quantity != 0:
-                        logging.info(f"Active position found: {symbol} with quantity {quantity}")
-                        has_active_position = True
-                        break
-            # Check for 'data' key
-            elif 'data' in positions and isinstance(positions['data'], list):
-                for pos in positions['data']:
-                    if not isinstance(pos, dict):
-                        continue
-                    quantity = pos.get('quantity', 0) or pos.get('size', 0) or pos.get('netQuantity', 0)
-                    if quantity != 0:
-                        symbol = pos.get('symbol') or pos.get('contractId') or pos.get('contract', 'Unknown')
-                        logging.info(f"Active position found: {symbol} with quantity {quantity}")
-                        has_active_position = True
-                        break
+        # Any position with a non-zero quantity means we have active trades
+        positions_list = _normalize_positions(positions)
+        logging.debug("check_active_trades: Found %d position(s)", len(positions_list))
+        active = next(_iter_open_positions(positions_list), None)
+        has_active_position = active is not None
+        if has_active_position:
+            logging.info(f"Active position found: {active[0]} with quantity {active[1]}")
         
-        # Only fetch working orders if we have an active position
+        _ACTIVE_TRADES_CACHE['entry'] = (time.monotonic(), account_id, has_active_position)
         if has_active_position:
-            logging.info("Active position detected - Fetching working orders")
-            working_orders = get_working_orders(topstep_config, enable_trading, auth_token)
             return True
         
+        # No active position - log the response that led to that answer
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(_RULE80)
+            logging.info("CHECK ACTIVE TRADES - API RESPONSE:")
+            logging.info(f"Response Type: {type(positions)}")
+            logging.debug("Full JSON Response:\n%s", _LazyJson(positions))
+            logging.info(_RULE80)
+        
         # DISABLED: Check for working orders (uncomment to re-enable)
         # orders_endpoint = topstep_config.get('working_orders_endpoint', '/api/Order/searchWorking')
         # orders_url = base_url + orders_endpoint
@@ -5609,6 +6294,67 @@ def check_active_trades(topstep_config, enable_trading, auth_token=None):
         logging.error(f"Unexpected error checking active trades: {e}")
         return False
 
+# Telegram header line per executed order action
+_ORDER_TELEGRAM_TITLES = {
+    'buy': "🟢 <b>ORDER PLACED: BUY</b>",
+    'sell': "🔴 <b>ORDER PLACED: SELL</b>",
+    'close': "🔵 <b>POSITION CLOSED</b>",
+    'scale': "🟡 <b>POSITION SCALED OUT</b>",
+}
+
+def _order_telegram_message(action, size, contract_id, entry_price, payload, price_target, stop_loss, balance, reasoning, confidence):
+    """Build the Telegram notification for an executed order.
+    
+    Args:
+        action: Order action, selects the header line from _ORDER_TELEGRAM_TITLES
+        payload: Order payload, for the stop loss / take profit bracket details
+    
+    Returns:
+        str: Message lines joined once with newlines
+    """
+    title = _ORDER_TELEGRAM_TITLES.get(action)
+    if title is None:
+        action_emoji = "🟢" if action in _BUY_LIKE else "🔴" if action in _SELL_LIKE else "⚪"
+        title = f"{action_emoji} <b>ORDER PLACED: {action.upper()}</b>"
+    telegram_parts = [title, f"Size: {size} contract(s)", f"Symbol: {contract_id}"]
+    if entry_price:
+        telegram_parts.append(f"Entry: {entry_price}")
+    
+    sl_bracket = payload.get('stopLossBracket')
+    if sl_bracket:
+        if 'ticks' in sl_bracket:
+            telegram_parts.append(f"Stop Loss: {sl_bracket['ticks']} ticks")
+        elif 'price' in sl_bracket:
+            telegram_parts.append(f"Stop Loss: {sl_bracket['price']}")
+    
+    tp_bracket = payload.get('takeProfitBracket')
+    if tp_bracket:
+        if 'ticks' in tp_bracket:
+            telegram_parts.append(f"Take Profit: {tp_bracket['ticks']} ticks")
+        elif 'price' in tp_bracket:
+            telegram_parts.append(f"Take Profit: {tp_bracket['price']}")
+    
+    if price_target:
+        telegram_parts.append(f"Target: {price_target}")
+    if stop_loss:
+        telegram_parts.append(f"Stop: {stop_loss}")
+    if balance is not None:
+        telegram_parts.append(f"💰 Balance: ${balance:,.2f}")
+    if reasoning:
+        telegram_parts.append(f"📝 Reason: {reasoning}")
+    if confidence is not None:
+        telegram_parts.append(f"🎯 Confidence: {confidence}%")
+    telegram_parts.append(f"Time: {time.strftime(_TIMESTAMP_FORMAT)}")
+    return "\n".join(telegram_parts)
+
+def _trade_balance_result(balance_future, timeout=5):
+    """Wait for a background get_account_balance() call, returning None if it fails or is slow."""
+    try:
+        return balance_future.result(timeout=timeout)
+    except Exception as e:
+        logging.warning(f"Could not get updated balance after trade: {e}")
+        return None
+
 def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_config, enable_trading, position_type='none', auth_token=None, execute_trades=False, position_details=None, telegram_config=None, reasoning=None, confidence=None, market_context=None):
     """Execute trade via Topstep API based on action with stop loss and take profit (or mock/log details if disabled).
     
@@ -5618,17 +6364,18 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
     logging.info(f"Preparing to execute trade: {action} with entry {entry_price}, target {price_target} and stop {stop_loss}")
     
     # Get configuration values
-    account_id = topstep_config.get('account_id', '')
+    cfg_get = topstep_config.get
+    account_id = cfg_get('account_id', '')
     if not account_id:
         logging.error("No account_id configured - cannot place order")
         return (None, None)
     
     # Get contract ID from config or from the available contracts
-    contract_id = topstep_config.get('contract_id', '')
+    contract_id = cfg_get('contract_id', '')
     
     # If not in config, try to get it from available contracts
     if not contract_id:
-        contracts = topstep_config.get('available_contracts', [])
+        contracts = cfg_get('available_contracts', [])
         if contracts and isinstance(contracts, list) and len(contracts) > 0:
             contract_id = contracts[0].get('symbol', '') if isinstance(contracts[0], dict) else ''
     
@@ -5640,8 +6387,8 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
     # Get order size
     if action == 'scale':
         # For scaling, calculate how many to close: quantity - runners_quantity
-        runners_qty = int(topstep_config.get('runners_quantity', 0))
-        total_qty = int(topstep_config.get('quantity', 1))
+        runners_qty = int(cfg_get('runners_quantity', 0))
+        total_qty = int(cfg_get('quantity', 1))
         
         # Validate runner configuration
         if runners_qty >= total_qty:
@@ -5678,32 +6425,18 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
     
     # Determine order side based on action
     # side: 0 = bid (buy), 1 = ask (sell)
-    if action == 'buy':
-        side = 0  # Bid (buy)
-    elif action == 'sell':
-        side = 1  # Ask (sell)
-    elif action == 'close':
-        # Close position: if long, sell; if short, buy
-        if position_type == 'long':
-            side = 1  # Ask (sell to close long)
-        elif position_type == 'short':
-            side = 0  # Bid (buy to close short)
-        else:
-            logging.error("Close action requires long or short position_type")
+    if action in _ACTION_SIDE:
+        side = _ACTION_SIDE[action]
+    elif action == 'close' or action == 'scale':
+        # Close/scale trade against the position: if long, sell; if short, buy
+        side = _EXIT_SIDE.get(position_type)
+        if side is None:
+            logging.error(f"{action.capitalize()} action requires long or short position_type")
             return (None, None)
         # For close action, use actual position size if available
-        if position_details and position_details.get('size'):
+        if action == 'close' and position_details and position_details.get('size'):
             size = int(position_details.get('size'))
             logging.info(f"Closing: Using actual position size of {size} contracts")
-    elif action == 'scale':
-        # Scale position: if long, sell; if short, buy
-        if position_type == 'long':
-            side = 1  # Ask (sell to scale out long)
-        elif position_type == 'short':
-            side = 0  # Bid (buy to scale out short)
-        else:
-            logging.error("Scale action requires long or short position_type")
-            return (None, None)
     elif action == 'flatten':
         logging.error("Flatten action not implemented - use close instead")
         return (None, None)
@@ -5725,14 +6458,18 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
     
     # Add stop loss and take profit brackets if enabled and provided
     # Only add these for entry orders (buy/sell), not for close/scale actions
-    enable_sl = topstep_config.get('enable_stop_loss', True)
-    enable_tp = topstep_config.get('enable_take_profit', True)
+    enable_sl = cfg_get('enable_stop_loss', True)
+    enable_tp = cfg_get('enable_take_profit', True)
     
-    if action in ['buy', 'sell']:
+    if action in _ENTRY_ACTIONS and (enable_sl or enable_tp):
         # Calculate or use provided stop loss and take profit
-        max_risk = topstep_config.get('max_risk_per_contract', '')
-        max_profit = topstep_config.get('max_profit_per_contract', '')
-        tick_size = topstep_config.get('tick_size', 0.25)
+        max_risk = cfg_get('max_risk_per_contract', '')
+        max_profit = cfg_get('max_profit_per_contract', '')
+        tick_size = cfg_get('tick_size', 0.25)
+        has_max_risk = bool(max_risk and max_risk.strip())
+        has_max_profit = bool(max_profit and max_profit.strip())
+        max_risk_points = float(max_risk) if has_max_risk else None
+        max_profit_points = float(max_profit) if has_max_profit else None
         
         # Calculate profit and risk distances from LLM if we have entry_price
         llm_profit_distance = None
@@ -5742,14 +6479,14 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
         
         if entry_price and price_target and stop_loss:
             # Calculate distances in points from entry price
-            llm_profit_distance = abs(float(price_target) - float(entry_price))
-            llm_risk_distance = abs(float(stop_loss) - float(entry_price))
+            entry = float(entry_price)
+            llm_profit_distance = abs(float(price_target) - entry)
+            llm_risk_distance = abs(float(stop_loss) - entry)
             
             logging.info(f"LLM suggests: Profit distance={llm_profit_distance:.2f} points, Risk distance={llm_risk_distance:.2f} points")
             
             # Compare with configured limits
-            if max_profit and max_profit.strip():
-                max_profit_points = float(max_profit)
+            if has_max_profit:
                 if llm_profit_distance > max_profit_points:
                     use_llm_profit = True
                     logging.info(f"LLM profit target ({llm_profit_distance:.2f} pts) is BETTER than config ({max_profit_points} pts) - Using LLM")
@@ -5759,8 +6496,7 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
                 use_llm_profit = True
                 logging.info(f"No config profit limit - Using LLM profit target")
             
-            if max_risk and max_risk.strip():
-                max_risk_points = float(max_risk)
+            if has_max_risk:
                 if llm_risk_distance < max_risk_points:
                     use_llm_risk = True
                     logging.info(f"LLM stop loss ({llm_risk_distance:.2f} pts) is TIGHTER than config ({max_risk_points} pts) - Using LLM")
@@ -5771,31 +6507,22 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
                 logging.info(f"No config risk limit - Using LLM stop loss")
         
         # Build stopLossBracket object
-        if enable_sl and (stop_loss or (max_risk and max_risk.strip())):
+        if enable_sl and (stop_loss or has_max_risk):
             stop_loss_bracket = {
                 "type": 4  # 4 = Stop order
             }
             
             # Use LLM stop loss if it's tighter (better)
             if use_llm_risk and entry_price and stop_loss:
-                # Calculate ticks from LLM distance
-                stop_loss_ticks = int(llm_risk_distance / tick_size)
-                
-                # For long positions (side=0/buy), stop loss ticks should be negative (below entry)
-                if side == 0:
-                    stop_loss_ticks = -stop_loss_ticks
+                # Calculate ticks from LLM distance (negative below entry for longs)
+                stop_loss_ticks = _STOP_LOSS_TICK_SIGN[side] * int(llm_risk_distance / tick_size)
                 
                 stop_loss_bracket['ticks'] = stop_loss_ticks
                 logging.info(f"Stop Loss Bracket set to: {stop_loss_ticks} ticks ({llm_risk_distance:.2f} points) from LLM")
-            elif max_risk and max_risk.strip():
+            elif has_max_risk:
                 # Use configured max risk in points
-                max_risk_points = float(max_risk)
-                # Calculate ticks from points
-                stop_loss_ticks = int(max_risk_points / tick_size)
-                
-                # For long positions (side=0/buy), stop loss ticks should be negative (below entry)
-                if side == 0:
-                    stop_loss_ticks = -stop_loss_ticks
+                # Calculate ticks from points (negative below entry for longs)
+                stop_loss_ticks = _STOP_LOSS_TICK_SIGN[side] * int(max_risk_points / tick_size)
                 
                 stop_loss_bracket['ticks'] = stop_loss_ticks
                 logging.info(f"Stop Loss Bracket set to: {stop_loss_ticks} ticks ({max_risk_points} points) from config")
@@ -5808,31 +6535,22 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
                 payload['stopLossBracket'] = stop_loss_bracket
         
         # Build takeProfitBracket object
-        if enable_tp and (price_target or (max_profit and max_profit.strip())):
+        if enable_tp and (price_target or has_max_profit):
             take_profit_bracket = {
                 "type": 1  # 1 = Limit order
             }
             
             # Use LLM profit target if it's larger (better)
             if use_llm_profit and entry_price and price_target:
-                # Calculate ticks from LLM distance
-                take_profit_ticks = int(llm_profit_distance / tick_size)
-                
-                # For short positions (side=1/sell), take profit ticks should be negative
-                if side == 1:
-                    take_profit_ticks = -take_profit_ticks
+                # Calculate ticks from LLM distance (negative below entry for shorts)
+                take_profit_ticks = _TAKE_PROFIT_TICK_SIGN[side] * int(llm_profit_distance / tick_size)
                 
                 take_profit_bracket['ticks'] = take_profit_ticks
                 logging.info(f"Take Profit Bracket set to: {take_profit_ticks} ticks ({llm_profit_distance:.2f} points) from LLM")
-            elif max_profit and max_profit.strip():
+            elif has_max_profit:
                 # Use configured max profit in points
-                max_profit_points = float(max_profit)
-                # Calculate ticks from points
-                take_profit_ticks = int(max_profit_points / tick_size)
-                
-                # For short positions (side=1/sell), take profit ticks should be negative
-                if side == 1:
-                    take_profit_ticks = -take_profit_ticks
+                # Calculate ticks from points (negative below entry for shorts)
+                take_profit_ticks = _TAKE_PROFIT_TICK_SIGN[side] * int(max_profit_points / tick_size)
                 
                 take_profit_bracket['ticks'] = take_profit_ticks
                 logging.info(f"Take Profit Bracket set to: {take_profit_ticks} ticks ({max_profit_points} points) from config")
@@ -5849,7 +6567,7 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
         base_url = topstep_config['base_url']
         url = base_url + topstep_config['buy_endpoint']  # All orders go to /api/Order/place endpoint
         headers = {"Authorization": f"Bearer {auth_token or '[AUTH_TOKEN]'}", "Content-Type": "application/json"}
-        logging.info(f"Trading disabled - Mock request: URL={url}, Headers={headers}, Payload={json.dumps(payload, indent=2)}")
+        logging.info("Trading disabled - Mock request: URL=%s, Headers=%s, Payload=%s", url, headers, _LazyJson(payload))
         return
 
     if not auth_token:
@@ -5860,33 +6578,31 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
     base_url = topstep_config['base_url']
     url = base_url + topstep_config['buy_endpoint']  # All orders go to /api/Order/place endpoint
 
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json"
-    }
+    headers = _topstep_request_context(topstep_config, auth_token)['headers']
 
     # Debug logging
     logging.info("=== EXECUTING TRADE ===")
     logging.info(f"Trade URL: {url}")
     logging.info(f"Auth Token: {auth_token[:20]}..." if auth_token else "None")
     logging.info(f"Headers: {headers}")
-    logging.info(f"Payload: {json.dumps(payload, indent=2)}")
+    logging.info("Payload: %s", _LazyJson(payload))
 
     # Check if we should actually execute the trade or just log it
     if not execute_trades:
         logging.info("=== DRY RUN MODE - TRADE NOT EXECUTED ===")
-        logging.info(f"Would execute {action} trade: {json.dumps(payload, indent=2)}")
+        logging.info("Would execute %s trade: %s", action, _LazyJson(payload))
         logging.info("Set execute_trades=true in config.ini to enable actual trade execution")
         return
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=30)
+        invalidate_positions_cache()
         logging.info(f"Trade Response Status: {response.status_code}")
         logging.info(f"Trade Response Headers: {dict(response.headers)}")
 
         response.raise_for_status()
-        trade_response = response.json()
-        logging.info(f"Trade Response Body: {json.dumps(trade_response, indent=2)}")
+        trade_response = _json_loads(response.content)
+        logging.info("Trade Response Body: %s", _LazyJson(trade_response))
         
         # Check for API error response (success: false, errorCode: 2)
         if isinstance(trade_response, dict):
@@ -5910,6 +6626,7 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
                 return (None, None)
         
         logging.info(f"Trade executed successfully: {action}")
+        _DISMISSED_ERRORS.clear()
         
         # Extract orderId from response if available
         order_id = None
@@ -5918,15 +6635,33 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
             if order_id:
                 logging.info(f"Order ID from response: {order_id}")
         
-        # Get updated account balance
-        balance = get_account_balance(account_id, topstep_config, enable_trading, auth_token)
+        # Fetch the updated account balance in the background while the local
+        # bookkeeping runs; it is only needed for the CSV log and Telegram message
+        balance_future = _PREFETCH_POOL.submit(get_account_balance, account_id, topstep_config, enable_trading, auth_token)
         
         # Log trade event to CSV
-        if action in ['buy', 'sell']:
+        if action in _ENTRY_ACTIONS:
             # Entry event
             event_type = "ENTRY"
             trade_position_type = 'long' if action == 'buy' else 'short'
             
+            # Expect a position on the next poll so its working orders are fetched alongside
+            _POSITION_STATE['active'] = True
+            
+            # Save order ID and timestamp for later retrieval
+            save_active_trade_info(
+                order_id=order_id,
+                entry_price=entry_price if entry_price else 0,
+                position_type=trade_position_type,
+                entry_timestamp=datetime.datetime.now().isoformat(),
+                reasoning=reasoning
+            )
+            
+            # Enable trade monitoring now that we have an active position
+            enable_trade_monitoring(f"Position opened: {trade_position_type.upper()}")
+            
+            balance = _trade_balance_result(balance_future)
+            
             # Log the entry with order_id
             log_trade_event(
                 event_type=event_type,
@@ -5943,65 +6678,20 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
                 order_id=order_id
             )
             
-            # Save order ID and timestamp for later retrieval
-            save_active_trade_info(
-                order_id=order_id,
-                entry_price=entry_price if entry_price else 0,
-                position_type=trade_position_type,
-                entry_timestamp=datetime.datetime.now().isoformat(),
-                reasoning=reasoning
-            )
-            
-            # Enable trade monitoring now that we have an active position
-            enable_trade_monitoring(f"Position opened: {trade_position_type.upper()}")
-            
             # Send Telegram notification for entry
-            action_emoji = "🟢" if action == 'buy' else "🔴"
-            telegram_msg = f"{action_emoji} <b>ORDER PLACED: {action.upper()}</b>\n"
-            telegram_msg += f"Size: {size} contract(s)\n"
-            telegram_msg += f"Symbol: {contract_id}\n"
-            
-            if entry_price:
-                telegram_msg += f"Entry: {entry_price}\n"
-            
-            # Log stop loss and take profit bracket details if present
-            if 'stopLossBracket' in payload:
-                sl_bracket = payload['stopLossBracket']
-                if 'ticks' in sl_bracket:
-                    telegram_msg += f"Stop Loss: {sl_bracket['ticks']} ticks\n"
-                elif 'price' in sl_bracket:
-                    telegram_msg += f"Stop Loss: {sl_bracket['price']}\n"
-            
-            if 'takeProfitBracket' in payload:
-                tp_bracket = payload['takeProfitBracket']
-                if 'ticks' in tp_bracket:
-                    telegram_msg += f"Take Profit: {tp_bracket['ticks']} ticks\n"
-                elif 'price' in tp_bracket:
-                    telegram_msg += f"Take Profit: {tp_bracket['price']}\n"
-            
-            if price_target:
-                telegram_msg += f"Target: {price_target}\n"
-            if stop_loss:
-                telegram_msg += f"Stop: {stop_loss}\n"
-            
-            if balance is not None:
-                telegram_msg += f"💰 Balance: ${balance:,.2f}\n"
-            
-            if reasoning:
-                telegram_msg += f"📝 Reason: {reasoning}\n"
-            
-            if confidence is not None:
-                telegram_msg += f"🎯 Confidence: {confidence}%\n"
-            
-            telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            telegram_msg = _order_telegram_message(
+                action, size, contract_id, entry_price, payload, price_target, stop_loss, balance, reasoning, confidence
+            )
             
             # Send Telegram notification
-            send_telegram_message(telegram_msg, telegram_config)
-            logging.info(f"Telegram notification sent for {action.upper()} action")
+            queue_telegram_message(telegram_msg, telegram_config)
+            logging.info(f"Telegram notification queued for {action.upper()} action")
             
             # Return order_id and position_type for buy/sell actions
             return (order_id, trade_position_type)
-        elif action == 'scale':
+        
+        balance = _trade_balance_result(balance_future)
+        if action == 'scale':
             # Scale event (partial exit)
             trade_info = get_active_trade_info()
             if trade_info:
@@ -6032,61 +6722,29 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
                     entry_price=scale_entry_price
                 )
         
-        # Build Telegram notification message for close/scale actions
-        if action == 'close':
-            action_emoji = "🔵"
-            telegram_msg = f"{action_emoji} <b>POSITION CLOSED</b>\n"
-        elif action == 'scale':
-            action_emoji = "🟡"
-            telegram_msg = f"{action_emoji} <b>POSITION SCALED OUT</b>\n"
-        else:
-            action_emoji = "🟢" if action in ['buy', 'long'] else "🔴" if action in ['sell', 'short'] else "⚪"
-            action_text = action.upper()
-            telegram_msg = f"{action_emoji} <b>ORDER PLACED: {action_text}</b>\n"
-        telegram_msg += f"Size: {size} contract(s)\n"
-        telegram_msg += f"Symbol: {contract_id}\n"
-        
-        if entry_price:
-            telegram_msg += f"Entry: {entry_price}\n"
-        
         # Log stop loss and take profit bracket details if present
-        if 'stopLossBracket' in payload:
-            sl_bracket = payload['stopLossBracket']
+        sl_bracket = payload.get('stopLossBracket')
+        if sl_bracket:
             if 'ticks' in sl_bracket:
                 logging.info(f"Stop Loss bracket placed: {sl_bracket['ticks']} ticks")
-                telegram_msg += f"Stop Loss: {sl_bracket['ticks']} ticks\n"
             elif 'price' in sl_bracket:
                 logging.info(f"Stop Loss bracket placed at price: {sl_bracket['price']}")
-                telegram_msg += f"Stop Loss: {sl_bracket['price']}\n"
         
-        if 'takeProfitBracket' in payload:
-            tp_bracket = payload['takeProfitBracket']
+        tp_bracket = payload.get('takeProfitBracket')
+        if tp_bracket:
             if 'ticks' in tp_bracket:
                 logging.info(f"Take Profit bracket placed: {tp_bracket['ticks']} ticks")
-                telegram_msg += f"Take Profit: {tp_bracket['ticks']} ticks\n"
             elif 'price' in tp_bracket:
                 logging.info(f"Take Profit bracket placed at price: {tp_bracket['price']}")
-                telegram_msg += f"Take Profit: {tp_bracket['price']}\n"
-        
-        if price_target:
-            telegram_msg += f"Target: {price_target}\n"
-        if stop_loss:
-            telegram_msg += f"Stop: {stop_loss}\n"
-        
-        if balance is not None:
-            telegram_msg += f"💰 Balance: ${balance:,.2f}\n"
         
-        if reasoning:
-            telegram_msg += f"📝 Reason: {reasoning}\n"
-        
-        if confidence is not None:
-            telegram_msg += f"🎯 Confidence: {confidence}%\n"
-        
-        telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        # Build Telegram notification message for close/scale actions
+        telegram_msg = _order_telegram_message(
+            action, size, contract_id, entry_price, payload, price_target, stop_loss, balance, reasoning, confidence
+        )
         
         # Send Telegram notification
-        send_telegram_message(telegram_msg, telegram_config)
-        logging.info(f"Telegram notification sent for {action.upper()} action")
+        queue_telegram_message(telegram_msg, telegram_config)
+        logging.info(f"Telegram notification queued for {action.upper()} action")
         
         # Return None for close/scale actions
         return (None, None)
@@ -6099,7 +6757,7 @@ def execute_topstep_trade(action, entry_price, price_target, stop_loss, topstep_
             logging.error(f"Error response: {e.response.text}")
             # Try to parse error response for error code 2
             try:
-                error_json = e.response.json()
+                error_json = _json_loads(e.response.content)
                 if isinstance(error_json, dict):
                     error_code = error_json.get('errorCode', 0)
                     error_message = error_json.get('errorMessage', str(e))
@@ -6141,17 +6799,17 @@ def login_topstep(topstep_config):
     logging.info(f"Login Payload: {json.dumps(payload)}")
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=30)
         logging.info(f"Login Response Status: {response.status_code}")
         logging.info(f"Login Response Headers: {dict(response.headers)}")
 
         if response.status_code == 200:
             try:
-                response_data = response.json()
-                logging.info(f"Login Response Body: {json.dumps(response_data, indent=2)}")
+                response_data = _json_loads(response.content)
+                logging.info("Login Response Body: %s", _LazyJson(response_data))
 
                 # Extract token from response - adjust based on actual API response structure
-                token = response_data.get('token') or response_data.get('access_token') or response_data.get('auth_token')
+                token = _first(response_data, ('token', 'access_token', 'auth_token'))
                 if token:
                     logging.info("Login successful - Token retrieved")
                     return token
@@ -6216,10 +6874,7 @@ def fetch_topstepx_bars(contract_id, start_time, end_time, topstep_config, auth_
             "includePartialBar": True  # Only complete bars
         }
         
-        headers = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json"
-        }
+        headers = _topstep_request_context(topstep_config, auth_token)['headers']
         
         logging.info("=" * 80)
         logging.info("FETCHING BARS FROM TOPSTEPX API")
@@ -6228,9 +6883,9 @@ def fetch_topstepx_bars(contract_id, start_time, end_time, topstep_config, auth_
         logging.info(f"Time range: {start_time_str} to {end_time_str}")
         logging.info(f"Auth token: {auth_token[:20]}..." if auth_token else "None")
         logging.info("Request payload:")
-        logging.info(json.dumps(payload, indent=2))
+        logging.info("%s", _LazyJson(payload))
         
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=10)
         
         logging.info("=" * 80)
         logging.info("BAR FETCH API RESPONSE")
@@ -6239,10 +6894,9 @@ def fetch_topstepx_bars(contract_id, start_time, end_time, topstep_config, auth_
         logging.info(f"Response Headers: {dict(response.headers)}")
         
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         
-        logging.info("Response Body:")
-        logging.info(json.dumps(result, indent=2))
+        logging.debug("Response Body:\n%s", _LazyJson(result))
         logging.info("=" * 80)
         
         # Check for API errors
@@ -6623,6 +7277,61 @@ def calculate_overnight_metrics(bars):
         logging.exception("Full traceback:")
         return {'onh': None, 'onl': None, 'globex_vwap': None}
 
+def build_market_data_context(bars_future, daily_context, position_type, position_details, working_orders, contract_id, upcoming_events=None):
+    """
+    Resolve prefetched bars and build the market data section for the LLM prompt.
+    
+    Falls back to Yahoo Finance when TopStep returns no bars, and to the plain
+    daily context if anything fails.
+    
+    Args:
+        bars_future: Future returned by submitting get_bars_for_llm to _PREFETCH_POOL
+        daily_context: Daily market context text
+        position_type: 'long', 'short', or 'none'
+        position_details: Position details dict (or None)
+        working_orders: List of working orders (or None)
+        contract_id: Contract ID
+        upcoming_events: Upcoming economic events (or None)
+    
+    Returns:
+        str: Context text to substitute into the prompt
+    """
+    try:
+        bars_result = bars_future.result()
+        raw_bars = bars_result.get('bars', [])
+        
+        # Fallback to Yahoo Finance if TopStep returns no bars
+        if not raw_bars:
+            logging.warning("TopStep returned no bars - falling back to Yahoo Finance")
+            try:
+                from yahoo_bars import get_yahoo_bars_for_llm
+                yahoo_result = get_yahoo_bars_for_llm(num_bars=36)
+                raw_bars = yahoo_result.get('bars', [])
+                if raw_bars:
+                    logging.info(f"Successfully retrieved {len(raw_bars)} bars from Yahoo Finance fallback")
+                else:
+                    logging.warning("Yahoo Finance fallback also returned no bars")
+            except Exception as yahoo_e:
+                logging.error(f"Yahoo Finance fallback failed: {yahoo_e}")
+        
+        # Generate structured JSON market data
+        market_data_json = generate_market_data_json(
+            raw_bars,
+            daily_context,
+            position_type,
+            position_details,
+            working_orders,
+            contract_id,
+            upcoming_events=upcoming_events
+        )
+        
+        # TEMPORARY: Send only JSON format (disabled text blob market context)
+        json_section = f"\n\nMarket Data JSON:\n{market_data_json}\n"
+        return json_section  # Temporarily disabled: daily_context + json_section
+    except Exception as e:
+        logging.warning(f"Error fetching bar data (non-critical): {e}")
+        return daily_context
+
 def generate_market_data_json(bars, yahoo_context_text, position_type, position_details=None, working_orders=None, contract_id='', num_bars=36, upcoming_events=None):
     """Generate structured JSON market data with key_levels, extended_analysis, and 5m bars.
     
@@ -7049,11 +7758,7 @@ def get_available_contracts(topstep_config, auth_token=None, symbol=None):
         contracts_endpoint = topstep_config.get('contracts_endpoint', '/api/Contract/search')
         url = base_url + contracts_endpoint
 
-        headers = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json",
-            "accept": "text/plain"
-        }
+        headers = _topstep_request_context(topstep_config, auth_token)['search_headers']
 
         payload = {
             "searchText": symbol,
@@ -7068,12 +7773,12 @@ def get_available_contracts(topstep_config, auth_token=None, symbol=None):
         logging.info(f"Headers: {headers}")
 
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=30)
             logging.info(f"Contract Search Response Status: {response.status_code}")
             logging.info(f"Contract Search Response Headers: {dict(response.headers)}")
 
             response.raise_for_status()
-            contracts = response.json()
+            contracts = _json_loads(response.content)
             logging.info(f"Contract Search Response Body: {json.dumps(contracts, indent=2)}")
 
             if isinstance(contracts, list) and contracts:
@@ -7099,11 +7804,7 @@ def get_available_contracts(topstep_config, auth_token=None, symbol=None):
         # Fallback to available contracts endpoint
         contracts_endpoint = topstep_config.get('contracts_available_endpoint', '/api/Contract/available')
         url = base_url + contracts_endpoint
-        headers = {
-            "Authorization": f"Bearer {auth_token}",
-            "Content-Type": "application/json",
-            "accept": "text/plain"
-        }
+        headers = _topstep_request_context(topstep_config, auth_token)['search_headers']
 
         payload = {
             "live": False
@@ -7117,12 +7818,12 @@ def get_available_contracts(topstep_config, auth_token=None, symbol=None):
         logging.info(f"Headers: {headers}")
 
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=30)
             logging.info(f"Contracts Response Status: {response.status_code}")
             logging.info(f"Contracts Response Headers: {dict(response.headers)}")
 
             response.raise_for_status()
-            contracts = response.json()
+            contracts = _json_loads(response.content)
             logging.info(f"Contracts Response Body: {json.dumps(contracts, indent=2)}")
             logging.info(f"Found {len(contracts) if isinstance(contracts, list) else 'N/A'} available contracts")
             return contracts
@@ -7136,6 +7837,21 @@ def get_available_contracts(topstep_config, auth_token=None, symbol=None):
             logging.error(f"Error fetching contracts: {e}")
             return None
 
+def sum_trade_pnl_and_fees(trades):
+    """Total profitAndLoss and fees over a list of fills in a single pass.
+    
+    Null values (e.g. profitAndLoss on opening fills) count as 0.
+    
+    Returns:
+        tuple: (total_pnl, total_fees)
+    """
+    total_pnl = 0.0
+    total_fees = 0.0
+    for trade in trades:
+        total_pnl += trade.get('profitAndLoss', 0) or 0
+        total_fees += trade.get('fees', 0) or 0
+    return total_pnl, total_fees
+
 def fetch_trade_results(account_id, topstep_config, enable_trading, auth_token=None, start_timestamp=None, end_timestamp=None):
     """Fetch trade results from TopstepX Trade/search API.
     
@@ -7165,11 +7881,11 @@ def fetch_trade_results(account_id, topstep_config, enable_trading, auth_token=N
     try:
         # Default timestamps: today 00:00 to now + 2 minute buffer
         if not start_timestamp:
-            start_timestamp = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).strftime("%Y-%m-%dT%H:%M:%SZ")
+            start_timestamp = today_midnight_timestamp()
         if not end_timestamp:
             # Add 2 minute buffer to end time to account for any time drift
             end_time = datetime.datetime.now() + datetime.timedelta(minutes=2)
-            end_timestamp = end_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+            end_timestamp = format_api_timestamp(end_time)
         
         # Normalize timestamps to consistent format (seconds precision with Z suffix)
         # Handle timestamps that may have microseconds, timezone offsets, or missing Z suffix
@@ -7207,7 +7923,7 @@ def fetch_trade_results(account_id, topstep_config, enable_trading, auth_token=N
         try:
             end_dt = datetime.datetime.strptime(end_timestamp.rstrip('Z'), "%Y-%m-%dT%H:%M:%S")
             end_dt = end_dt + datetime.timedelta(minutes=2)
-            end_timestamp = end_dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+            end_timestamp = format_api_timestamp(end_dt)
         except ValueError:
             pass  # Keep original if parsing fails
         
@@ -7215,10 +7931,7 @@ def fetch_trade_results(account_id, topstep_config, enable_trading, auth_token=N
         trade_search_endpoint = topstep_config.get('trade_search_endpoint', '/api/Trade/search')
         url = base_url + trade_search_endpoint
         
-        headers = {
-            'Authorization': f'Bearer {auth_token}',
-            'Content-Type': 'application/json'
-        }
+        headers = _topstep_request_context(topstep_config, auth_token)['headers']
         
         payload = {
             "accountId": int(account_id),
@@ -7228,16 +7941,16 @@ def fetch_trade_results(account_id, topstep_config, enable_trading, auth_token=N
         
         logging.info("=== FETCHING TRADE RESULTS ===")
         logging.info(f"Trade Search URL: {url}")
-        logging.info(f"Payload: {json.dumps(payload, indent=2)}")
+        logging.info("Payload: %s", _LazyJson(payload))
         
-        response = requests.post(url, headers=headers, json=payload, timeout=10)
+        response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=10)
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         
         logging.info("="*80)
         logging.info("TRADE RESULTS API RESPONSE:")
         logging.info(f"Status Code: {response.status_code}")
-        logging.info(json.dumps(result, indent=2))
+        logging.debug("%s", _LazyJson(result))
         logging.info("="*80)
         
         if result.get('success', True) and 'trades' in result:
@@ -7341,11 +8054,7 @@ def get_accounts(topstep_config, enable_trading, auth_token=None):
     accounts_endpoint = topstep_config.get('accounts_endpoint', '/api/Account/search')
 
     url = base_url + accounts_endpoint
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json",
-        "accept": "text/plain"
-    }
+    headers = _topstep_request_context(topstep_config, auth_token)['search_headers']
     payload = {
         "onlyActiveAccounts": True
     }
@@ -7358,12 +8067,12 @@ def get_accounts(topstep_config, enable_trading, auth_token=None):
     logging.info(f"Payload: {json.dumps(payload)}")
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = _HTTP_SESSION.post(url, headers=headers, json=payload, timeout=30)
         logging.info(f"Accounts Response Status: {response.status_code}")
         logging.info(f"Accounts Response Headers: {dict(response.headers)}")
 
         response.raise_for_status()
-        accounts = response.json()
+        accounts = _json_loads(response.content)
         logging.info(f"Accounts Response Body: {json.dumps(accounts, indent=2)}")
         return accounts
     except requests.exceptions.Timeout:
@@ -7558,6 +8267,9 @@ TOPSTEP_CONFIG = {
     'working_orders_endpoint': config.get('Topstep', 'working_orders_endpoint', fallback='/api/Order/searchOpen'),
     'cancel_order_endpoint': config.get('Topstep', 'cancel_order_endpoint', fallback='/api/Order/cancel'),
     'modify_order_endpoint': config.get('Topstep', 'modify_order_endpoint', fallback='/api/Order/modify'),
+    'modify_batch_endpoint': config.get('Topstep', 'modify_batch_endpoint', fallback='/api/Order/modifyBatch'),
+    'use_batch_modify': config.getboolean('Topstep', 'use_batch_modify', fallback=False),
+    'keepalive_interval': config.getint('Topstep', 'keepalive_interval', fallback=25),
     'accounts_endpoint': config.get('Topstep', 'accounts_endpoint', fallback='/api/Account/search'),
     'contracts_endpoint': config.get('Topstep', 'contracts_endpoint', fallback='/api/Contract/search'),
     'contracts_available_endpoint': config.get('Topstep', 'contracts_available_endpoint', fallback='/api/Contract/available'),
@@ -7603,6 +8315,15 @@ HOLIDAY_CONFIG = {
     'market_closed': config.get('MarketHolidays', 'market_closed', fallback='')
 }
 
+# Economic calendar settings (read once here and on reload_config, not on every job run)
+ECONOMIC_CALENDAR_CONFIG = {
+    'enabled': config.has_section('EconomicCalendar') and config.getboolean('EconomicCalendar', 'enable_economic_calendar', fallback=False),
+    'data_file': config.get('EconomicCalendar', 'data_file', fallback='market_data/economic_calendar.json'),
+    'minutes_before': config.getint('EconomicCalendar', 'minutes_before_event', fallback=15),
+    'minutes_after': config.getint('EconomicCalendar', 'minutes_after_event', fallback=15),
+    'severity_filter': tuple(s.strip() for s in config.get('EconomicCalendar', 'severity_threshold', fallback='High,Medium').split(','))
+}
+
 if HOLIDAY_CONFIG['enabled']:
     logging.info(f"Market holidays checking enabled - Data file: {HOLIDAY_CONFIG['data_file']}")
     logging.info(f"  Buffer times: {HOLIDAY_CONFIG['minutes_before_close']}min before close, {HOLIDAY_CONFIG['minutes_after_open']}min after open")
@@ -7703,6 +8424,34 @@ if ENABLE_TRADING:
 else:
     logging.info("Trading disabled - Skipping TopstepX login")
 
+def _topstep_keepalive():
+    """Keep the pooled TopstepX connection warm between trades.
+    
+    Idle connections are dropped by the server after about a minute, so the first
+    modify after a quiet spell would pay for a new TLS handshake. Every
+    keepalive_interval seconds (0 disables) this sends the cheap positions query
+    over the shared session while trading is enabled and logged in. The ping is
+    skipped when the regular polling cached a positions response within the
+    interval, and its own response is discarded so it can never overwrite a
+    cache entry with positions from before an order change.
+    """
+    while True:
+        interval = TOPSTEP_CONFIG.get('keepalive_interval', 25)
+        time.sleep(interval if interval > 0 else 25)
+        account_id = TOPSTEP_CONFIG.get('account_id', '')
+        if interval <= 0 or not ENABLE_TRADING or not AUTH_TOKEN or not account_id:
+            continue
+        cached = _POSITIONS_CACHE.get(account_id)
+        if cached is not None and time.monotonic() - cached[0] < interval:
+            continue
+        try:
+            request_context = _topstep_request_context(TOPSTEP_CONFIG, AUTH_TOKEN)
+            _HTTP_SESSION.post(request_context['positions_url'], headers=request_context['headers'], data=request_context['account_body'], timeout=10)
+        except Exception as e:
+            logging.debug(f"TopstepX keep-alive ping failed: {e}")
+
+threading.Thread(target=_topstep_keepalive, name="TopstepKeepAlive", daemon=True).start()
+
 # Fetch and log accounts if trading enabled
 accounts = get_accounts(TOPSTEP_CONFIG, ENABLE_TRADING, AUTH_TOKEN)
 if accounts:
@@ -8071,7 +8820,7 @@ def get_current_interval():
     
     # Priority 1: LLM-requested override (dynamic timing based on market conditions)
     if NEXT_SNAPSHOT_OVERRIDE is not None:
-        logging.debug(f"Using LLM-requested override: {NEXT_SNAPSHOT_OVERRIDE}s")
+        logging.debug("Using LLM-requested override: %ss", NEXT_SNAPSHOT_OVERRIDE)
         return NEXT_SNAPSHOT_OVERRIDE
     
     # Priority 2: Time-based schedule
@@ -8089,8 +8838,8 @@ def get_current_interval():
             # Parse: "HH:MM-HH:MM=seconds"
             time_range, interval = slot.split('=')
             start_str, end_str = time_range.split('-')
-            start_time = datetime.datetime.strptime(start_str.strip(), "%H:%M").time()
-            end_time = datetime.datetime.strptime(end_str.strip(), "%H:%M").time()
+            start_time = _parse_hhmm(start_str.strip())
+            end_time = _parse_hhmm(end_str.strip())
             interval_seconds = int(interval)
             
             # Check if current time is in this slot (handle overnight)
@@ -8103,7 +8852,8 @@ def get_current_interval():
                 in_slot = current_time >= start_time or current_time < end_time
             
             if in_slot:
-                logging.debug(f"Current time {current_time.strftime('%H:%M')} is in slot {slot} - interval={interval_seconds}s")
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug(f"Current time {current_time.strftime('%H:%M')} is in slot {slot} - interval={interval_seconds}s")
                 return interval_seconds
                 
         except Exception as e:
@@ -8312,11 +9062,11 @@ def run_trade_monitor():
                 
                 # Detect position closure (was active, now none)
                 if last_position_type in ['long', 'short'] and current_position_type == 'none':
-                    logging.info(f"="*80)
+                    logging.info(_RULE80)
                     logging.info(f"TRADE MONITOR: Position closed detected!")
                     logging.info(f"Previous position: {last_position_type.upper()}")
                     logging.info(f"Fetching trade results from API...")
-                    logging.info(f"="*80)
+                    logging.info(_RULE80)
                     
                     # Get trade info
                     trade_info = get_active_trade_info()
@@ -8327,9 +9077,9 @@ def run_trade_monitor():
                             start_time = entry_timestamp
                         else:
                             # Fallback to today's start if no timestamp
-                            start_time = datetime.datetime.now().replace(hour=0, minute=0, second=0).strftime("%Y-%m-%dT%H:%M:%SZ")
+                            start_time = today_midnight_timestamp()
                         
-                        end_time = datetime.datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                        end_time = format_api_timestamp(datetime.datetime.now())
                         
                         trades = fetch_trade_results(
                             TOPSTEP_CONFIG['account_id'],
@@ -8342,8 +9092,7 @@ def run_trade_monitor():
                         
                         if trades:
                             # Calculate net P&L from all fills
-                            total_pnl = sum(trade.get('profitAndLoss', 0) for trade in trades)
-                            total_fees = sum(trade.get('fees', 0) for trade in trades)
+                            total_pnl, total_fees = sum_trade_pnl_and_fees(trades)
                             net_pnl = total_pnl - total_fees
                             
                             # Get entry price and position details
@@ -8386,18 +9135,14 @@ def run_trade_monitor():
                             else:
                                 exit_emoji = "📤"
                             
-                            logging.info(f"="*80)
-                            logging.info(f"TRADE CLOSED - {exit_type} - {result_text}")
-                            logging.info(f"Position: {trade_position_type.upper()}")
-                            logging.info(f"Entry Price: {entry_price}")
-                            logging.info(f"Exit Price: {exit_price}")
-                            logging.info(f"Exit Order ID: {exit_trade_order_id}")
-                            logging.info(f"Stored SL Order ID: {stop_loss_order_id}")
-                            logging.info(f"Stored TP Order ID: {take_profit_order_id}")
-                            logging.info(f"Net P&L: ${net_pnl:.2f} ({pnl_points:+.2f} pts)")
-                            logging.info(f"Fees: ${total_fees:.2f}")
-                            logging.info(f"Total Fills: {len(trades)}")
-                            logging.info(f"="*80)
+                            logging.info(
+                                "%s\nTRADE CLOSED - %s - %s\nPosition: %s\nEntry Price: %s\nExit Price: %s\n"
+                                "Exit Order ID: %s\nStored SL Order ID: %s\nStored TP Order ID: %s\n"
+                                "Net P&L: $%.2f (%+.2f pts)\nFees: $%.2f\nTotal Fills: %d\n%s",
+                                _RULE80, exit_type, result_text, trade_position_type.upper(), entry_price, exit_price,
+                                exit_trade_order_id, stop_loss_order_id, take_profit_order_id,
+                                net_pnl, pnl_points, total_fees, len(trades), _RULE80
+                            )
                             
                             # Get updated balance
                             balance = get_account_balance(TOPSTEP_CONFIG['account_id'], TOPSTEP_CONFIG, ENABLE_TRADING, AUTH_TOKEN)
@@ -8443,10 +9188,10 @@ def run_trade_monitor():
                             if balance is not None:
                                 telegram_msg += f"💰 Balance: ${balance:,.2f}\n"
                             
-                            telegram_msg += f"Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                            telegram_msg += f"Time: {time.strftime(_TIMESTAMP_FORMAT)}"
                             
-                            send_telegram_message(telegram_msg, TELEGRAM_CONFIG)
-                            logging.info(f"Telegram notification sent for {exit_type}")
+                            queue_telegram_message(telegram_msg, TELEGRAM_CONFIG)
+                            logging.info(f"Telegram notification queued for {exit_type}")
                             
                             # Clear active trade info
                             clear_active_trade_info()
@@ -8644,8 +9389,7 @@ def manual_reconcile_trades():
             'save_folder': SAVE_FOLDER,
             'enable_save_screenshots': ENABLE_SAVE_SCREENSHOTS
         }
-        reconcile_closed_trades(TOPSTEP_CONFIG, ENABLE_TRADING, AUTH_TOKEN, TELEGRAM_CONFIG, screenshot_config)
-        reconcile_supabase_open_trades(TOPSTEP_CONFIG, ENABLE_TRADING, AUTH_TOKEN, TELEGRAM_CONFIG, screenshot_config)
+        reconcile_all(TOPSTEP_CONFIG, ENABLE_TRADING, AUTH_TOKEN, TELEGRAM_CONFIG, screenshot_config)
         logging.info("=== MANUAL RECONCILIATION COMPLETE ===")
     except Exception as e:
         logging.error(f"Error during manual reconciliation: {e}")
@@ -8807,7 +9551,9 @@ def reload_config():
             'max_profit_per_contract': config.get('Topstep', 'max_profit_per_contract', fallback=''),
             'enable_stop_loss': config.getboolean('Topstep', 'enable_stop_loss', fallback=True),
             'enable_take_profit': config.getboolean('Topstep', 'enable_take_profit', fallback=True),
-            'tick_size': config.getfloat('Topstep', 'tick_size', fallback=0.25)
+            'tick_size': config.getfloat('Topstep', 'tick_size', fallback=0.25),
+            'use_batch_modify': config.getboolean('Topstep', 'use_batch_modify', fallback=False),
+            'keepalive_interval': config.getint('Topstep', 'keepalive_interval', fallback=25)
         })
         
         # Reload OpenAI settings
@@ -8832,6 +9578,16 @@ def reload_config():
             'market_closed': config.get('MarketHolidays', 'market_closed', fallback='')
         }
         
+        # Reload Economic Calendar settings
+        global ECONOMIC_CALENDAR_CONFIG
+        ECONOMIC_CALENDAR_CONFIG = {
+            'enabled': config.has_section('EconomicCalendar') and config.getboolean('EconomicCalendar', 'enable_economic_calendar', fallback=False),
+            'data_file': config.get('EconomicCalendar', 'data_file', fallback='market_data/economic_calendar.json'),
+            'minutes_before': config.getint('EconomicCalendar', 'minutes_before_event', fallback=15),
+            'minutes_after': config.getint('EconomicCalendar', 'minutes_after_event', fallback=15),
+            'severity_filter': tuple(s.strip() for s in config.get('EconomicCalendar', 'severity_threshold', fallback='High,Medium').split(','))
+        }
+        
         logging.info("Configuration reloaded successfully:")
         logging.info(f"  INTERVAL_MINUTES={INTERVAL_MINUTES}, INTERVAL_SECONDS={INTERVAL_SECONDS}")
         logging.info(f"  INTERVAL_SCHEDULE={INTERVAL_SCHEDULE or 'Not set (using interval_seconds)'}")
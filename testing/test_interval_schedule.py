@@ -0,0 +1,115 @@
+"""
+Test script for interval_schedule parsing.
+
+This script verifies that:
+1. The first matching range in config order wins when ranges overlap
+2. A catch-all disabled range still disables times outside the active hours
+3. Non-overlapping schedules report disabled/active periods and the next active time
+"""
+
+import sys
+import os
+import datetime
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from uploader_functions import load_functions
+
+SCHEDULE_NAMES = (
+    '_parse_hhmm', '_seconds_since_midnight', '_build_schedule', '_schedule_slot_at',
+    'get_next_active_interval', 'is_in_disabled_interval'
+)
+
+
+def load_schedule_at(hour, minute):
+    """Load the schedule helpers with datetime.now() fixed at hour:minute."""
+    class FixedDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 12, 1, hour, minute)
+
+    fixed_module = types.SimpleNamespace(
+        datetime=FixedDatetime, time=datetime.time, timedelta=datetime.timedelta, date=datetime.date
+    )
+    return load_functions(*SCHEDULE_NAMES, datetime=fixed_module)
+
+
+def check(label, actual, expected):
+    """Print one comparison and return whether it passed."""
+    passed = actual == expected
+    print(f"  {label}: {actual} (expected {expected}) - {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+def test_catch_all_disabled_range():
+    """Test that a catch-all =-1 range after the active hours disables everything outside them."""
+    print("=" * 80)
+    print("TEST 1: Catch-all Disabled Range (09:30-16:00=30,00:00-23:59=-1)")
+    print("=" * 80)
+
+    schedule = "09:30-16:00=30,00:00-23:59=-1"
+    results = []
+    for hour, minute, expected in [(8, 0, True), (10, 0, False), (16, 0, False), (20, 0, True)]:
+        ns = load_schedule_at(hour, minute)
+        in_disabled, next_active = ns['is_in_disabled_interval'](schedule)
+        results.append(check(f"{hour:02d}:{minute:02d} disabled", in_disabled, expected))
+        if expected:
+            results.append(check(f"{hour:02d}:{minute:02d} next active", next_active, datetime.time(9, 30)))
+    print()
+    return all(results)
+
+
+def test_first_match_wins():
+    """Test that overlapping ranges resolve to the first one listed, not the latest start."""
+    print("=" * 80)
+    print("TEST 2: First Matching Range Wins (00:00-23:59=-1 listed first)")
+    print("=" * 80)
+
+    schedule = "00:00-23:59=-1,09:30-16:00=30"
+    ns = load_schedule_at(10, 0)
+    in_disabled, _ = ns['is_in_disabled_interval'](schedule)
+    result = check("10:00 disabled", in_disabled, True)
+
+    slot = ns['_schedule_slot_at']("09:00-12:00=60,10:00-11:00=15", 10.5 * 3600)
+    result = check("10:30 interval", slot[2] if slot else None, 60) and result
+    print()
+    return result
+
+
+def test_non_overlapping_schedule():
+    """Test a regular schedule with disabled gaps between active periods."""
+    print("=" * 80)
+    print("TEST 3: Non-overlapping Schedule")
+    print("=" * 80)
+
+    schedule = "00:00-09:20=-1,09:32-15:45=45,15:46-23:59=-1"
+    results = []
+    for hour, minute, expected in [(9, 0, True), (12, 0, False), (17, 0, True)]:
+        ns = load_schedule_at(hour, minute)
+        in_disabled, _ = ns['is_in_disabled_interval'](schedule)
+        results.append(check(f"{hour:02d}:{minute:02d} disabled", in_disabled, expected))
+
+    # 09:25 falls between ranges - not in any slot, so not disabled
+    ns = load_schedule_at(9, 25)
+    results.append(check("09:25 (gap) disabled", ns['is_in_disabled_interval'](schedule)[0], False))
+    results.append(check("next active at 09:00", load_schedule_at(9, 0)['get_next_active_interval'](schedule), datetime.time(9, 32)))
+    print()
+    return all(results)
+
+
+def main():
+    """Run all tests."""
+    results = [
+        test_catch_all_disabled_range(),
+        test_first_match_wins(),
+        test_non_overlapping_schedule(),
+    ]
+    print("=" * 80)
+    print(f"SUMMARY: {sum(results)}/{len(results)} tests passed")
+    print("=" * 80)
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
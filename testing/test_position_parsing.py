@@ -0,0 +1,174 @@
+"""
+Test script for the TopstepX position/response parsing helpers.
+
+This script verifies that:
+1. _normalize_positions accepts list, {'positions'}, {'data'} and single-object responses
+2. _match_position / _iter_open_positions skip non-dict items and zero quantities
+3. Position type comes from the type code, falling back to the quantity sign
+4. _first keeps `or`-chain (first truthy value) semantics
+5. price_to_ticks and parse_llm_advice behave as expected
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from uploader_functions import load_functions
+
+ns = load_functions(
+    '_SYMBOL_KEYS', '_QUANTITY_KEYS', '_POSITION_TYPE_KEYS', '_AVERAGE_PRICE_KEYS', '_UNREALIZED_PNL_KEYS',
+    '_first', '_normalize_positions', '_iter_open_positions', '_match_position',
+    'price_to_ticks', 'parse_llm_json', '_LLM_HOLD_CACHE', 'parse_llm_advice'
+)
+
+CONTRACT_ID = "CON.F.US.EP.Z25"
+LONG_POSITION = {"contractId": CONTRACT_ID, "type": 1, "size": 2, "averagePrice": 6000.25}
+
+
+def check(label, actual, expected):
+    """Print one comparison and return whether it passed."""
+    passed = actual == expected
+    print(f"  {label}: {actual!r} (expected {expected!r}) - {'PASS' if passed else 'FAIL'}")
+    return passed
+
+
+def test_normalize_positions():
+    """Test every supported positions response shape."""
+    print("=" * 80)
+    print("TEST 1: Response Formats")
+    print("=" * 80)
+
+    normalize = ns['_normalize_positions']
+    results = [
+        check("list", normalize([LONG_POSITION]), [LONG_POSITION]),
+        check("{'positions': [...]}", normalize({"positions": [LONG_POSITION], "success": True}), [LONG_POSITION]),
+        check("{'data': [...]}", normalize({"data": [LONG_POSITION]}), [LONG_POSITION]),
+        check("single object", normalize(LONG_POSITION), [LONG_POSITION]),
+        check("empty positions", normalize({"positions": [], "success": True}), []),
+        check("unsupported type", normalize("error"), []),
+    ]
+    print()
+    return all(results)
+
+
+def test_match_position():
+    """Test symbol matching, non-dict items and the type-code / quantity-sign fallback."""
+    print("=" * 80)
+    print("TEST 2: Position Matching")
+    print("=" * 80)
+
+    match = ns['_match_position']
+    details = match(LONG_POSITION, "ES", CONTRACT_ID)
+    results = [
+        check("type 1 -> long", details['position_type'], 'long'),
+        check("size from 'size'", details['size'], 2),
+        check("average price", details['average_price'], 6000.25),
+        check("type 2 -> short", match({"symbol": "ES", "type": 2, "quantity": 1}, "ES", CONTRACT_ID)['position_type'], 'short'),
+        check("no type, qty +3 -> long", match({"symbol": "ES", "netQuantity": 3}, "ES", CONTRACT_ID)['position_type'], 'long'),
+        check("no type, qty -1 -> short", match({"symbol": "ES", "quantity": -1}, "ES", CONTRACT_ID)['position_type'], 'short'),
+        check("negative qty size", match({"symbol": "ES", "quantity": -1}, "ES", CONTRACT_ID)['size'], 1),
+        check("no type, qty 0 -> none", match({"symbol": "ES", "quantity": 0}, "ES", CONTRACT_ID)['position_type'], 'none'),
+        check("other contract", match({"contractId": "CON.F.US.NQ.Z25", "type": 1, "size": 1}, "ES", CONTRACT_ID), None),
+        check("no symbol", match({"type": 1, "size": 1}, "ES", CONTRACT_ID), None),
+        check("non-dict item", match("garbage", "ES", CONTRACT_ID), None),
+        check("None item", match(None, "ES", CONTRACT_ID), None),
+    ]
+    print()
+    return all(results)
+
+
+def test_iter_open_positions():
+    """Test the active-position scan used by check_active_trades."""
+    print("=" * 80)
+    print("TEST 3: Open Position Scan")
+    print("=" * 80)
+
+    iter_open = ns['_iter_open_positions']
+    mixed = ["garbage", None, {"symbol": "NQ", "quantity": 0}, {"contractId": CONTRACT_ID, "size": 2}, {"symbol": "YM", "size": 1}]
+    results = [
+        check("skips non-dicts and zero quantity", list(iter_open(mixed)), [(CONTRACT_ID, 2), ("YM", 1)]),
+        check("first open position", next(iter_open(mixed), None), (CONTRACT_ID, 2)),
+        check("all flat", next(iter_open([{"symbol": "ES", "quantity": 0}]), None), None),
+        check("missing symbol", list(iter_open([{"netQuantity": -1}])), [("Unknown", -1)]),
+    ]
+    print()
+    return all(results)
+
+
+def test_first():
+    """Test that _first returns the first truthy value like an `or` chain."""
+    print("=" * 80)
+    print("TEST 4: _first Semantics")
+    print("=" * 80)
+
+    first = ns['_first']
+    keys = ('quantity', 'size', 'netQuantity')
+    results = [
+        check("first key present", first({"quantity": 2, "size": 5}, keys, 0), 2),
+        check("falsy first key skipped", first({"quantity": 0, "size": 5}, keys, 0), 5),
+        check("None skipped", first({"quantity": None, "netQuantity": -3}, keys, 0), -3),
+        check("all falsy -> default", first({"quantity": 0, "size": 0}, keys, 0), 0),
+        check("missing -> default", first({}, keys, 'Unknown'), 'Unknown'),
+    ]
+    print()
+    return all(results)
+
+
+def test_price_to_ticks():
+    """Test tick conversion used for exact price comparisons."""
+    print("=" * 80)
+    print("TEST 5: price_to_ticks")
+    print("=" * 80)
+
+    to_ticks = ns['price_to_ticks']
+    results = [
+        check("6000.25 @ 0.25", to_ticks(6000.25), 24001),
+        check("string price", to_ticks("6000.50"), 24002),
+        check("float noise", to_ticks(0.1 + 0.2, 0.1), 3),
+        check("same tick", to_ticks(6000.2500000001) == to_ticks(6000.25), True),
+        check("different tick", to_ticks(6000.5) == to_ticks(6000.25), False),
+    ]
+    print()
+    return all(results)
+
+
+def test_parse_llm_advice():
+    """Test that only repeated 'hold' responses are reported as repeats."""
+    print("=" * 80)
+    print("TEST 6: parse_llm_advice")
+    print("=" * 80)
+
+    parse = ns['parse_llm_advice']
+    hold = '{"action": "hold", "reasoning": "chop"}'
+    buy = '{"action": "buy", "price_target": 6010, "stop_loss": 5995}'
+    results = [
+        check("first hold", parse(hold), ({"action": "hold", "reasoning": "chop"}, False)),
+        check("repeated hold", parse(hold)[1], True),
+        check("buy", parse(buy)[1], False),
+        check("buy repeated", parse(buy)[1], False),
+        check("hold after buy", parse(hold)[1], False),
+        check("different hold", parse('{"action": "HOLD"}')[1], False),
+    ]
+    print()
+    return all(results)
+
+
+def main():
+    """Run all tests."""
+    results = [
+        test_normalize_positions(),
+        test_match_position(),
+        test_iter_open_positions(),
+        test_first(),
+        test_price_to_ticks(),
+        test_parse_llm_advice(),
+    ]
+    print("=" * 80)
+    print(f"SUMMARY: {sum(results)}/{len(results)} tests passed")
+    print("=" * 80)
+    return all(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,61 @@
+"""
+Load individual helper functions from screenshot_uploader.py for testing.
+
+Importing screenshot_uploader runs the whole bot setup (Windows APIs, config,
+TopstepX login, background threads), so the test scripts instead compile just
+the named top-level functions and constants from its source into a namespace
+holding the standard modules those helpers use.
+"""
+
+import ast
+import datetime
+import functools
+import hashlib
+import json
+import logging
+import os
+import time
+
+UPLOADER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "screenshot_uploader.py")
+
+
+def _node_names(node):
+    """Return the names a top-level function or assignment node defines."""
+    if isinstance(node, ast.FunctionDef):
+        return {node.name}
+    if isinstance(node, ast.Assign):
+        return {target.id for target in node.targets if isinstance(target, ast.Name)}
+    return set()
+
+
+def load_functions(*names, **extra_globals):
+    """Compile the named top-level definitions from screenshot_uploader.py.
+
+    Args:
+        *names: Function or constant names, loaded in source order
+        **extra_globals: Additional or replacement globals (e.g. a fixed-clock datetime)
+
+    Returns:
+        dict: Namespace containing the loaded definitions
+    """
+    with open(UPLOADER_PATH, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=UPLOADER_PATH)
+
+    wanted = set(names)
+    body = [node for node in tree.body if _node_names(node) & wanted]
+    missing = wanted - set().union(*(_node_names(node) for node in body))
+    if missing:
+        raise NameError(f"Not found in screenshot_uploader.py: {', '.join(sorted(missing))}")
+
+    namespace = {
+        'datetime': datetime,
+        'functools': functools,
+        'hashlib': hashlib,
+        'json': json,
+        'logging': logging,
+        'time': time,
+        '_json_loads': json.loads,
+    }
+    namespace.update(extra_globals)
+    exec(compile(ast.Module(body=body, type_ignores=[]), UPLOADER_PATH, "exec"), namespace)
+    return namespace